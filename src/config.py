@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -13,6 +14,28 @@ class Settings(BaseSettings):
 
     # Data Export
     EXCEL_FILENAME: str = "stock_data.xlsx"
+    EXCEL_READ_ENGINE: str = "auto"        # 엑셀 읽기 엔진: auto(python-calamine 설치 시 calamine) | calamine | openpyxl
+    EXCEL_WRITE_ENGINE: str = "openpyxl"   # 엑셀 기록 방식: openpyxl(변경 시트만 교체) | streaming(write-only 순차 기록, 매번 전체 재기록)
+    DATASET_BACKEND: str = "excel"     # 정본 저장소: excel(엑셀 파일) | parquet(연도별 Parquet, pyarrow 필요) | sqlite | sharded(연도별 엑셀 파일)
+    DATASET_DIRNAME: str = "dataset"   # Parquet 데이터셋 디렉토리 (OUTPUT_DIR 하위)
+    SQLITE_FILENAME: str = "stock_data.db"  # SQLite 데이터셋 파일 (OUTPUT_DIR 하위)
+    SHARD_DIRNAME: str = "shards"      # 연도별 샤드 디렉토리 (OUTPUT_DIR 하위)
+    SHARD_MAX_WORKERS: int = 4         # 샤드 병렬 읽기/쓰기 프로세스 수
+    DATASET_LOCK_TIMEOUT: float = 300.0  # 데이터셋 파일 잠금 대기 시간 (초, 동시 실행 작업 간)
+    DATAFRAME_DTYPE_BACKEND: str = "auto"  # 메모리 데이터셋 dtype: auto(pyarrow 설치 시 Arrow) | pyarrow | numpy_nullable
+    CHANGE_FEED_ENABLED: bool = True   # 실행별 추가/변경 행 기록 (JSONL)
+    CHANGE_FEED_DIRNAME: str = "changes"  # 변경 피드 디렉토리 (OUTPUT_DIR 하위)
+
+    # Enrichment (시세 보강)
+    ENRICH_MAX_WORKERS: int = 4        # 보강 작업 스레드 수
+    KRX_MAX_CONCURRENCY: int = 2       # KRX 동시 요청 수 제한
+    RETURN_HORIZONS: List[int] = [1, 5, 20, 60]  # 상장 후 D+N 수익률 기간 (거래일)
+    MARKET_DATA_HEDGE_PERCENTILE: float = 90.0   # 헤지 요청 기준 지연 백분위수
+    MARKET_DATA_HEDGE_DEFAULT_DELAY: float = 1.0 # 통계 부족 시 헤지 대기 시간 (초)
+    MARKET_DATA_CACHE_SIZE: int = 2048           # 티커/시세 조회 결과 캐시 크기 (항목 수)
+    MARKET_DATA_NEGATIVE_TTL: float = 30.0       # 조회 실패(None) 결과 캐시 시간 (초, 일시 장애가 고정되지 않도록 짧게)
+    PENDING_ENRICHMENT_FILENAME: str = "pending_enrichment.json"  # 시세 보강 보류 큐 파일
+    PENDING_ENRICHMENT_MAX_ATTEMPTS: int = 5     # 보류 항목 최대 재시도 횟수
     
     # Google Drive Integration
     GOOGLE_CLIENT_SECRET_FILE: str = "secrets/client_secret.json"
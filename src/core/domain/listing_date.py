@@ -0,0 +1,68 @@
+"""
+상장일 파싱 (수집/엑셀/큐 등 파이프라인 공용)
+
+지원 형식:
+- 2024.11.26 / 2024-11-26 / 2024/11/26 (월/일 한 자리 허용, 뒤쪽 시각 문자열 무시)
+- 20241126
+- date / datetime / pandas.Timestamp
+"""
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Optional
+import numpy as np
+import pandas as pd
+
+
+_SEPARATED_PATTERN = re.compile(r"^\s*(\d{4})\s*[.\-/]\s*(\d{1,2})\s*[.\-/]\s*(\d{1,2})")
+_COMPACT_PATTERN = re.compile(r"^\s*(\d{4})(\d{2})(\d{2})(?:\D|$)")
+
+
+def parse_listing_date(value: Any) -> Optional[date]:
+    """
+    상장일 값을 date로 변환 (파싱 불가/결측이면 None)
+
+    문자열 파싱 결과는 캐시되어 같은 상장일이 반복되는 루프에서 재계산하지 않습니다.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return None if pd.isna(value) else value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, float) and value != value:  # NaN
+        return None
+    return _parse_text(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_text(text: str) -> Optional[date]:
+    match = _SEPARATED_PATTERN.match(text) or _COMPACT_PATTERN.match(text)
+    if not match:
+        return None
+    year, month, day = (int(part) for part in match.groups())
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_listing_dates(values: pd.Series) -> pd.Series:
+    """
+    상장일 Series를 datetime64 Series로 변환 (파싱 불가 값은 NaT, 인덱스 유지)
+
+    고유값만 파싱하여 같은 상장일이 많은 시트에서도 비용이 고유값 수에 비례합니다.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    # 마지막 원소(NaT)는 결측 코드(-1)가 가리키도록 덧붙임
+    lookup = np.array(
+        [_to_datetime64(parse_listing_date(v)) for v in uniques] + [np.datetime64('NaT', 'ns')],
+        dtype='datetime64[ns]'
+    )
+    return pd.Series(lookup[codes], index=values.index, name=values.name)
+
+
+def _to_datetime64(value: Optional[date]) -> np.datetime64:
+    if value is None:
+        return np.datetime64('NaT', 'ns')
+    return np.datetime64(value, 'ns')
@@ -1,8 +1,11 @@
 # src/domain/models.py
-from dataclasses import dataclass
-from typing import List, Tuple, Optional 
+import typing
+from array import array
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Union
+import numpy as np
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockInfo:
     """
     1차, 2차 크롤링을 통해 수집한 모든 세부 정보를 담는 데이터 클래스
@@ -30,14 +33,14 @@ class StockInfo:
 
     # 2차 수집: 공모청약일정 (Table 3)
     listing_date: str               # 상장일
-    competition_rate: str           # 기관경쟁률
-    emp_shares: int                 # 우리사주조합
+    competition_rate: float | None  # 기관경쟁률 (1234.56:1 -> 1234.56)
+    emp_shares: int | None          # 우리사주조합
     inst_shares: int | None         # 기관투자자
     retail_shares: int | None       # 일반청약자
 
     # 2차 수집: 주주현황 (Table 4)
-    tradable_shares_count: str      # 유통가능물량
-    tradable_shares_percent: str    # 유통가능물량지분율
+    tradable_shares_count: int | None       # 유통가능물량 (주)
+    tradable_shares_percent: float | None   # 유통가능물량지분율 (%)
     
     # 시세 정보 (Enrichment - FDR)
     open_price: int | None = None       # 시가 (상장일 기준)
@@ -47,6 +50,104 @@ class StockInfo:
     growth_rate: float | None = None    # 수익률 (%) = (종가/공모가-1)*100
 
 
+def _array_typecode(annotation) -> Optional[str]:
+    """필드 타입이 int / float (None 허용 포함)이면 array 타입 코드, 그 외 None"""
+    types = {arg for arg in typing.get_args(annotation) if arg is not type(None)} or {annotation}
+    if types == {int}:
+        return "q"
+    if types == {float}:
+        return "d"
+    return None
+
+
+class StockBatch:
+    """
+    StockInfo 필드를 컬럼(필드별 배열)으로 모으는 컨테이너
+
+    - int / float 필드는 array("q" / "d") + 결측 표시(bytearray)로 저장 (값당 8바이트, 객체 없음)
+    - 그 외 필드(문자열 등)는 리스트로 저장
+    - 타입 힌트와 다른 값(예: int 필드의 문자열)이 들어오면 해당 컬럼만 리스트로 전환
+    - 상세 수집 중 append로 쌓고, DataFrameMapper가 행 단위 dict 없이 컬럼 배열로 변환
+
+    반복/인덱싱 시에는 StockInfo를 다시 만들어 반환합니다 (로그/보류 큐 등 행 단위 처리용).
+    """
+
+    FIELDS: Tuple[str, ...] = tuple(field.name for field in fields(StockInfo))
+    TYPECODES: Dict[str, Optional[str]] = {field.name: _array_typecode(field.type) for field in fields(StockInfo)}
+
+    __slots__ = ("_columns", "_missing", "_size")
+
+    def __init__(self, stocks: Iterable[StockInfo] = ()):
+        self._columns: Dict[str, Union[array, list]] = {
+            name: array(code) if code else [] for name, code in self.TYPECODES.items()
+        }
+        self._missing: Dict[str, bytearray] = {name: bytearray() for name, code in self.TYPECODES.items() if code}
+        self._size = 0
+        self.extend(stocks)
+
+    def append(self, stock: StockInfo) -> None:
+        for name, column in self._columns.items():
+            value = getattr(stock, name)
+            missing = self._missing.get(name)
+            if missing is None:
+                column.append(value)
+            elif value is None:
+                column.append(0)
+                missing.append(1)
+            else:
+                try:
+                    column.append(value)
+                    missing.append(0)
+                except (TypeError, OverflowError):
+                    self._to_list(name).append(value)
+        self._size += 1
+
+    def extend(self, stocks: Iterable[StockInfo]) -> None:
+        for stock in stocks:
+            self.append(stock)
+
+    def column(self, name: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        필드 값 배열 (사본)
+
+        Returns:
+            (값 배열, 결측 마스크) - 숫자 배열이면 int64/float64 + bool 마스크, 그 외 object 배열 + None
+        """
+        column = self._columns[name]
+        missing = self._missing.get(name)
+        if missing is None:
+            values = np.empty(len(column), dtype=object)
+            values[:] = column
+            return values, None
+        dtype = "int64" if column.typecode == "q" else "float64"
+        return np.array(column, dtype=dtype), np.frombuffer(bytes(missing), dtype=np.uint8).astype(bool)
+
+    def _to_list(self, name: str) -> list:
+        """숫자 배열 컬럼을 리스트로 전환 (타입 힌트와 다른 값 수용)"""
+        missing = self._missing.pop(name)
+        column = [None if flag else value for value, flag in zip(self._columns[name], missing)]
+        self._columns[name] = column
+        return column
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> StockInfo:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        values = {}
+        for name, column in self._columns.items():
+            missing = self._missing.get(name)
+            values[name] = None if missing is not None and missing[index] else column[index]
+        return StockInfo(**values)
+
+    def __iter__(self) -> Iterator[StockInfo]:
+        for index in range(self._size):
+            yield self[index]
+
+
 @dataclass(frozen=True)
 class ScrapeReport:
     """
@@ -54,4 +155,16 @@ class ScrapeReport:
     """
     final_stock_count: int      
     spack_filtered_count: int   
-    results: List[Tuple[str, str]] # (종목명, href)
\ No newline at end of file
+    results: List[Tuple[str, str]] # (종목명, href)
+
+
+@dataclass(frozen=True)
+class PendingEnrichment:
+    """
+    시세 보강이 보류된 종목 (상장 예정 / 장 마감 전)
+    """
+    name: str                           # 종목명
+    listing_date: str                   # 상장일 (수집 원문)
+    confirmed_price: int | None = None  # 확정공모가 (수익률 계산용)
+    ticker: str | None = None           # 티커 (상장 전에는 미확정)
+    attempts: int = 0                   # 보강 시도 횟수
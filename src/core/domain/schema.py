@@ -0,0 +1,129 @@
+"""
+데이터셋 컬럼 스키마 (매퍼/로더/저장소/보강 서비스 공용)
+
+컬럼 이름, 원천 필드(StockInfo), 값 종류, 결측 허용 여부, 키 여부를 한 곳에서 정의합니다.
+값 종류(kind)는 저장 형식과 무관한 논리 타입이며, pandas dtype 변환은 어댑터가 담당합니다.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+import pandas as pd
+
+
+COLUMN_KINDS = ("text", "category", "integer", "float")
+
+
+@dataclass(frozen=True)
+class Column:
+    """데이터셋 컬럼 정의"""
+    name: str                           # 한글 컬럼명 (엑셀 헤더)
+    field: Optional[str]                # StockInfo 필드명 (수집 데이터가 아니면 None)
+    kind: str                           # 값 종류: text | category | integer | float
+    nullable: bool = True               # 결측 허용 여부
+    key: bool = False                   # 종목 식별 키 여부
+    aliases: Tuple[str, ...] = ()       # 과거 파일에서 쓰인 이름 (로드 시 통합)
+
+
+NAME_COLUMN = "종목명"
+LISTING_DATE_COLUMN = "상장일"
+CONFIRMED_PRICE_COLUMN = "확정공모가"
+OHLC_COLUMNS = ("시가", "고가", "저가", "종가")
+GROWTH_COLUMN = "수익률(%)"
+
+COLUMNS: Tuple[Column, ...] = (
+    Column(NAME_COLUMN, "name", "text", nullable=False, key=True),
+    Column("시장구분", "market_segment", "category"),
+    Column("업종", "sector", "category"),
+    Column("매출액(백만원)", "revenue", "integer"),
+    Column("법인세비용차감전(백만원)", "profit_pre_tax", "integer"),
+    Column("순이익(백만원)", "net_profit", "integer"),
+    Column("자본금(백만원)", "capital", "integer"),
+    Column("총공모주식수", "total_shares", "integer"),
+    Column("액면가", "par_value", "integer"),
+    Column("희망공모가액", "desired_price_range", "text"),   # "10,000~12,000" 범위 원문
+    Column(CONFIRMED_PRICE_COLUMN, "confirmed_price", "integer"),
+    Column("공모금액(백만원)", "offering_amount", "integer"),
+    Column("주간사", "underwriter", "category"),
+    Column(LISTING_DATE_COLUMN, "listing_date", "text", key=True),  # 미정이면 결측
+    Column("기관경쟁률", "competition_rate", "float"),      # 1234.56:1 -> 1234.56
+    Column("우리사주조합", "emp_shares", "integer"),
+    Column("기관투자자", "inst_shares", "integer"),
+    Column("일반청약자", "retail_shares", "integer"),
+    Column("유통가능물량(주)", "tradable_shares_count", "integer"),
+    Column("유통가능물량(%)", "tradable_shares_percent", "float"),
+    # 시세 정보 (상장일 기준)
+    Column("시가", "open_price", "integer"),
+    Column("고가", "high_price", "integer"),
+    Column("저가", "low_price", "integer"),
+    Column("종가", "close_price", "integer"),
+    Column(GROWTH_COLUMN, "growth_rate", "float", aliases=("수익률",)),
+)
+
+COLUMNS_BY_NAME: Dict[str, Column] = {column.name: column for column in COLUMNS}
+KEY_COLUMNS: Tuple[str, ...] = tuple(column.name for column in COLUMNS if column.key)
+
+# StockInfo 필드명 -> 컬럼명 (정의 순서 = 엑셀 컬럼 순서)
+FIELD_TO_COLUMN: Dict[str, str] = {column.field: column.name for column in COLUMNS if column.field}
+
+# 과거 컬럼명 -> 현재 컬럼명
+LEGACY_COLUMN_NAMES: Dict[str, str] = {
+    alias: column.name for column in COLUMNS for alias in column.aliases
+}
+
+# 상장 후 기간별 컬럼 (지표 -> 한글 컬럼명 포맷, 값 종류)
+# 기간(N)은 설정(RETURN_HORIZONS)에 따라 달라지므로 horizon_columns()로 생성합니다.
+HORIZON_COLUMN_FORMATS: Dict[str, str] = {
+    "close": "D+{n} 종가",
+    "return": "D+{n} 수익률(%)",
+}
+HORIZON_COLUMN_KINDS: Dict[str, str] = {
+    "close": "integer",
+    "return": "float",
+}
+
+
+def horizon_column_name(metric: str, horizon: int) -> str:
+    """D+N 컬럼명 (metric: close | return)"""
+    return HORIZON_COLUMN_FORMATS[metric].format(n=int(horizon))
+
+
+def horizon_columns(horizons: Iterable[int]) -> Tuple[Column, ...]:
+    """
+    기간별 D+N 종가/수익률 컬럼 정의 (기간 순서, 기간마다 종가 -> 수익률)
+
+    예: (1, 5) -> D+1 종가, D+1 수익률(%), D+5 종가, D+5 수익률(%)
+    """
+    ordered = sorted({int(h) for h in horizons if int(h) > 0})
+    return tuple(
+        Column(horizon_column_name(metric, n), None, kind)
+        for n in ordered
+        for metric, kind in HORIZON_COLUMN_KINDS.items()
+    )
+
+
+def columns_of(kind: str, horizons: Iterable[int] = ()) -> Tuple[str, ...]:
+    """
+    값 종류별 컬럼명 목록 (정의 순서)
+
+    horizons를 지정하면 해당 기간의 D+N 컬럼을 기본 컬럼 뒤에 포함합니다.
+    """
+    if kind not in COLUMN_KINDS:
+        raise ValueError(f"알 수 없는 컬럼 종류입니다: {kind}")
+    return tuple(column.name for column in COLUMNS + horizon_columns(horizons) if column.kind == kind)
+
+
+def migrate_legacy_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    과거 컬럼명을 현재 컬럼명으로 통합 (df를 직접 변경하고 반환)
+
+    예: 보강 서비스가 만들던 "수익률" 컬럼 -> "수익률(%)"
+    두 컬럼이 모두 있으면 현재 컬럼 값을 우선하고 빈 칸만 과거 컬럼 값으로 채운 뒤 과거 컬럼을 삭제합니다.
+    """
+    for legacy, current in LEGACY_COLUMN_NAMES.items():
+        if legacy not in df.columns:
+            continue
+        if current in df.columns:
+            df[current] = df[current].where(df[current].notna(), df[legacy])
+            df.drop(columns=legacy, inplace=True)
+        else:
+            df.rename(columns={legacy: current}, inplace=True)
+    return df
@@ -2,9 +2,9 @@
 데이터 처리 관련 포트 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Dict, Iterable, List, Optional, Union
 import pandas as pd
-from core.domain.models import StockInfo
+from core.domain.models import StockBatch, StockInfo
 
 
 class DataMapperPort(ABC):
@@ -15,8 +15,19 @@ class DataMapperPort(ABC):
     """
     
     @abstractmethod
-    def to_dataframe(self, stocks: List[StockInfo]) -> pd.DataFrame:
-        """StockInfo 리스트를 DataFrame으로 변환"""
+    def to_dataframe(self, stocks: Union[List[StockInfo], StockBatch]) -> pd.DataFrame:
+        """StockInfo 리스트(또는 StockBatch)를 DataFrame으로 변환"""
+        pass
+
+    @abstractmethod
+    def add_horizon_columns(self, df: pd.DataFrame, horizon_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        상장 후 기간별(D+N) 종가/수익률 컬럼을 DataFrame에 추가
+
+        Args:
+            df: 대상 DataFrame
+            horizon_frame: df와 같은 인덱스, 컬럼 close_d{N} / return_d{N}
+        """
         pass
 
 
@@ -31,3 +42,36 @@ class DataExporterPort(ABC):
     def export(self, data: Dict[int, pd.DataFrame]) -> None:
         """연도별 데이터를 저장"""
         pass
+
+
+class DatasetStorePort(DataExporterPort):
+    """
+    데이터셋 저장소 포트
+
+    책임: 연도별 데이터의 정본(canonical) 저장 및 로드
+    (export는 기존 데이터와 병합하여 저장)
+    """
+
+    @abstractmethod
+    def load(self, years: Optional[Iterable[int]] = None) -> Dict[int, pd.DataFrame]:
+        """연도별 데이터 로드 (years 미지정 시 전체)"""
+        pass
+
+
+class ChangeFeedPort(ABC):
+    """
+    변경 피드 포트
+
+    책임: 저장 시 추가/변경된 행 기록 (다운스트림이 전체 데이터 대신 변경분만 처리하도록)
+    """
+
+    @abstractmethod
+    def append(self, year: int, changes: List[Dict]) -> None:
+        """
+        연도별 변경 레코드 추가
+
+        Args:
+            year: 연도
+            changes: {"op": "insert" | "update", "key": {...}, "after" | "changes": {...}} 목록
+        """
+        pass
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from datetime import date
+import pandas as pd
+from core.domain.models import PendingEnrichment
 
 class TickerMapperPort(ABC):
     """종목명으로 티커(종목코드)를 조회하는 포트"""
@@ -18,3 +20,31 @@ class MarketDataProviderPort(ABC):
             {"Open": 1000, "High": 1100, "Low": 900, "Close": 1050}
         """
         pass
+
+class PriceHistoryProviderPort(ABC):
+    """기간 시세(OHLCV) 데이터를 조회하는 포트"""
+    @abstractmethod
+    def get_ohlcv_range(self, ticker: str, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+        """
+        기간(시작일~종료일) 일별 OHLCV 데이터를 한 번에 조회
+        Returns:
+            DatetimeIndex(거래일 오름차순), 컬럼: Open, High, Low, Close, Volume
+        """
+        pass
+
+class PendingEnrichmentQueuePort(ABC):
+    """시세 보강 보류 종목을 영속화하는 큐 포트"""
+    @abstractmethod
+    def enqueue(self, items: List[PendingEnrichment]) -> None:
+        """보류 종목 추가 (종목명+상장일 기준 중복 시 갱신)"""
+        pass
+
+    @abstractmethod
+    def due(self, as_of: date) -> List[PendingEnrichment]:
+        """상장일이 as_of 이전인(보강 가능한) 항목 조회"""
+        pass
+
+    @abstractmethod
+    def remove(self, items: List[PendingEnrichment]) -> None:
+        """처리 완료 항목 제거"""
+        pass
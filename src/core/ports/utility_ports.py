@@ -3,7 +3,7 @@
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from typing import Dict
 
 
@@ -50,3 +50,36 @@ class LoggerPort(ABC):
     def error(self, message: str) -> None:
         """에러 로그"""
         pass
+
+
+class TradingCalendarPort(ABC):
+    """
+    거래일 캘린더 포트
+    
+    책임: 거래일/장 마감 시각 판단 (네트워크 호출 없음)
+    """
+    
+    @abstractmethod
+    def is_trading_day(self, target_date: date) -> bool:
+        """거래일 여부 (주말/휴장일 제외)"""
+        pass
+    
+    @abstractmethod
+    def next_session(self, target_date: date) -> date:
+        """target_date 당일 또는 이후 첫 거래일"""
+        pass
+    
+    @abstractmethod
+    def session_close(self, target_date: date) -> datetime:
+        """해당 거래일의 장 마감 시각"""
+        pass
+    
+    @abstractmethod
+    def is_session_closed(self, target_date: date, now: datetime) -> bool:
+        """해당 날짜의 거래 세션이 now 기준으로 마감되었는지 여부"""
+        pass
+    
+    @abstractmethod
+    def last_closed_session(self, now: datetime) -> date:
+        """now 기준 마지막으로 마감된 거래일"""
+        pass
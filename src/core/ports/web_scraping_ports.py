@@ -4,7 +4,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Tuple
 from playwright.sync_api import Page
-from core.domain.models import ScrapeReport, StockInfo
+from core.domain.models import ScrapeReport, StockBatch
 
 
 class PageProvider(ABC):
@@ -63,6 +63,6 @@ class DetailScraperPort(ABC):
         self,
         page: Page,
         stocks: List[Tuple[str, str]]
-    ) -> List[StockInfo]:
-        """종목 상세 정보 추출"""
+    ) -> StockBatch:
+        """종목 상세 정보 추출 (StockInfo 컬럼 배치, 반복 시 StockInfo)"""
         pass
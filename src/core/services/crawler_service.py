@@ -1,14 +1,18 @@
 """
 크롤링 비즈니스 로직 서비스
 """
+from dataclasses import replace
 from datetime import date, datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 
 from core.ports.web_scraping_ports import PageProvider, CalendarScraperPort, DetailScraperPort
 from core.ports.data_ports import DataMapperPort, DataExporterPort
-from core.ports.utility_ports import DateRangeCalculatorPort, LoggerPort
-from core.domain.models import StockInfo
+from core.ports.utility_ports import DateRangeCalculatorPort, LoggerPort, TradingCalendarPort
+from core.ports.enrichment_ports import PendingEnrichmentQueuePort
+from core.domain.models import PendingEnrichment, StockBatch, StockInfo
+from core.domain.listing_date import parse_listing_date
+from core.domain.schema import GROWTH_COLUMN, LISTING_DATE_COLUMN, NAME_COLUMN, OHLC_COLUMNS
 from core.services.stock_price_enricher import StockPriceEnricher
 
 
@@ -21,6 +25,9 @@ class CrawlerService:
     - 비즈니스 로직만 포함
     - 모든 의존성을 명시적으로 주입받음
     """
+
+    # 보류 큐 보강 결과 컬럼 (DataFrameMapper 컬럼명과 동일)
+    PENDING_RESULT_COLUMNS = [NAME_COLUMN, LISTING_DATE_COLUMN, *OHLC_COLUMNS, GROWTH_COLUMN]
     
     def __init__(
         self,
@@ -31,7 +38,10 @@ class CrawlerService:
         data_exporter: DataExporterPort,
         date_calculator: DateRangeCalculatorPort,
         stock_enricher: StockPriceEnricher,
-        logger: LoggerPort
+        logger: LoggerPort,
+        trading_calendar: Optional[TradingCalendarPort] = None,
+        pending_queue: Optional[PendingEnrichmentQueuePort] = None,
+        max_pending_attempts: int = 5
     ):
         # 모든 의존성을 생성자에서 받음 (명시적)
         self.page_provider = page_provider
@@ -42,6 +52,9 @@ class CrawlerService:
         self.date_calculator = date_calculator
         self.stock_enricher = stock_enricher
         self.logger = logger
+        self.trading_calendar = trading_calendar
+        self.pending_queue = pending_queue
+        self.max_pending_attempts = max_pending_attempts
     
     def run(self, start_year: int) -> Dict[int, pd.DataFrame]:
         """
@@ -89,11 +102,11 @@ class CrawlerService:
                 stocks=report.results
             )
             
-            # 3-2-1. 데이터 보강 (OHLC)
-            enriched_details = [
-                self.stock_enricher.enrich_stock_info(stock) 
+            # 3-2-1. 데이터 보강 (OHLC) - 컬럼 배치에 누적
+            enriched_details = StockBatch(
+                self.stock_enricher.enrich_stock_info(stock)
                 for stock in stock_details
-            ]
+            )
             
             # 3-3. DataFrame 변환
             df = self.data_mapper.to_dataframe(enriched_details)
@@ -125,13 +138,16 @@ class CrawlerService:
         
         self.logger.info(f"[스케줄 크롤링] {start_date} ~ {days_ahead}일 후까지 수집 시작")
         
+        # 보류 큐에서 보강 가능해진 종목 처리 (브라우저 작업 없음)
+        yearly_data, drained, retried = self._collect_pending(datetime.now())
+        deferred: List[PendingEnrichment] = []
+
         # Page 객체 준비
         page = self.page_provider.get_page()
         
         # 수집할 날짜 리스트 생성
         target_dates = [start_date + timedelta(days=i) for i in range(days_ahead + 1)]
         
-        yearly_data: Dict[int, pd.DataFrame] = {}
         total_collected = 0
         
         for target_date in target_dates:
@@ -164,31 +180,30 @@ class CrawlerService:
             )
             
             # 데이터 보강 (조건부 OHLC)
-            enriched_details = []
+            enriched_details = StockBatch()
             now = datetime.now()
             today = date.today()
             
+            # OHLC 수집 조건 판단 (거래일 캘린더 기준, 네트워크 호출 없음)
+            should_enrich = self._is_session_closed(target_date, now)
+            
             for stock in stock_details:
-                # OHLC 수집 조건 판단
-                should_enrich = False
-                
-                # 1. 과거 날짜: 무조건 수집
-                if target_date < today:
-                    should_enrich = True
-                # 2. 오늘: 15:30 이후에만 수집
-                elif target_date == today:
-                    # 15시 30분 이후인지 확인
-                    if now.hour > 15 or (now.hour == 15 and now.minute >= 30):
-                        should_enrich = True
+                if not should_enrich:
+                    if target_date > today:
+                        self.logger.info(f"      📅 미래 상장 예정이므로 OHLC 수집 생략: {stock.name}")
+                    elif target_date == today:
+                        self.logger.info(f"      ⏳ 장 마감 전이므로 OHLC 수집 생략: {stock.name}")
                     else:
-                        self.logger.info(f"      ⏳ 장 마감 전(15:30 이전)이므로 OHLC 수집 생략: {stock.name}")
-                # 3. 미래: 수집 안 함 (기본값 False)
-                else:
-                    self.logger.info(f"      📅 미래 상장 예정이므로 OHLC 수집 생략: {stock.name}")
+                        self.logger.info(f"      🛑 휴장일이므로 OHLC 수집 생략: {stock.name}")
                 
                 if should_enrich:
-                    enriched_details.append(self.stock_enricher.enrich_stock_info(stock))
+                    enriched = self.stock_enricher.enrich_stock_info(stock)
+                    if enriched.close_price is None:
+                        # 티커 미등록 등으로 실패한 종목은 다음 실행에서 재시도
+                        deferred.append(self._to_pending(stock))
+                    enriched_details.append(enriched)
                 else:
+                    deferred.append(self._to_pending(stock))
                     enriched_details.append(stock)
             
             # DataFrame 변환
@@ -210,5 +225,137 @@ class CrawlerService:
             self.logger.info(f"총 {total_collected}건 저장 완료")
         else:
             self.logger.info("수집된 데이터 없음")
+
+        # 저장 성공 후 보류 큐 갱신 (처리 완료 제거, 신규 보류 추가)
+        self._commit_pending(drained, retried + deferred)
             
         return yearly_data
+
+    def drain_pending_enrichment(self, now: Optional[datetime] = None) -> Dict[int, pd.DataFrame]:
+        """
+        보류 큐에서 보강 가능해진 종목만 일괄 조회하여 저장 (브라우저/전체 파일 스캔 없음)
+
+        Returns:
+            연도별 보강 결과 DataFrame (종목명, 상장일, OHLC, 수익률)
+        """
+        yearly_data, drained, retried = self._collect_pending(now or datetime.now())
+        if yearly_data:
+            self.data_exporter.export(yearly_data)
+            self.logger.info(f"[보류 큐] {sum(len(df) for df in yearly_data.values())}건 보강 저장 완료")
+        self._commit_pending(drained, retried)
+        return yearly_data
+
+    def _collect_pending(
+        self, now: datetime
+    ) -> Tuple[Dict[int, pd.DataFrame], List[PendingEnrichment], List[PendingEnrichment]]:
+        """
+        보강 가능(상장일 장 마감)해진 보류 항목의 시세 일괄 조회
+
+        Returns:
+            (연도별 보강 결과, 큐에서 제거할 항목, 재시도할 항목)
+        """
+        if self.pending_queue is None:
+            return {}, [], []
+
+        items = self.pending_queue.due(self._last_closed_session(now))
+        if not items:
+            return {}, [], []
+        self.logger.info(f"[보류 큐] 보강 대상 {len(items)}건 일괄 조회")
+
+        # 1. 티커 일괄 조회 (상장 전 보류되어 티커가 없는 항목만)
+        tickers = self.stock_enricher.resolve_tickers(i.name for i in items if not i.ticker)
+
+        # 2. 거래일 보정 후 (티커, 거래일) 쌍의 OHLC 일괄 조회
+        targets: List[Tuple[PendingEnrichment, Optional[str], Optional[date], Optional[date]]] = []
+        for item in items:
+            ticker = item.ticker or tickers.get(item.name)
+            listing_date = parse_listing_date(item.listing_date)
+            session = self.stock_enricher.resolve_session(listing_date, now) if listing_date else None
+            targets.append((replace(item, ticker=ticker), ticker, listing_date, session))
+
+        ohlc_frame = self.stock_enricher.fetch_ohlc_frame(
+            (ticker, session) for _, ticker, _, session in targets if ticker and session
+        )
+        ohlc_lookup = {
+            (row.ticker, row.listing_date): row
+            for row in ohlc_frame.itertuples(index=False)
+        }
+
+        # 3. 결과 분류 (성공 / 재시도 / 재시도 한도 초과)
+        records, drained, retried = [], [], []
+        for item, ticker, listing_date, session in targets:
+            ohlc = ohlc_lookup.get((ticker, session))
+            if ohlc is not None:
+                records.append({
+                    '종목명': item.name, '상장일': item.listing_date,
+                    '시가': ohlc.시가, '고가': ohlc.고가, '저가': ohlc.저가, '종가': ohlc.종가,
+                    # 연도 시트는 거래일이 아닌 상장일 기준 (연말 휴장일 상장 종목의 다음 해 중복 방지)
+                    'confirmed_price': item.confirmed_price, 'year': listing_date.year,
+                })
+                drained.append(item)
+            elif item.attempts + 1 >= self.max_pending_attempts:
+                self.logger.warning(f"[보류 큐] 재시도 한도 초과로 제외: {item.name} ({item.listing_date})")
+                drained.append(item)
+            else:
+                retried.append(replace(item, attempts=item.attempts + 1))
+
+        if not records:
+            self.logger.info(f"[보류 큐] 조회된 시세 없음 (재시도 {len(retried)}건)")
+            return {}, drained, retried
+
+        # 4. 수익률 계산 후 연도별 분할
+        result = pd.DataFrame(records)
+        result[GROWTH_COLUMN] = self.stock_enricher.calculate_growth_rates(
+            result['종가'], result['confirmed_price']
+        )
+        for col in OHLC_COLUMNS:
+            result[col] = result[col].astype('Int64')
+
+        yearly_data = {
+            int(year): group[self.PENDING_RESULT_COLUMNS].reset_index(drop=True)
+            for year, group in result.groupby('year')
+        }
+        self.logger.info(f"[보류 큐] {len(records)}건 시세 확보 (재시도 {len(retried)}건)")
+        return yearly_data, drained, retried
+
+    def _commit_pending(self, drained: List[PendingEnrichment], pending: List[PendingEnrichment]) -> None:
+        """보류 큐 반영 (저장 완료 이후 호출)"""
+        if self.pending_queue is None:
+            return
+        # 상장일을 알 수 없는 종목은 보강 시점을 판단할 수 없으므로 제외
+        pending = [item for item in pending if parse_listing_date(item.listing_date)]
+        self.pending_queue.remove(drained)
+        self.pending_queue.enqueue(pending)
+        if pending:
+            self.logger.info(f"[보류 큐] {len(pending)}건 보강 보류 (다음 실행 시 재시도)")
+
+    def _last_closed_session(self, now: datetime) -> date:
+        """마지막으로 장이 마감된 거래일 (캘린더가 없으면 15:30 기준)"""
+        if self.trading_calendar:
+            return self.trading_calendar.last_closed_session(now)
+        if self._is_session_closed(now.date(), now):
+            return now.date()
+        return now.date() - timedelta(days=1)
+
+    @staticmethod
+    def _to_pending(stock: StockInfo) -> PendingEnrichment:
+        return PendingEnrichment(
+            name=stock.name,
+            listing_date=stock.listing_date,
+            confirmed_price=stock.confirmed_price,
+        )
+
+    def _is_session_closed(self, target_date: date, now: datetime) -> bool:
+        """
+        target_date 세션의 장 마감 여부
+
+        거래일 캘린더가 있으면 휴장일/장 마감 시각을 반영하고,
+        없으면 과거 날짜 또는 당일 15:30 이후를 마감으로 간주합니다.
+        """
+        if self.trading_calendar:
+            return self.trading_calendar.is_session_closed(target_date, now)
+        if target_date < now.date():
+            return True
+        if target_date == now.date():
+            return now.hour > 15 or (now.hour == 15 and now.minute >= 30)
+        return False
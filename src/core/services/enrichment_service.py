@@ -1,80 +1,254 @@
-from typing import Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Dict, Optional
 import pandas as pd
+from core.domain.listing_date import parse_listing_dates
+from core.domain.schema import GROWTH_COLUMN, OHLC_COLUMNS, migrate_legacy_columns
 from core.services.stock_price_enricher import StockPriceEnricher
-from core.ports.utility_ports import LoggerPort
-from core.ports.data_ports import DataExporterPort
+from core.services.post_ipo_return_engine import PostIpoReturnEngine
+from core.ports.utility_ports import LoggerPort, TradingCalendarPort
+from core.ports.data_ports import DataExporterPort, DataMapperPort
 
 class EnrichmentService:
     """
     수집된 데이터에 추가 정보(시세, 성장률)를 보강하는 서비스
     """
+
+    OHLC_COLUMNS = list(OHLC_COLUMNS)
+    GROWTH_COLUMN = GROWTH_COLUMN
+    MARKET_CLOSE = dt_time(15, 30)
+
     def __init__(
         self,
         stock_enricher: StockPriceEnricher,
         data_exporter: DataExporterPort,
-        logger: LoggerPort
+        logger: LoggerPort,
+        max_workers: int = 1,
+        return_engine: Optional[PostIpoReturnEngine] = None,
+        data_mapper: Optional[DataMapperPort] = None,
+        trading_calendar: Optional[TradingCalendarPort] = None
     ):
         self.stock_enricher = stock_enricher
         self.data_exporter = data_exporter
         self.logger = logger
+        self.max_workers = max(1, max_workers)
+        # 기간별(D+N) 수익률: 엔진과 매퍼가 모두 주입된 경우에만 계산
+        self.return_engine = return_engine if data_mapper is not None else None
+        self.data_mapper = data_mapper
+        self.trading_calendar = trading_calendar
 
-    def enrich_data(self, yearly_data: Dict[int, pd.DataFrame]) -> None:
+    def enrich_data(
+        self,
+        yearly_data: Dict[int, pd.DataFrame],
+        incremental: bool = False,
+        as_of: Optional[datetime] = None
+    ) -> None:
         """
         데이터 보강 및 재저장
+
+        흐름 (컬럼 단위 처리):
+        1. 전체 연도의 고유 종목명 -> 티커 일괄 조회
+        2. 고유 (티커, 상장일) 쌍의 OHLC 일괄 조회 (스레드 풀)
+        3. 연도별 시트에 OHLC 프레임 병합 및 수익률 벡터 연산
+
+        return_engine이 설정된 경우 2단계에서 종목당 기간 시세를 1회 조회하여
+        상장일 OHLC와 D+N 종가/수익률을 함께 계산합니다.
+
+        Args:
+            yearly_data: {연도: DataFrame}
+            incremental: True이면 종가가 비어 있고 상장일이 마지막 마감 세션 이전인
+                         행만 보강 (나머지 행은 그대로 유지)
+            as_of: 증분 모드 기준 시각 (기본값: 현재 시각)
         """
         self.logger.info("=" * 60)
-        self.logger.info("📈 데이터 보강 작업 시작 (OHLC, 성장률)")
-        
-        enriched_data = {}
-        total_enriched = 0
-        
+        mode = "증분" if incremental else "전체"
+        self.logger.info(f"📈 데이터 보강 작업 시작 (OHLC, 성장률 / {mode} / 동시 작업 {self.max_workers}개)")
+
+        started_at = time.perf_counter()
+        now = as_of or datetime.now()
+        last_session = self._last_closed_session(now) if incremental else None
+
+        # 0. 연도별 키 컬럼 준비 (종목명, 상장일, 공모가)
+        keys: Dict[int, pd.DataFrame] = {}
         for year, df in yearly_data.items():
+            # 과거 "수익률" 컬럼은 "수익률(%)"로 통합 (중복 컬럼 생성 방지)
+            migrate_legacy_columns(df)
             if df.empty:
                 continue
-                
-            self.logger.info(f"[{year}년] 데이터 보강 중... ({len(df)}건)")
-            
-            # 새로운 컬럼 초기화
-            new_cols = ['시가', '고가', '저가', '종가', '수익률']
-            for col in new_cols:
-                if col not in df.columns:
-                    df[col] = None
-            
-            for index, row in df.iterrows():
-                try:
-                    # 1. 필수 정보 추출
-                    stock_name = row.get('종목명') or row.get('name')
-                    listing_date_val = row.get('상장일') or row.get('listing_date')
-                    confirmed_price_val = row.get('확정공모가') or row.get('confirmed_price')
-                    
-                    if not stock_name:
-                        self.logger.info(f"    - [SKIP] 종목명 찾을 수 없음")
-                        continue
-
-                    # 2. 데이터 보강 (StockPriceEnricher 위임)
-                    market_data = self.stock_enricher.get_market_data(
-                        stock_name, listing_date_val, confirmed_price_val
-                    )
-                    
-                    # 3. 결과 반영
-                    if market_data['종가']:
-                        df.at[index, '시가'] = market_data['시가']
-                        df.at[index, '고가'] = market_data['고가']
-                        df.at[index, '저가'] = market_data['저가']
-                        df.at[index, '종가'] = market_data['종가']
-                        
-                        if market_data['수익률'] is not None:
-                            df.at[index, '수익률'] = market_data['수익률']
-                            total_enriched += 1
-                            
-                except Exception as e:
-                    self.logger.error(f"    - [ERROR] {row.get('종목명', 'Unknown')} 처리 중 오류: {e}")
-                    pass
-            
+            year_keys = self._extract_keys(df)
+            if year_keys is None:
+                self.logger.info(f"    - [SKIP] {year}년: 종목명 컬럼 찾을 수 없음")
+                continue
+            if last_session is not None:
+                year_keys = year_keys[self._pending_mask(df, year_keys, last_session)].copy()
+                if year_keys.empty:
+                    continue
+            keys[year] = year_keys
+            self.logger.info(f"[{year}년] 데이터 보강 대상 {len(year_keys)}건 (전체 {len(df)}건)")
+
+        if not keys:
+            self.logger.info("ℹ️  보강할 대상이 없습니다.")
+            return
+
+        all_keys = pd.concat(keys.values(), ignore_index=True)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 1. 티커 일괄 조회 (고유 종목명 기준)
+            ticker_map = self.stock_enricher.resolve_tickers(
+                all_keys['name'].dropna().unique(), executor=executor
+            )
+            unresolved = sum(1 for ticker in ticker_map.values() if not ticker)
+            if unresolved:
+                self.logger.info(f"    - [SKIP] Ticker 찾을 수 없음: {unresolved}개 종목")
+
+            # 1-1. 상장일 -> 조회 가능한 거래일 보정 (휴장일/장 마감 전 제외, 네트워크 호출 없음)
+            sessions = {
+                d: self.stock_enricher.resolve_session(d, now)
+                for d in all_keys['listing_date'].dropna().unique()
+            }
+            not_ready = sum(1 for session in sessions.values() if session is None)
+            if not_ready:
+                self.logger.info(f"    - [SKIP] 장 마감 전 상장일: {not_ready}개 날짜")
+
+            for year_keys in keys.values():
+                year_keys['ticker'] = year_keys['name'].map(ticker_map)
+                year_keys['listing_date'] = year_keys['listing_date'].map(sessions)
+            all_keys = pd.concat(keys.values(), ignore_index=True)
+
+            # 2. OHLC 일괄 조회 (고유 (티커, 상장일) 기준)
+            valid = all_keys.dropna(subset=['ticker', 'listing_date'])
+            pairs = zip(valid['ticker'], valid['listing_date'])
+            if self.return_engine:
+                ohlc_frame = self.return_engine.fetch_history_frame(pairs, executor=executor)
+            else:
+                ohlc_frame = self.stock_enricher.fetch_ohlc_frame(pairs, executor=executor)
+
+        # 3. 연도별 병합
+        enriched_data = {}
+        total_enriched = 0
+        for year, year_keys in keys.items():
+            df = yearly_data[year]
+            total_enriched += self._merge_market_data(df, year_keys, ohlc_frame)
+            if self.return_engine:
+                df = self._merge_horizon_returns(df, year_keys, ohlc_frame)
             enriched_data[year] = df
-            
+
+        self._log_throughput(len(all_keys), time.perf_counter() - started_at)
+
         # 저장
         if enriched_data:
             self.data_exporter.export(enriched_data)
             self.logger.info(f"✅ 데이터 보강 완료 (총 {total_enriched}건 시세 추가됨)")
             self.logger.info("=" * 60)
+
+    def _extract_keys(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """보강에 필요한 키 컬럼을 정규화하여 추출 (행 인덱스 유지)"""
+        name_col = self._find_column(df, '종목명', 'name')
+        if name_col is None:
+            return None
+        date_col = self._find_column(df, '상장일', 'listing_date')
+        price_col = self._find_column(df, '확정공모가', 'confirmed_price')
+
+        names = df[name_col].where(df[name_col].notna() & (df[name_col] != ""))
+
+        if date_col is not None:
+            listing_dates = parse_listing_dates(df[date_col]).dt.date
+        else:
+            listing_dates = pd.Series(pd.NaT, index=df.index)
+
+        if price_col is not None:
+            prices = pd.to_numeric(
+                df[price_col].astype(str).str.replace(",", "", regex=False), errors='coerce'
+            )
+        else:
+            prices = pd.Series(float('nan'), index=df.index)
+
+        return pd.DataFrame(
+            {'name': names, 'listing_date': listing_dates, 'confirmed_price': prices},
+            index=df.index
+        )
+
+    def _merge_market_data(
+        self, df: pd.DataFrame, year_keys: pd.DataFrame, ohlc_frame: pd.DataFrame
+    ) -> int:
+        """OHLC 프레임을 시트에 병합하고 수익률을 계산. 수익률이 추가된 행 수를 반환"""
+        for col in self.OHLC_COLUMNS + [self.GROWTH_COLUMN]:
+            if col not in df.columns:
+                df[col] = None
+
+        merged = year_keys.merge(ohlc_frame, on=['ticker', 'listing_date'], how='left')
+        merged.index = year_keys.index
+        found = merged.index[merged['종가'].notna()]
+
+        if found.empty:
+            return 0
+
+        for col in self.OHLC_COLUMNS:
+            df[col] = df[col].astype(object)
+            df.loc[found, col] = merged.loc[found, col].astype('Int64')
+
+        growth = self.stock_enricher.calculate_growth_rates(
+            merged.loc[found, '종가'], merged.loc[found, 'confirmed_price']
+        ).dropna()
+        df[self.GROWTH_COLUMN] = df[self.GROWTH_COLUMN].astype(object)
+        df.loc[growth.index, self.GROWTH_COLUMN] = growth
+
+        return len(growth)
+
+    def _merge_horizon_returns(
+        self, df: pd.DataFrame, year_keys: pd.DataFrame, history_frame: pd.DataFrame
+    ) -> pd.DataFrame:
+        """D+N 종가/수익률을 계산하여 매퍼를 통해 컬럼으로 추가"""
+        close_cols = [self.return_engine.close_column(h) for h in self.return_engine.horizons]
+        merged = year_keys.merge(
+            history_frame[['ticker', 'listing_date'] + close_cols],
+            on=['ticker', 'listing_date'], how='left'
+        )
+        merged.index = year_keys.index
+
+        returns = self.return_engine.compute_returns(merged, merged['confirmed_price'])
+        horizon_frame = pd.concat([merged[close_cols], returns], axis=1)
+        return self.data_mapper.add_horizon_columns(df, horizon_frame)
+
+    def _pending_mask(
+        self, df: pd.DataFrame, year_keys: pd.DataFrame, last_session: date
+    ) -> pd.Series:
+        """증분 보강 대상: 종가가 비어 있고(또는 D+N 기간 진행 중) 상장일이 마지막 마감 세션 이전인 행"""
+        missing_close = df['종가'].isna() if '종가' in df.columns else pd.Series(True, index=df.index)
+        listing_dates = pd.to_datetime(year_keys['listing_date'])
+        listed = listing_dates.le(pd.Timestamp(last_session))
+        if self.return_engine:
+            # D+N 기간이 아직 끝나지 않은 종목도 재조회 대상
+            window_start = pd.Timestamp(last_session) - pd.Timedelta(days=self.return_engine.window_days)
+            missing_close = missing_close | listing_dates.ge(window_start)
+        return missing_close & listed
+
+    def _last_closed_session(self, now: datetime) -> date:
+        """
+        마지막으로 장이 마감된 거래일
+
+        거래일 캘린더가 있으면 휴장일/장 마감 시각을 반영하고,
+        없으면 주말만 제외하여 장 마감(15:30) 이전이면 전일부터 거슬러 올라갑니다.
+        """
+        if self.trading_calendar:
+            return self.trading_calendar.last_closed_session(now)
+        session = now.date() if now.time() >= self.MARKET_CLOSE else now.date() - timedelta(days=1)
+        while session.weekday() >= 5:
+            session -= timedelta(days=1)
+        return session
+
+    @staticmethod
+    def _find_column(df: pd.DataFrame, *candidates: str) -> Optional[str]:
+        """후보 컬럼명 중 존재하는 첫 번째 컬럼 반환"""
+        for col in candidates:
+            if col in df.columns:
+                return col
+        return None
+
+    def _log_throughput(self, total_rows: int, elapsed: float) -> None:
+        """처리량 로그"""
+        if total_rows == 0:
+            return
+        rate = total_rows / elapsed if elapsed > 0 else float(total_rows)
+        self.logger.info(f"⏱️  보강 처리량: {total_rows}건 / {elapsed:.1f}초 ({rate:.1f}건/초)")
@@ -0,0 +1,132 @@
+"""
+상장 후 기간별 수익률 계산 서비스
+"""
+from concurrent.futures import Executor
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+from core.ports.enrichment_ports import PriceHistoryProviderPort
+from core.ports.utility_ports import LoggerPort
+
+
+class PostIpoReturnEngine:
+    """
+    상장일(D+0) 이후 D+N 거래일 종가 및 공모가 대비 수익률 계산 엔진
+
+    종목당 기간 시세(OHLCV)를 한 번만 조회하고, 설정된 모든 기간(horizon)의
+    종가/수익률을 벡터 연산으로 계산합니다. 기간 수와 무관하게 네트워크 비용은
+    종목당 1회 요청으로 유지됩니다.
+    """
+
+    DEFAULT_HORIZONS = (1, 5, 20, 60)
+    OHLC_COLUMNS = ['시가', '고가', '저가', '종가']
+
+    def __init__(
+        self,
+        history_provider: PriceHistoryProviderPort,
+        logger: LoggerPort,
+        horizons: Sequence[int] = DEFAULT_HORIZONS
+    ):
+        self.history_provider = history_provider
+        self.logger = logger
+        self.horizons: Tuple[int, ...] = tuple(sorted(set(int(h) for h in horizons if int(h) > 0)))
+
+    @staticmethod
+    def close_column(horizon: int) -> str:
+        """D+N 종가 내부 컬럼명"""
+        return f"close_d{horizon}"
+
+    @staticmethod
+    def return_column(horizon: int) -> str:
+        """D+N 수익률 내부 컬럼명"""
+        return f"return_d{horizon}"
+
+    def fetch_history_frame(
+        self, pairs: Iterable[Tuple[str, date]], executor: Optional[Executor] = None
+    ) -> pd.DataFrame:
+        """
+        고유 (티커, 상장일) 쌍마다 기간 시세를 1회 조회하여
+        D+0 OHLC 및 D+N 종가를 담은 DataFrame 반환
+
+        Returns:
+            컬럼: ticker, listing_date, 시가, 고가, 저가, 종가, close_d{N}...
+            (시세가 없는 쌍은 제외)
+        """
+        unique_pairs: List[Tuple[str, date]] = list(dict.fromkeys(pairs))
+        map_fn = executor.map if executor else map
+        histories = map_fn(self._safe_get_history, unique_pairs)
+
+        close_cols = [self.close_column(h) for h in self.horizons]
+        width = (self.horizons[-1] if self.horizons else 0) + 1
+
+        keys, ohlc_rows, close_rows = [], [], []
+        for (ticker, listing_date), history in zip(unique_pairs, histories):
+            if history is None or history.empty:
+                continue
+            # 상장일 이후 거래일만 사용 (첫 행 = D+0)
+            history = history[history.index >= pd.Timestamp(listing_date)]
+            if history.empty:
+                continue
+
+            closes = np.full(width, np.nan)
+            series = history['Close'].to_numpy(dtype=float)[:width]
+            closes[:len(series)] = series
+
+            keys.append((ticker, listing_date))
+            ohlc_rows.append(history.iloc[0][['Open', 'High', 'Low', 'Close']].to_numpy(dtype=float))
+            close_rows.append(closes)
+
+        columns = ['ticker', 'listing_date'] + self.OHLC_COLUMNS + close_cols
+        if not keys:
+            return pd.DataFrame(columns=columns)
+
+        # D+N 위치를 한 번에 추출 (행: 종목, 열: 기간)
+        close_matrix = np.vstack(close_rows)[:, list(self.horizons)]
+        frame = pd.DataFrame(keys, columns=['ticker', 'listing_date'])
+        frame[self.OHLC_COLUMNS] = np.vstack(ohlc_rows)
+        frame[close_cols] = close_matrix
+        return frame[columns]
+
+    def compute_returns(self, closes: pd.DataFrame, confirmed_price: pd.Series) -> pd.DataFrame:
+        """
+        D+N 종가 프레임과 공모가로 모든 기간의 수익률을 일괄 계산
+
+        Returns:
+            closes와 같은 인덱스, 컬럼: return_d{N}...
+        """
+        close_cols = [self.close_column(h) for h in self.horizons]
+        price = pd.to_numeric(confirmed_price, errors='coerce').to_numpy(dtype=float)
+        price = np.where(price > 0, price, np.nan)
+
+        matrix = closes[close_cols].to_numpy(dtype=float)
+        returns = np.round((matrix - price[:, None]) / price[:, None] * 100, 2)
+
+        return pd.DataFrame(
+            returns,
+            index=closes.index,
+            columns=[self.return_column(h) for h in self.horizons]
+        )
+
+    @property
+    def window_days(self) -> int:
+        """최대 기간을 덮는 달력 일수 (주말/공휴일 여유 포함)"""
+        max_horizon = self.horizons[-1] if self.horizons else 0
+        return int(max_horizon * 1.6) + 10
+
+    def _history_end_date(self, listing_date: date) -> date:
+        """기간 시세 조회 종료일"""
+        end = listing_date + timedelta(days=self.window_days)
+        return min(end, date.today())
+
+    def _safe_get_history(self, pair: Tuple[str, date]) -> Optional[pd.DataFrame]:
+        """예외를 삼키는 기간 시세 조회"""
+        ticker, listing_date = pair
+        try:
+            return self.history_provider.get_ohlcv_range(
+                ticker, listing_date, self._history_end_date(listing_date)
+            )
+        except Exception as e:
+            self.logger.error(f"    - [ERROR] {ticker} ({listing_date}) 기간 시세 조회 중 오류: {e}")
+            return None
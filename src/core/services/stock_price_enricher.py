@@ -1,14 +1,16 @@
 """
 주가 정보 보강 서비스
 """
-from datetime import date
-from typing import Optional, Dict
+from concurrent.futures import Executor
+from datetime import date, datetime
+from typing import Optional, Dict, Iterable, List, Tuple
 from dataclasses import replace
 import pandas as pd
 
 from core.domain.models import StockInfo
+from core.domain.listing_date import parse_listing_date
 from core.ports.enrichment_ports import TickerMapperPort, MarketDataProviderPort
-from core.ports.utility_ports import LoggerPort
+from core.ports.utility_ports import LoggerPort, TradingCalendarPort
 
 
 class StockPriceEnricher:
@@ -20,11 +22,13 @@ class StockPriceEnricher:
         self,
         ticker_mapper: TickerMapperPort,
         market_data_provider: MarketDataProviderPort,
-        logger: LoggerPort
+        logger: LoggerPort,
+        trading_calendar: Optional[TradingCalendarPort] = None
     ):
         self.ticker_mapper = ticker_mapper
         self.market_data_provider = market_data_provider
         self.logger = logger
+        self.trading_calendar = trading_calendar
 
     def enrich_stock_info(self, stock: StockInfo) -> StockInfo:
         """
@@ -42,11 +46,15 @@ class StockPriceEnricher:
                 self.logger.info(f"      ⚠️  상장일 정보 없음: {stock.name}")
                 return stock
 
-            try:
-                listing_date_str = str(stock.listing_date).replace(".", "-")
-                listing_date = pd.to_datetime(listing_date_str).date()
-            except Exception as e:
-                self.logger.info(f"      ⚠️  날짜 변환 실패: {stock.name} ({stock.listing_date}) - {e}")
+            listing_date = parse_listing_date(stock.listing_date)
+            if listing_date is None:
+                self.logger.info(f"      ⚠️  날짜 변환 실패: {stock.name} ({stock.listing_date})")
+                return stock
+
+            # 2-1. 거래일 보정 (휴장일 -> 다음 거래일, 장 마감 전이면 조회 생략)
+            listing_date = self.resolve_session(listing_date)
+            if listing_date is None:
+                self.logger.info(f"      ⏳ 장 마감 전이므로 OHLC 조회 생략: {stock.name} ({stock.listing_date})")
                 return stock
 
             # 3. OHLC 조회
@@ -75,58 +83,85 @@ class StockPriceEnricher:
             self.logger.warning(f"      ⚠️  OHLC 조회 실패: {stock.name} - {e}")
             return stock
 
-    def get_market_data(self, stock_name: str, listing_date_val: str, confirmed_price_val: str) -> Dict:
+    def resolve_session(self, listing_date: date, now: Optional[datetime] = None) -> Optional[date]:
         """
-        종목명, 상장일, 공모가를 받아 OHLC 및 수익률 딕셔너리 반환 (EnrichmentService용)
-        """
-        result = {
-            '시가': None, '고가': None, '저가': None, '종가': None, '수익률': None
-        }
-
-        try:
-            # 1. Ticker 조회
-            ticker = self.ticker_mapper.get_ticker(stock_name)
-            if not ticker:
-                self.logger.info(f"    - [SKIP] Ticker 찾을 수 없음: {stock_name}")
-                return result
+        상장일을 시세 조회 가능한 거래일로 보정 (네트워크 호출 없음)
 
-            # 2. 상장일 파싱
-            if not listing_date_val or listing_date_val == "N/A":
-                self.logger.info(f"    - [SKIP] 상장일 정보 없음: {stock_name}")
-                return result
-
-            try:
-                listing_date_str = str(listing_date_val).replace(".", "-")
-                listing_date = pd.to_datetime(listing_date_str).date()
-            except Exception as e:
-                self.logger.info(f"    - [SKIP] 날짜 변환 실패: {stock_name} ({listing_date_val}) - {e}")
-                return result
-
-            # 3. OHLC 조회
-            ohlc = self.market_data_provider.get_ohlc(ticker, listing_date)
-            if not ohlc:
-                self.logger.info(f"    - [SKIP] OHLC 데이터 없음: {stock_name} ({ticker}, {listing_date})")
-                return result
-
-            result['시가'] = ohlc['Open']
-            result['고가'] = ohlc['High']
-            result['저가'] = ohlc['Low']
-            result['종가'] = ohlc['Close']
+        - 휴장일이면 다음 거래일로 이동
+        - 해당 거래일의 장이 아직 마감되지 않았으면 None (조회 불가)
+        - 캘린더가 없으면 입력값 그대로 반환
+        """
+        if self.trading_calendar is None:
+            return listing_date
+        session = self.trading_calendar.next_session(listing_date)
+        if not self.trading_calendar.is_session_closed(session, now or datetime.now()):
+            return None
+        return session
+
+    def resolve_tickers(
+        self, stock_names: Iterable[str], executor: Optional[Executor] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        고유 종목명 목록의 티커를 일괄 조회 (EnrichmentService용)
 
-            # 4. 수익률 계산
-            confirmed_price = self._parse_price(confirmed_price_val)
-            if confirmed_price:
-                growth_rate = self._calculate_growth_rate(ohlc['Close'], confirmed_price)
-                result['수익률'] = growth_rate
-                self.logger.info(f"    - [OK] {stock_name} ({ticker}): 수익률 {growth_rate}%")
-            else:
-                 self.logger.info(f"    - [WARN] 공모가 변환 실패: {stock_name} ({confirmed_price_val})")
+        Returns:
+            {종목명: 티커 또는 None}
+        """
+        names = list(dict.fromkeys(n for n in stock_names if n))
+        map_fn = executor.map if executor else map
+        tickers = map_fn(self._safe_get_ticker, names)
+        return dict(zip(names, tickers))
+
+    def fetch_ohlc_frame(
+        self, pairs: Iterable[Tuple[str, date]], executor: Optional[Executor] = None
+    ) -> pd.DataFrame:
+        """
+        고유 (티커, 상장일) 쌍의 OHLC를 일괄 조회하여 DataFrame으로 반환
 
-            return result
+        Returns:
+            컬럼: ticker, listing_date, 시가, 고가, 저가, 종가 (조회 실패 쌍은 제외)
+        """
+        unique_pairs: List[Tuple[str, date]] = list(dict.fromkeys(pairs))
+        map_fn = executor.map if executor else map
+        results = map_fn(self._safe_get_ohlc, unique_pairs)
+
+        records = [
+            {
+                'ticker': ticker, 'listing_date': listing_date,
+                '시가': ohlc['Open'], '고가': ohlc['High'],
+                '저가': ohlc['Low'], '종가': ohlc['Close'],
+            }
+            for (ticker, listing_date), ohlc in zip(unique_pairs, results)
+            if ohlc
+        ]
+        return pd.DataFrame(
+            records, columns=['ticker', 'listing_date', '시가', '고가', '저가', '종가']
+        )
+
+    @staticmethod
+    def calculate_growth_rates(close: pd.Series, confirmed_price: pd.Series) -> pd.Series:
+        """수익률 일괄 계산 (공모가가 없거나 0 이하이면 NaN)"""
+        close = pd.to_numeric(close, errors='coerce')
+        price = pd.to_numeric(confirmed_price, errors='coerce')
+        price = price.where(price > 0)
+        return ((close - price) / price * 100).round(2)
+
+    def _safe_get_ticker(self, stock_name: str) -> Optional[str]:
+        """예외를 삼키는 티커 조회 (일괄 조회용)"""
+        try:
+            return self.ticker_mapper.get_ticker(stock_name)
+        except Exception as e:
+            self.logger.error(f"    - [ERROR] {stock_name} 티커 조회 중 오류: {e}")
+            return None
 
+    def _safe_get_ohlc(self, pair: Tuple[str, date]) -> Optional[Dict[str, int]]:
+        """예외를 삼키는 OHLC 조회 (일괄 조회용)"""
+        ticker, listing_date = pair
+        try:
+            return self.market_data_provider.get_ohlc(ticker, listing_date)
         except Exception as e:
-            self.logger.error(f"    - [ERROR] {stock_name} 처리 중 오류: {e}")
-            return result
+            self.logger.error(f"    - [ERROR] {ticker} ({listing_date}) 시세 조회 중 오류: {e}")
+            return None
 
     def _calculate_growth_rate(self, close_price: int, confirmed_price: int) -> Optional[float]:
         """수익률 계산"""
@@ -134,12 +169,3 @@ class StockPriceEnricher:
             growth_rate = (close_price - confirmed_price) / confirmed_price * 100
             return round(growth_rate, 2)
         return None
-
-    def _parse_price(self, price_val: str) -> Optional[int]:
-        """가격 문자열 파싱"""
-        if pd.notna(price_val) and price_val != "":
-            try:
-                return int(float(str(price_val).replace(",", "")))
-            except ValueError:
-                return None
-        return None
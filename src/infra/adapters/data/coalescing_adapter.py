@@ -0,0 +1,78 @@
+"""
+요청 병합 + 결과 캐시 어댑터 구현
+"""
+import threading
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Optional
+import pandas as pd
+
+from core.ports.enrichment_ports import TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort
+from infra.adapters.utils.singleflight import LRUCache, SingleFlight
+
+
+class CoalescingAdapter(TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort):
+    """
+    시세 제공자 앞단의 요청 병합(SingleFlight) 데코레이터 어댑터
+
+    - 같은 키(종목명 / 티커+날짜 / 티커+기간)로 동시에 들어온 요청은 한 번만 실행하고 결과를 공유
+    - 최근 결과는 LRU 캐시에 보관
+    - 조회 실패(None) 결과는 negative_ttl 동안만 캐시 (하위 어댑터가 타임아웃 등 일시 장애도
+      None으로 반환하므로, 실행 내내 "티커/시세 없음"으로 고정되지 않도록 짧게 유지)
+    - 예외는 캐시하지 않음 (다음 호출에서 재시도)
+    """
+
+    def __init__(self, provider, cache_size: int = 2048, negative_ttl: float = 30.0):
+        """
+        Args:
+            provider: TickerMapperPort, MarketDataProviderPort(, PriceHistoryProviderPort)를 구현한 어댑터
+            cache_size: 최근 결과 캐시 크기 (항목 수)
+            negative_ttl: None 결과 캐시 유효 시간 (초, 0 이하면 캐시하지 않음)
+        """
+        self.provider = provider
+        self.negative_ttl = negative_ttl
+        self._cache = LRUCache(cache_size)
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get_ticker(self, stock_name: str) -> Optional[str]:
+        return self._get(("ticker", stock_name), lambda: self.provider.get_ticker(stock_name))
+
+    def get_ohlc(self, ticker: str, target_date: date) -> Optional[Dict[str, int]]:
+        return self._get(
+            ("ohlc", ticker, target_date), lambda: self.provider.get_ohlc(ticker, target_date)
+        )
+
+    def get_ohlcv_range(self, ticker: str, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+        return self._get(
+            ("range", ticker, start_date, end_date),
+            lambda: self.provider.get_ohlcv_range(ticker, start_date, end_date)
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/미적중 및 병합된 요청 수"""
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self._flight.shared}
+
+    def _get(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        hit, value = self._cache.get(key)
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if hit:
+            return value
+        return self._flight.do(key, lambda: self._fetch_and_store(key, fetch))
+
+    def _fetch_and_store(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        # 대기 중 다른 호출이 먼저 채웠을 수 있으므로 재확인
+        hit, value = self._cache.get(key)
+        if hit:
+            return value
+        value = fetch()
+        if value is not None:
+            self._cache.put(key, value)
+        elif self.negative_ttl > 0:
+            self._cache.put(key, value, ttl=self.negative_ttl)
+        return value
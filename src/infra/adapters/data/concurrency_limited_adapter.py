@@ -0,0 +1,55 @@
+"""
+동시 호출 제한 어댑터 구현
+"""
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from typing import Iterator, Optional, Dict
+import pandas as pd
+
+from core.ports.enrichment_ports import TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort
+
+
+class ConcurrencyLimitedAdapter(TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort):
+    """
+    시세 제공자의 동시 요청 수를 제한하는 데코레이터 어댑터
+
+    병렬 보강 시 특정 제공자(KRX 등)에 과도한 요청이 몰리지 않도록
+    제공자 단위의 세마포어로 동시 호출 수를 제한합니다.
+    """
+
+    def __init__(self, provider, max_concurrency: int = 2):
+        """
+        Args:
+            provider: TickerMapperPort, MarketDataProviderPort(, PriceHistoryProviderPort)를 구현한 어댑터
+            max_concurrency: 동시에 허용할 최대 요청 수
+        """
+        self.provider = provider
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._local = threading.local()
+
+    def get_ticker(self, stock_name: str) -> Optional[str]:
+        with self._slot():
+            return self.provider.get_ticker(stock_name)
+
+    def get_ohlc(self, ticker: str, target_date: date) -> Optional[Dict[str, int]]:
+        with self._slot():
+            return self.provider.get_ohlc(ticker, target_date)
+
+    def get_ohlcv_range(self, ticker: str, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+        with self._slot():
+            return self.provider.get_ohlcv_range(ticker, start_date, end_date)
+
+    def last_queue_wait(self) -> float:
+        """현재 스레드의 마지막 호출이 동시 호출 제한(세마포어)을 기다린 시간 (초)"""
+        return getattr(self._local, "queue_wait", 0.0)
+
+    @contextmanager
+    def _slot(self) -> Iterator[None]:
+        """세마포어 획득 (대기 시간을 스레드별로 기록)"""
+        started = time.perf_counter()
+        with self._semaphore:
+            self._local.queue_wait = time.perf_counter() - started
+            yield
@@ -1,11 +1,17 @@
 """
 DataFrame 매퍼 구현
 """
-from typing import List
+import re
+from dataclasses import fields
+from operator import attrgetter
+from typing import List, Union
+import numpy as np
 import pandas as pd
 
 from core.ports.data_ports import DataMapperPort
-from core.domain.models import StockInfo
+from core.domain.models import StockBatch, StockInfo
+from core.domain.schema import FIELD_TO_COLUMN, HORIZON_COLUMN_KINDS, columns_of, horizon_column_name
+from infra.adapters.data.dataset_dtypes import apply_dtypes
 
 
 class DataFrameMapper(DataMapperPort):
@@ -13,73 +19,103 @@ class DataFrameMapper(DataMapperPort):
     StockInfo 리스트를 Pandas DataFrame으로 변환하는 어댑터
     """
     
-    # 컬럼명 매핑 (영문 필드명 -> 한글 컬럼명)
-    COLUMN_MAPPING = {
-        "name": "종목명",
-        "market_segment": "시장구분",
-        "sector": "업종",
-        "revenue": "매출액(백만원)",
-        "profit_pre_tax": "법인세비용차감전(백만원)",
-        "net_profit": "순이익(백만원)",
-        "capital": "자본금(백만원)",
-        "total_shares": "총공모주식수",
-        "par_value": "액면가",
-        "desired_price_range": "희망공모가액",
-        "confirmed_price": "확정공모가",
-        "offering_amount": "공모금액(백만원)",
-        "underwriter": "주간사",
-        "listing_date": "상장일",
-        "competition_rate": "기관경쟁률",
-        "emp_shares": "우리사주조합",
-        "inst_shares": "기관투자자",
-        "retail_shares": "일반청약자",
-        "tradable_shares_count": "유통가능물량(주)",
-        "tradable_shares_percent": "유통가능물량(%)",
-        # 시세 정보
-        "open_price": "시가",
-        "high_price": "고가",
-        "low_price": "저가",
-        "close_price": "종가",
-        "growth_rate": "수익률(%)",
-    }
-    
-    def to_dataframe(self, stocks: List[StockInfo]) -> pd.DataFrame:
-        """StockInfo 리스트를 DataFrame으로 변환"""
-        if not stocks:
+    # 컬럼명 매핑 (영문 필드명 -> 한글 컬럼명, 스키마 정의 순서)
+    COLUMN_MAPPING = dict(FIELD_TO_COLUMN)
+
+    # 상장 후 기간별 내부 컬럼명 (close_d{N} / return_d{N}, 한글 컬럼명과 값 종류는 스키마 정의)
+    _HORIZON_PATTERN = re.compile(r"^(close|return)_d(\d+)$")
+
+    # StockInfo 필드 중 컬럼으로 내보낼 필드 (스키마 정의 순서)
+    _FIELDS = tuple(
+        name for name in FIELD_TO_COLUMN if name in {field.name for field in fields(StockInfo)}
+    )
+    _INTEGER_COLUMNS = frozenset(columns_of("integer"))
+
+    def to_dataframe(self, stocks: Union[List[StockInfo], StockBatch]) -> pd.DataFrame:
+        """StockInfo 리스트(또는 StockBatch)를 DataFrame으로 변환"""
+        if not len(stocks):
             return pd.DataFrame(columns=self.COLUMN_MAPPING.values())
-        
-        # 객체를 딕셔너리로 변환
-        data = [stock.__dict__ for stock in stocks]
-        
-        # DataFrame 생성
-        df = pd.DataFrame(data)
-        
-        # 컬럼명 변경
-        df = df.rename(columns=self.COLUMN_MAPPING)
-        
-        # 정의된 컬럼만 선택 (순서 보장)
-        columns = list(self.COLUMN_MAPPING.values())
-        
-        # 없는 컬럼이 있을 경우를 대비해 intersection 사용
-        existing_columns = [col for col in columns if col in df.columns]
-        df = df[existing_columns]
-        
-        # 숫자형 컬럼 정수 변환 (소수점 제거)
-        numeric_cols = [
-            "매출액(백만원)", "법인세비용차감전(백만원)", "순이익(백만원)", "자본금(백만원)",
-            "총공모주식수", "액면가", "희망공모가액", "확정공모가", "공모금액(백만원)",
-            "우리사주조합", "기관투자자", "일반청약자", "유통가능물량(주)"
+        if isinstance(stocks, StockBatch):
+            return self._from_batch(stocks)
+
+        # 필드 튜플을 2차원 object 배열로 (객체별 dict 생성/컬럼명 변경/dtype 추론 없음)
+        values = np.array(list(map(attrgetter(*self._FIELDS), stocks)), dtype=object)
+        columns = [self.COLUMN_MAPPING[name] for name in self._FIELDS]
+        integer_positions = [i for i, col in enumerate(columns) if col in self._INTEGER_COLUMNS]
+
+        data = {col: values[:, i] for i, col in enumerate(columns)}
+        if integer_positions:
+            integers = self._to_integers(values[:, integer_positions])
+            for j, i in enumerate(integer_positions):
+                data[columns[i]] = integers[j]
+        df = pd.DataFrame(data, columns=columns)
+
+        # 반복 문자열은 category, 나머지 문자열/정수는 Arrow 타입 (dtype 정책)
+        return apply_dtypes(df)
+
+    def _from_batch(self, batch: StockBatch) -> pd.DataFrame:
+        """StockBatch 컬럼 배열로 DataFrame 생성 (행 단위 처리 없음)"""
+        data = {}
+        for name in self._FIELDS:
+            col = self.COLUMN_MAPPING[name]
+            values, missing = batch.column(name)
+            if col not in self._INTEGER_COLUMNS:
+                data[col] = values if missing is None else np.where(missing, np.nan, values)
+            elif missing is None:
+                # 숫자 배열이 아닌 컬럼(다른 타입 값이 섞인 경우)
+                data[col] = self._to_integers(values.reshape(-1, 1))[0]
+            elif values.dtype.kind == "i":
+                data[col] = pd.arrays.IntegerArray(values, missing)
+            else:
+                data[col] = self._to_integers(np.where(missing, np.nan, values).reshape(-1, 1))[0]
+        df = pd.DataFrame(data, columns=list(data))
+        return apply_dtypes(df)
+
+    @staticmethod
+    def _to_integers(block: np.ndarray) -> List[pd.arrays.IntegerArray]:
+        """
+        정수 컬럼 블록을 Int64 배열 목록으로 변환 (반올림, 숫자가 아닌 값은 결측)
+
+        상세 수집 단계에서 이미 int/None으로 파싱되므로 블록 전체를 한 번에 실수 변환하고,
+        숫자가 아닌 값이 섞인 컬럼만 컬럼 단위로 결측 처리합니다 (문자열 정제는 하지 않음).
+        """
+        try:
+            numeric = block.astype("float64")
+        except (TypeError, ValueError):
+            numeric = np.empty(block.shape, dtype="float64")
+            for j in range(block.shape[1]):
+                numeric[:, j] = pd.to_numeric(pd.Series(block[:, j], dtype=object), errors='coerce').to_numpy(dtype="float64")
+
+        numeric = np.round(numeric)
+        missing = np.isnan(numeric)
+        integers = np.where(missing, 0, numeric).astype("int64")
+        return [
+            pd.arrays.IntegerArray(integers[:, j], missing[:, j]) for j in range(block.shape[1])
         ]
-        
-        for col in numeric_cols:
-            if col in df.columns:
-                # 문자열인 경우 쉼표 제거
-                if df[col].dtype == 'object':
-                    df[col] = df[col].astype(str).str.replace(',', '')
-                
-                # 숫자로 변환 (에러 발생 시 NaN)
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-                # 반올림 후 Int64 (Nullable Integer)로 변환
-                df[col] = df[col].round(0).astype('Int64')
-        
+
+    def add_horizon_columns(self, df: pd.DataFrame, horizon_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        D+N 종가/수익률 컬럼 추가
+
+        기간 순서대로 (D+1 종가, D+1 수익률(%), D+5 종가, ...) 기존 컬럼 뒤에 배치하고,
+        horizon_frame에 값이 있는 행만 갱신합니다.
+        """
+        renamed = {}
+        for col in horizon_frame.columns:
+            match = self._HORIZON_PATTERN.match(str(col))
+            if match:
+                kind, n = match.group(1), int(match.group(2))
+                renamed[col] = (n, kind, horizon_column_name(kind, n))
+
+        for col, (_, kind, target) in sorted(renamed.items(), key=lambda x: (x[1][0], x[1][1])):
+            values = horizon_frame[col].dropna()
+            if target not in df.columns:
+                dtype = "Int64" if HORIZON_COLUMN_KINDS[kind] == "integer" else "Float64"
+                df[target] = pd.Series(pd.NA, index=df.index, dtype=dtype)
+            if values.empty:
+                continue
+            if kind == "close":
+                values = values.round(0).astype("Int64")
+            df.loc[values.index, target] = values
+
         return df
@@ -0,0 +1,130 @@
+"""
+메모리 데이터셋 dtype 정책 (매핑/로드 시점 공용)
+"""
+import importlib.util
+from typing import Dict, Optional
+import pandas as pd
+from pandas.api.types import infer_dtype, is_integer_dtype, is_object_dtype, is_string_dtype
+
+from core.domain.schema import columns_of
+from config import config
+
+
+# pyarrow 설치 여부 (Arrow 기반 string/int 타입 사용 가능)
+ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# 컬럼 목록은 도메인 스키마(core.domain.schema)의 값 종류에서 가져옴 (설정된 D+N 기간 컬럼 포함)
+_HORIZONS = config.RETURN_HORIZONS
+CATEGORY_COLUMNS = columns_of("category", _HORIZONS)  # 반복이 많은 저카디널리티 문자열 (시장구분, 주간사 등)
+TEXT_COLUMNS = columns_of("text", _HORIZONS)          # 숫자/날짜 추론 없이 원문 유지 (상장일, 희망공모가액 등)
+INTEGER_COLUMNS = columns_of("integer", _HORIZONS)    # 값이 모두 정수일 때만 변환 (D+N 종가 포함)
+FLOAT_COLUMNS = columns_of("float", _HORIZONS)        # 값이 모두 숫자일 때만 변환 (D+N 수익률 포함)
+
+# 엑셀 읽기 시 문자열로 고정할 컬럼 (시트에 없는 컬럼은 pandas가 무시)
+READ_DTYPES: Dict[str, type] = {col: str for col in CATEGORY_COLUMNS + TEXT_COLUMNS}
+
+DTYPE_BACKENDS = ("pyarrow", "numpy_nullable")
+
+# 과거 파일의 숫자 컬럼 문자열 값 ("1,234" / "30%" / "1235:1" / "N/A")
+MISSING_TOKENS = ("", "-", "N/A")
+_LEGACY_SUFFIX = r"\s*(?:%|주|원|:\s*1)$"
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """
+    dtype 백엔드 결정 (기본: config.DATAFRAME_DTYPE_BACKEND, auto면 pyarrow 우선)
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드
+        ImportError: pyarrow 백엔드를 지정했으나 pyarrow가 없음
+    """
+    backend = (backend or config.DATAFRAME_DTYPE_BACKEND).lower()
+    if backend == "auto":
+        return "pyarrow" if ARROW_AVAILABLE else "numpy_nullable"
+    if backend not in DTYPE_BACKENDS:
+        raise ValueError(f"지원하지 않는 dtype 백엔드입니다: {backend} (auto|{'|'.join(DTYPE_BACKENDS)})")
+    if backend == "pyarrow" and not ARROW_AVAILABLE:
+        raise ImportError("pyarrow dtype 백엔드는 pyarrow 패키지가 필요합니다: pip install pyarrow")
+    return backend
+
+
+def apply_dtypes(df: pd.DataFrame, backend: Optional[str] = None) -> pd.DataFrame:
+    """
+    알려진 컬럼에 dtype 정책 적용 (df를 직접 변경하고 반환)
+
+    - CATEGORY_COLUMNS: category
+    - TEXT_COLUMNS: string (pyarrow 백엔드면 Arrow 문자열)
+    - INTEGER_COLUMNS: 값이 모두 정수이면 int64[pyarrow] 또는 Int64
+    - FLOAT_COLUMNS: 값이 모두 숫자이면 double[pyarrow] 또는 Float64
+      (과거 파일의 "1,234" / "30%" / "1235:1" 문자열은 숫자로, "N/A" / "-"는 결측으로 변환)
+    (문자열 컬럼은 현재 object/string인 경우만 변환 -> 매퍼가 숫자로 바꾼 컬럼은 유지)
+    """
+    backend = resolve_backend(backend)
+    text_dtype = pd.StringDtype("pyarrow" if backend == "pyarrow" else "python")
+    integer_dtype = _arrow_dtype("int64") if backend == "pyarrow" else "Int64"
+    float_dtype = _arrow_dtype("float64") if backend == "pyarrow" else "Float64"
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and _is_text(df[col]):
+            df[col] = _as_text(df[col]).astype("category")
+
+    for col in TEXT_COLUMNS:
+        if col in df.columns and _is_text(df[col]) and df[col].dtype != text_dtype:
+            df[col] = _as_text(df[col]).astype(text_dtype)
+
+    for col in INTEGER_COLUMNS:
+        if col not in df.columns or df[col].dtype == integer_dtype:
+            continue
+        if is_integer_dtype(df[col].dtype):
+            df[col] = df[col].astype(integer_dtype)
+            continue
+        numeric = _to_numeric(df[col])
+        if numeric is not None and is_integral(numeric):
+            df[col] = numeric.astype(integer_dtype)
+
+    for col in FLOAT_COLUMNS:
+        if col not in df.columns or df[col].dtype == float_dtype:
+            continue
+        numeric = _to_numeric(df[col])
+        if numeric is not None:
+            df[col] = numeric.astype(float_dtype)
+    return df
+
+
+def is_integral(numeric: pd.Series) -> bool:
+    """결측값을 제외한 값이 모두 정수인지 (Arrow 정수/실수 타입 포함)"""
+    return bool((numeric.dropna().astype("float64") % 1 == 0).all())
+
+
+def _to_numeric(values: pd.Series) -> Optional[pd.Series]:
+    """숫자 변환 (과거 파일 문자열 형식 포함), 변환할 수 없는 값이 있으면 None"""
+    numeric = pd.to_numeric(values, errors='coerce')
+    present = values.notna()
+    if numeric.notna().sum() == present.sum():
+        return numeric
+    if not _is_text(values):
+        return None
+
+    text = values.astype(object).where(present, None).astype("string").str.strip()
+    text = text.mask(text.isin(MISSING_TOKENS))
+    cleaned = text.str.replace(",", "", regex=False).str.replace(_LEGACY_SUFFIX, "", regex=True)
+    numeric = pd.to_numeric(cleaned, errors='coerce')
+    return numeric if numeric.notna().sum() == text.notna().sum() else None
+
+
+def _is_text(values: pd.Series) -> bool:
+    return is_object_dtype(values.dtype) or is_string_dtype(values.dtype)
+
+
+def _as_text(values: pd.Series) -> pd.Series:
+    """결측값은 유지하고 나머지는 문자열로 통일 (category/string 변환 전처리)"""
+    if infer_dtype(values, skipna=True) in ("string", "empty"):
+        return values
+    return values.astype(object).where(values.notna(), None).map(
+        lambda value: value if value is None or isinstance(value, str) else str(value)
+    )
+
+
+def _arrow_dtype(name: str) -> pd.ArrowDtype:
+    import pyarrow as pa
+    return pd.ArrowDtype(getattr(pa, name)())
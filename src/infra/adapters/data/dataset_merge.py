@@ -0,0 +1,142 @@
+"""
+연도별 데이터셋 병합/정렬/변경 비교 공용 로직 (저장소 어댑터 공용)
+"""
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+import pandas as pd
+
+from core.domain.listing_date import parse_listing_date, parse_listing_dates
+from core.domain.schema import LEGACY_COLUMN_NAMES, LISTING_DATE_COLUMN, NAME_COLUMN, migrate_legacy_columns
+
+
+def merge_frames(existing_df: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    기존 데이터와 신규 데이터 병합 (종목명 + 상장일 기준)
+
+    - 같은 종목은 신규 값을 우선하되, 신규 행에서 비어 있는 값은 기존 값을 유지합니다.
+      (보류 큐 보강처럼 일부 컬럼만 담긴 행이 기존 정보를 지우지 않도록)
+    - 상장일은 형식(2024.11.26 / 2024-11-26 등)과 무관하게 날짜로 정규화하여 비교합니다.
+    - 과거 컬럼명("수익률" 등)은 스키마의 현재 컬럼명으로 통합합니다.
+    """
+    existing_df, new_df = _with_current_columns(existing_df), _with_current_columns(new_df)
+    columns = existing_df.columns.union(new_df.columns, sort=False)
+    # 전부 비어 있는 컬럼은 병합 결과에 영향이 없으므로 제외 후 결합
+    new_values = new_df.dropna(axis=1, how='all')
+    combined_df = pd.concat([existing_df, new_values], ignore_index=True).reindex(columns=columns)
+    if NAME_COLUMN not in combined_df.columns:
+        return combined_df
+
+    keys = [NAME_COLUMN]
+    if LISTING_DATE_COLUMN in combined_df.columns:
+        listing_key = parse_listing_dates(combined_df[LISTING_DATE_COLUMN])
+        # 상장일 미정으로 수집된 행은 같은 종목의 확정 상장일로 묶음
+        combined_df['_listing_key'] = listing_key.fillna(
+            listing_key.groupby(combined_df[NAME_COLUMN]).transform('last')
+        )
+        keys.append('_listing_key')
+
+    # groupby.last(): 컬럼별로 마지막 유효값(NaN 제외) 선택
+    merged = combined_df.groupby(keys, sort=False, dropna=False, as_index=False).last()
+    return merged[columns]
+
+
+def sort_by_listing_date(df: pd.DataFrame) -> pd.DataFrame:
+    """상장일 기준 오름차순 정렬 (날짜순: 과거 -> 미래, 같은 날짜는 기존 순서 유지)"""
+    if LISTING_DATE_COLUMN not in df.columns:
+        return df
+    return df.sort_values(
+        by=LISTING_DATE_COLUMN, ascending=True, key=parse_listing_dates, kind='stable'
+    ).reset_index(drop=True)
+
+
+def diff_frames(before_df: Optional[pd.DataFrame], after_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    병합 전/후 데이터 비교 -> 변경 레코드 목록 (종목명 + 상장일 기준)
+
+    - 신규 행: {"op": "insert", "key": {...}, "after": {컬럼: 값}}
+    - 변경 행: {"op": "update", "key": {...}, "changes": {컬럼: {"before": 값, "after": 값}}}
+    - 상장일 미정이던 행이 확정 상장일로 합쳐진 경우도 변경으로 기록
+    """
+    if NAME_COLUMN not in after_df.columns:
+        return []
+    before_rows: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+    if before_df is not None and NAME_COLUMN in before_df.columns:
+        for key, record in zip(_row_keys(before_df), before_df.to_dict('records')):
+            before_rows[key] = record
+
+    changes = []
+    for key, record in zip(_row_keys(after_df), after_df.to_dict('records')):
+        before = before_rows.get(key)
+        if before is None and key[1] is not None:
+            before = before_rows.get((key[0], None))
+        change = diff_record(before, record, key)
+        if change:
+            changes.append(change)
+    return changes
+
+
+def diff_record(
+    before: Optional[Dict[str, Any]], after: Dict[str, Any], key: Tuple[Any, Any] = None
+) -> Optional[Dict[str, Any]]:
+    """행 단위 변경 레코드 (변경이 없으면 None)"""
+    if key is None:
+        listed = parse_listing_date(after.get(LISTING_DATE_COLUMN))
+        key = (after.get(NAME_COLUMN), listed.isoformat() if listed else None)
+    key_fields = {NAME_COLUMN: key[0], LISTING_DATE_COLUMN: key[1]}
+
+    if before is None:
+        values = {str(col): json_value(value) for col, value in after.items()}
+        return {"op": "insert", "key": key_fields, "after": {k: v for k, v in values.items() if v is not None}}
+
+    changed = {}
+    for col, value in after.items():
+        old, new = json_value(before.get(col)), json_value(value)
+        if not _same_value(old, new):
+            changed[str(col)] = {"before": old, "after": new}
+    if not changed:
+        return None
+    return {"op": "update", "key": key_fields, "changes": changed}
+
+
+def json_value(value: Any) -> Any:
+    """pandas/numpy 값을 JSON 기록용 기본 타입으로 변환 (결측값은 None)"""
+    if value is None:
+        return None
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        return value
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    """읽기 경로에 따른 타입 차이(1000 / 1000.0)는 같은 값으로 취급"""
+    if old is None or new is None:
+        return old is None and new is None
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)) \
+            and not isinstance(old, bool) and not isinstance(new, bool):
+        return float(old) == float(new)
+    return old == new
+
+
+def _row_keys(df: pd.DataFrame) -> List[Tuple[Any, Optional[str]]]:
+    names = df[NAME_COLUMN].tolist()
+    if LISTING_DATE_COLUMN not in df.columns:
+        return [(name, None) for name in names]
+    dates = parse_listing_dates(df[LISTING_DATE_COLUMN])
+    return [
+        (name, None if pd.isna(listed) else listed.date().isoformat())
+        for name, listed in zip(names, dates)
+    ]
+
+
+def _with_current_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """과거 컬럼명이 있으면 사본에서 통합 (호출자의 DataFrame은 변경하지 않음)"""
+    if any(legacy in df.columns for legacy in LEGACY_COLUMN_NAMES):
+        return migrate_legacy_columns(df.copy())
+    return df
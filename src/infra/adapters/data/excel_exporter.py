@@ -2,109 +2,407 @@
 Excel 내보내기 어댑터 구현
 """
 from pathlib import Path
+import hashlib
+import json
 import os
-from typing import Dict, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font
+from openpyxl.utils import get_column_letter
 
-from core.ports.data_ports import DataExporterPort
+from core.ports.data_ports import ChangeFeedPort, DatasetStorePort
+from infra.adapters.data.dataset_merge import diff_frames, merge_frames, sort_by_listing_date
+from infra.adapters.data.workbook_loader import WorkbookLoader, sheet_year
+from infra.adapters.utils.file_lock import FileLock, atomic_write
 from config import config
 
 
-class ExcelExporter(DataExporterPort):
+class ExcelExporter(DatasetStorePort):
     """
     DataFrame을 Excel 파일로 저장하는 어댑터
+    (DATASET_BACKEND=excel이면 엑셀 파일이 정본, 그 외에는 정본 저장소의 렌더러로 사용)
+
+    변경 추적:
+    - 업데이트 대상 연도 시트만 읽어 병합 (WorkbookLoader 캐시: 같은 명령에서 이미 읽은 시트는 재사용)
+    - 시트별 내용 해시를 사이드카 파일에 기록하여 내용이 바뀐 시트만 다시 기록
+      (사이드카가 없거나 통합 문서가 외부에서 바뀌었으면(Drive 다운로드 등) 읽은 시트 내용으로 해시 재계산)
+    - 바뀐 시트가 없으면 파일을 건드리지 않음
+
+    기록 방식 (write_engine, 기본값 config.EXCEL_WRITE_ENGINE):
+    - openpyxl (기본): 기존 통합 문서를 열어 변경 시트만 교체
+    - streaming (선택): openpyxl write-only 모드로 행을 순차 기록 (셀 객체 그래프를 만들지 않음).
+      변경 시트가 있으면 변경되지 않은 시트도 캐시/파일에서 읽어 통합 문서 전체를 다시 기록하므로
+      시트 캐시가 비어 있는 일반 일일 실행에서는 openpyxl보다 느림 (신규 파일/render 대량 기록용)
+
+    동시 실행 안전성:
+    - 읽기 -> 병합 -> 쓰기 전체를 권고 파일 잠금(<파일명>.lock) 안에서 수행
+    - 임시 파일에 기록 후 fsync + 원자적 이름 변경 (쓰기 도중 중단되어도 기존 파일 유지)
+    - 기존 파일을 읽지 못하면 덮어쓰지 않고 저장을 중단
     """
-    
-    def __init__(self, output_dir: Union[str, Path] = None):
-        # config.OUTPUT_DIR을 기본값으로 사용
+
+    WRITE_ENGINES = ("streaming", "openpyxl")
+    WIDTH_SAMPLE_ROWS = 50  # 컬럼 너비 계산에 사용할 행 수
+
+    def __init__(
+        self, output_dir: Union[str, Path] = None, write_engine: str = None, loader: WorkbookLoader = None,
+        lock_timeout: float = None, filename: str = None, change_feed: ChangeFeedPort = None
+    ):
+        # config.OUTPUT_DIR / 기본 파일명을 기본값으로 사용
         self.output_dir = Path(output_dir) if output_dir else config.OUTPUT_DIR
+        self.filename = filename or config.get_default_filename()
+        self.write_engine = (write_engine or config.EXCEL_WRITE_ENGINE).lower()
+        if self.write_engine not in self.WRITE_ENGINES:
+            raise ValueError(f"지원하지 않는 엑셀 기록 방식입니다: {self.write_engine}")
         self._ensure_output_dir()
-    
+
+        # 통합 문서 로더 (명령 단위로 공유하면 읽은 시트를 재사용)
+        self.loader = loader or WorkbookLoader()
+        self.lock_timeout = config.DATASET_LOCK_TIMEOUT if lock_timeout is None else lock_timeout
+        # 변경 피드 (기록한 시트의 추가/변경 행, 선택)
+        self.change_feed = change_feed
+
     def _ensure_output_dir(self) -> None:
         """출력 디렉토리 생성"""
         os.makedirs(self.output_dir, exist_ok=True)
-    
+
     def export(self, data: Dict[int, pd.DataFrame]) -> None:
         """
         연도별 데이터를 엑셀 파일로 저장
-        
+
         Args:
             data: {연도: DataFrame} 형태의 딕셔너리
         """
         if not data:
             return
-            
-        # 파일명 생성
-        filename = config.get_default_filename()
-        filepath = os.path.join(self.output_dir, filename)
-        
-        # 기존 파일이 있으면 로드하여 병합
-        if os.path.exists(filepath):
+
+        filepath = os.path.join(self.output_dir, self.filename)
+
+        # 다른 작업(daily / enrich)과 동시에 실행되어도 갱신이 유실되지 않도록 잠금 안에서 처리
+        with self._file_lock(filepath):
+            self._export(filepath, data)
+
+    def _export(self, filepath: str, data: Dict[int, pd.DataFrame]) -> None:
+        file_exists = os.path.exists(filepath)
+        existing_sheets: Dict[str, pd.DataFrame] = {}
+
+        # 기존 파일이 있으면 업데이트 대상 연도 시트만 로드하여 병합
+        if file_exists:
             print(f"      [정보] 기존 파일 발견: {filepath} (데이터 병합 및 보존)")
             try:
-                # 기존 데이터 로드 (모든 시트 확인)
-                with pd.ExcelFile(filepath) as xls:
-                    # 파일에 있는 모든 시트 이름을 확인하여, 
-                    # 이번에 업데이트되지 않는 연도의 데이터도 메모리에 로드해야 함 (유실 방지)
-                    for sheet_name in xls.sheet_names:
-                        try:
-                            # "2024년" 등에서 연도 추출
-                            year_str = sheet_name.replace("년", "")
-                            year = int(year_str)
-                        except ValueError:
-                            continue
-
-                        existing_df = pd.read_excel(xls, sheet_name=sheet_name)
-                        
-                        if year in data:
-                            # 2-A. 업데이트 대상 연도: 병합
-                            new_df = data[year]
-                            combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                            
-                            # 중복 제거 (종목명 기준, 최신 데이터 유지)
-                            combined_df = combined_df.drop_duplicates(subset=['종목명'], keep='last')
-                            
-                            data[year] = combined_df
-                            print(f"      [병합 완료] {year}년: 총 {len(combined_df)}건 (기존 {len(existing_df)} + 신규 {len(new_df)})")
-                        else:
-                            # 2-B. 업데이트 대상 아님: 그대로 유지 (보존)
-                            data[year] = existing_df
-                            # print(f"      [보존] {year}년 데이터 로드됨")
-
+                existing_sheets = self._read_sheets(filepath, [self._sheet_name(y) for y in data])
             except Exception as e:
-                print(f"      [경고] 기존 파일 병합 중 오류 (덮어쓰기 위험): {e}")
+                # 기존 데이터를 읽지 못한 채 쓰면 다른 연도/행이 유실되므로 중단
+                print(f"      [오류] 기존 파일을 읽을 수 없어 저장을 중단합니다 (기존 파일 유지): {e}")
+                raise
 
-        # 모든 데이터에 대해 상장일 기준 오름차순 정렬 (날짜순: 과거 -> 미래)
+            for year, new_df in list(data.items()):
+                existing_df = existing_sheets.get(self._sheet_name(year))
+                if existing_df is None:
+                    continue
+                combined_df = merge_frames(existing_df, new_df)
+                data[year] = combined_df
+                print(f"      [병합 완료] {year}년: 총 {len(combined_df)}건 (기존 {len(existing_df)} + 신규 {len(new_df)})")
+
+        # 상장일 기준 오름차순 정렬 (날짜순: 과거 -> 미래)
         for year, df in data.items():
-            if '상장일' in df.columns:
-                data[year] = df.sort_values(by='상장일', ascending=True)
-
-        # 엑셀 저장
-        with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-            # 연도 오름차순으로 시트 생성 (2020년 -> 2021년 ...)
-            for year, df in sorted(data.items()):
-                sheet_name = f"{year}년"
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                # 컬럼 너비 자동 조정 (선택 사항, openpyxl 필요)
-                self._adjust_column_width(writer, sheet_name, df)
-        
-        print(f"      [저장 완료] {filepath}")
-
-    def _adjust_column_width(self, writer, sheet_name: str, df: pd.DataFrame) -> None:
+            data[year] = sort_by_listing_date(df)
+
+        # 내용 해시 비교 -> 변경된 시트만 기록
+        stored_hashes = self._stored_hashes(filepath, existing_sheets) if file_exists else {}
+        new_hashes = {self._sheet_name(year): self._content_hash(df) for year, df in data.items()}
+        changed = {
+            year: df for year, df in data.items()
+            if stored_hashes.get(self._sheet_name(year)) != new_hashes[self._sheet_name(year)]
+        }
+
+        if not changed:
+            print(f"      [변경 없음] 모든 시트가 기존과 동일하여 저장 생략: {filepath}")
+            return
+
+        if file_exists:
+            sheet_names = self._write_changed_sheets(filepath, changed)
+        else:
+            sheet_names = self._write_workbook(filepath, changed)
+
+        self._remember(filepath, sheet_names, changed)
+        stored_hashes.update({self._sheet_name(year): new_hashes[self._sheet_name(year)] for year in changed})
+        self._save_manifest(filepath, stored_hashes)
+        self._publish_changes(existing_sheets, changed)
+
+        skipped = len(data) - len(changed)
+        print(f"      [저장 완료] {filepath} (변경 시트 {len(changed)}개 기록, 동일 시트 {skipped}개 생략)")
+
+    def load(self, years: Optional[Iterable[int]] = None) -> Dict[int, pd.DataFrame]:
+        """
+        엑셀 파일의 연도별 시트 로드 ("2024년" 형식 시트만, years 미지정 시 전체)
+        """
+        filepath = os.path.join(self.output_dir, self.filename)
+        if not os.path.exists(filepath):
+            return {}
+        return self.loader.load_years(filepath, years)
+
+    def render(self, data: Dict[int, pd.DataFrame]) -> Path:
+        """
+        정본 저장소의 전체 데이터로 통합 문서를 새로 생성 (병합 없음)
+
+        내용이 기존 파일과 같으면 다시 쓰지 않습니다.
+
+        Returns:
+            통합 문서 경로
+        """
+        filepath = os.path.join(self.output_dir, self.filename)
+        data = {year: sort_by_listing_date(df) for year, df in data.items()}
+        new_hashes = {self._sheet_name(year): self._content_hash(df) for year, df in data.items()}
+
+        with self._file_lock(filepath):
+            if os.path.exists(filepath) and self._rendered_hashes(filepath) == new_hashes:
+                print(f"      [변경 없음] 통합 문서가 최신 상태입니다: {filepath}")
+                return Path(filepath)
+
+            sheet_names = self._write_workbook(filepath, data)
+            self._remember(filepath, sheet_names, data, replace=True)
+            self._save_manifest(filepath, new_hashes)
+        print(f"      [렌더링 완료] {filepath} ({len(data)}개 시트)")
+        return Path(filepath)
+
+    def _publish_changes(self, existing_sheets: Dict[str, pd.DataFrame], written: Dict[int, pd.DataFrame]) -> None:
+        """기록한 시트의 병합 전/후 차이를 변경 피드에 추가"""
+        if self.change_feed is None:
+            return
+        for year, df in sorted(written.items()):
+            self.change_feed.append(year, diff_frames(existing_sheets.get(self._sheet_name(year)), df))
+
+    def _file_lock(self, filepath: str) -> FileLock:
+        """통합 문서 잠금 (<파일명>.lock)"""
+        return FileLock(f"{filepath}.lock", timeout=self.lock_timeout)
+
+    def _write_workbook(self, filepath: str, data: Dict[int, pd.DataFrame]) -> List[str]:
+        """새 통합 문서 생성 (기록한 시트 이름 목록 반환)"""
+        # 연도 오름차순으로 시트 생성 (2020년 -> 2021년 ...)
+        sheet_names = [self._sheet_name(year) for year in sorted(data)]
+        if self.write_engine == "streaming":
+            self._stream_workbook(filepath, [(self._sheet_name(year), df) for year, df in sorted(data.items())])
+            return sheet_names
+
+        with atomic_write(filepath) as tmp_path:
+            with pd.ExcelWriter(tmp_path, engine="openpyxl") as writer:
+                # 연도 오름차순으로 시트 생성 (2020년 -> 2021년 ...)
+                for year, df in sorted(data.items()):
+                    sheet_name = self._sheet_name(year)
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+                    # 컬럼 너비 자동 조정 (선택 사항, openpyxl 필요)
+                    self._adjust_column_width(writer.sheets[sheet_name], df)
+        return sheet_names
+
+    def _write_changed_sheets(self, filepath: str, changed: Dict[int, pd.DataFrame]) -> List[str]:
+        """기존 통합 문서에서 변경된 시트만 교체 (나머지 시트는 그대로 유지, 시트 이름 목록 반환)"""
+        if self.write_engine == "streaming":
+            return self._stream_rewrite(filepath, changed)
+
+        workbook = load_workbook(filepath)
+        try:
+            for year, df in sorted(changed.items()):
+                sheet_name = self._sheet_name(year)
+                if sheet_name in workbook.sheetnames:
+                    position = workbook.sheetnames.index(sheet_name)
+                    workbook.remove(workbook[sheet_name])
+                else:
+                    position = self._sheet_position(workbook.sheetnames, year)
+                worksheet = workbook.create_sheet(sheet_name, position)
+                self._fill_worksheet(worksheet, df)
+                self._adjust_column_width(worksheet, df)
+            with atomic_write(filepath) as tmp_path:
+                workbook.save(tmp_path)
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+
+    def _stream_rewrite(self, filepath: str, changed: Dict[int, pd.DataFrame]) -> List[str]:
+        """변경 시트를 반영하여 통합 문서 전체를 순차 기록 (시트 순서 유지, 새 연도는 연도순 위치)"""
+        sheet_names = self.loader.sheet_names(filepath)
+        changed_by_name = {self._sheet_name(year): df for year, df in changed.items()}
+        for year in sorted(changed):
+            if self._sheet_name(year) not in sheet_names:
+                sheet_names.insert(self._sheet_position(sheet_names, year), self._sheet_name(year))
+
+        unchanged = self._read_sheets(filepath, [name for name in sheet_names if name not in changed_by_name])
+        frames = [
+            (name, changed_by_name[name] if name in changed_by_name else unchanged[name])
+            for name in sheet_names
+        ]
+        self._stream_workbook(filepath, frames)
+        return sheet_names
+
+    def _stream_workbook(self, filepath: str, frames: List[Tuple[str, pd.DataFrame]]) -> None:
+        """write-only 통합 문서에 시트를 순서대로 기록"""
+        workbook = Workbook(write_only=True)
+        for sheet_name, df in frames:
+            worksheet = workbook.create_sheet(sheet_name)
+            # write-only 시트는 행 기록 전에 컬럼 너비를 지정해야 함
+            for idx, width in enumerate(self._column_widths(df), start=1):
+                worksheet.column_dimensions[get_column_letter(idx)].width = width
+
+            header = []
+            for col in df.columns:
+                cell = WriteOnlyCell(worksheet, value=str(col))
+                cell.font = Font(bold=True)
+                cell.alignment = Alignment(horizontal="center", vertical="top")
+                header.append(cell)
+            worksheet.append(header)
+            for row in self._iter_rows(df):
+                worksheet.append(row)
+        with atomic_write(filepath) as tmp_path:
+            workbook.save(tmp_path)
+
+    @classmethod
+    def _fill_worksheet(cls, worksheet, df: pd.DataFrame) -> None:
+        """DataFrame을 시트에 기록 (pandas to_excel과 같은 헤더 스타일, 결측값은 빈 셀)"""
+        worksheet.append([str(col) for col in df.columns])
+        for cell in worksheet[1]:
+            cell.font = Font(bold=True)
+            cell.alignment = Alignment(horizontal="center", vertical="top")
+        for row in cls._iter_rows(df):
+            worksheet.append(row)
+
+    @staticmethod
+    def _iter_rows(df: pd.DataFrame, chunk_size: int = 5000):
+        """셀 값 행 단위 생성 (결측값은 None, 변환 사본은 청크 단위로만 유지)"""
+        for start in range(0, len(df), chunk_size):
+            chunk = df.iloc[start:start + chunk_size]
+            values = chunk.astype(object).where(chunk.notna(), None)
+            yield from values.itertuples(index=False, name=None)
+
+    def _read_sheets(self, filepath: str, sheet_names: List[str]) -> Dict[str, pd.DataFrame]:
+        """필요한 시트만 읽기 (파일이 바뀌지 않았으면 로더 캐시 사용)"""
+        return self.loader.read_sheets(filepath, sheet_names)
+
+    def _remember(
+        self, filepath: str, sheet_names: List[str], written: Dict[int, pd.DataFrame], replace: bool = False
+    ) -> None:
+        """기록한 시트를 로더 캐시에 반영 (다음 export에서 재로드 생략)"""
+        self.loader.remember(
+            filepath, sheet_names, {self._sheet_name(year): df for year, df in written.items()}, replace=replace
+        )
+
+    def _stored_hashes(self, filepath: str, existing_sheets: Dict[str, pd.DataFrame]) -> Dict[str, str]:
+        """
+        기존 통합 문서의 시트 해시
+
+        사이드카가 없거나 통합 문서가 사이드카 기록 이후 바뀌었으면(Drive에서 내려받은 파일 등)
+        사이드카 대신 이미 읽은 시트 내용으로 해시를 계산합니다.
+        """
+        stored_hashes = dict(self._load_manifest(filepath).get("sheets", {}))
+        for sheet_name, df in existing_sheets.items():
+            if sheet_name not in stored_hashes:
+                stored_hashes[sheet_name] = self._content_hash(df)
+        return stored_hashes
+
+    def _rendered_hashes(self, filepath: str) -> Dict[str, str]:
+        """
+        render 비교용 전체 시트 해시
+
+        사이드카가 유효하지 않으면 통합 문서의 연도 시트를 읽어 계산하고 사이드카를 갱신합니다.
+        """
+        manifest = self._load_manifest(filepath)
+        if "sheets" in manifest:
+            return manifest["sheets"]
+        sheet_hashes = {
+            self._sheet_name(year): self._content_hash(sort_by_listing_date(df))
+            for year, df in self.loader.load_years(filepath).items()
+        }
+        self._save_manifest(filepath, sheet_hashes)
+        return sheet_hashes
+
+    def _load_manifest(self, filepath: str) -> Dict:
+        """시트 해시 사이드카 로드 (엑셀 파일이 외부에서 바뀌었으면 무효)"""
+        manifest_path = self._manifest_path(filepath)
+        if not manifest_path.exists():
+            return {}
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if tuple(manifest.get("signature", ())) != self._file_signature(filepath):
+            return {}
+        return manifest
+
+    def _save_manifest(self, filepath: str, sheet_hashes: Dict[str, str]) -> None:
+        manifest = {"signature": list(self._file_signature(filepath)), "sheets": sheet_hashes}
+        with atomic_write(self._manifest_path(filepath)) as tmp_path:
+            tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    @staticmethod
+    def _manifest_path(filepath: str) -> Path:
+        path = Path(filepath)
+        return path.with_name(f".{path.name}.sheets.json")
+
+    @staticmethod
+    def _file_signature(filepath: str) -> Tuple[int, int]:
+        stat = os.stat(filepath)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _sheet_name(year: int) -> str:
+        return f"{year}년"
+
+    @staticmethod
+    def _sheet_year(sheet_name: str) -> Optional[int]:
+        """"2024년" 등에서 연도 추출 (연도 시트가 아니면 None)"""
+        return sheet_year(sheet_name)
+
+    @staticmethod
+    def _sheet_position(sheet_names: List[str], year: int) -> int:
+        """연도 오름차순을 유지하는 새 시트 위치"""
+        for position, name in enumerate(sheet_names):
+            sheet_year = ExcelExporter._sheet_year(name)
+            if sheet_year is not None and sheet_year > year:
+                return position
+        return len(sheet_names)
+
+    @staticmethod
+    def _content_hash(df: pd.DataFrame) -> str:
+        """
+        시트 내용 해시
+
+        엑셀 왕복 시 dtype이 바뀌어도(Int64 -> float64, 숫자 문자열 등) 같은 값이면
+        같은 해시가 되도록 숫자로 해석 가능한 컬럼은 실수로 정규화하여 계산합니다.
+        """
+        canonical = {}
+        for col in df.columns:
+            values = df[col]
+            numeric = pd.to_numeric(values, errors='coerce')
+            if numeric.notna().sum() == values.notna().sum():
+                canonical[str(col)] = numeric.astype('Float64').astype(str)
+            else:
+                canonical[str(col)] = values.astype(object).where(values.notna(), None).astype(str)
+
+        digest = hashlib.sha1("\x1f".join(map(str, df.columns)).encode("utf-8"))
+        if canonical:
+            frame = pd.DataFrame(canonical)
+            digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _adjust_column_width(self, worksheet, df: pd.DataFrame) -> None:
         """컬럼 너비 자동 조정"""
-        worksheet = writer.sheets[sheet_name]
-        for idx, col in enumerate(df.columns):
-            # 헤더 길이와 데이터 길이 중 최대값 계산
+        for idx, width in enumerate(self._column_widths(df), start=1):
+            worksheet.column_dimensions[get_column_letter(idx)].width = width
+
+    @classmethod
+    def _column_widths(cls, df: pd.DataFrame) -> List[int]:
+        """
+        컬럼별 너비 계산 (헤더 길이와 상위 WIDTH_SAMPLE_ROWS개 행의 UTF-8 바이트 길이 기준)
+
+        한글을 고려하여 바이트 길이 * 0.8, 최소 10 / 최대 50
+        """
+        sample = df.head(cls.WIDTH_SAMPLE_ROWS)
+        widths = []
+        for position, col in enumerate(df.columns):
             max_len = len(str(col))
-            
-            # 데이터 샘플링 (최대 50개 행만 검사하여 속도 향상)
-            sample_values = df[col].astype(str).head(50)
-            if not sample_values.empty:
-                max_data_len = sample_values.map(lambda x: len(str(x).encode('utf-8'))).max()
-                # 한글 고려하여 적절히 조정 (단순 길이 * 1.2 정도)
-                max_len = max(max_len, int(max_data_len * 0.8))
-            
-            # 너비 설정 (최소 10, 최대 50)
-            width = min(max(max_len + 2, 10), 50)
-            worksheet.column_dimensions[chr(65 + idx)].width = width
+            if not sample.empty:
+                byte_lengths = sample.iloc[:, position].astype(str).str.encode('utf-8').str.len()
+                max_len = max(max_len, int(byte_lengths.max() * 0.8))
+            widths.append(min(max(max_len + 2, 10), 50))
+        return widths
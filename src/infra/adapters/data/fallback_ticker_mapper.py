@@ -0,0 +1,27 @@
+"""
+보조 티커 조회 어댑터 구현
+"""
+from typing import Optional
+
+from core.ports.enrichment_ports import TickerMapperPort
+
+
+class FallbackTickerMapper(TickerMapperPort):
+    """
+    주 어댑터가 티커를 찾지 못하면 보조 어댑터로 재조회하는 어댑터
+
+    주 어댑터(KRX 직접 조회)의 종목 목록 요청이 실패한 경우에도
+    보조 어댑터(PyKrx)로 티커를 찾을 수 있도록 합니다.
+    """
+
+    def __init__(self, primary: TickerMapperPort, fallback: TickerMapperPort):
+        """
+        Args:
+            primary: 우선 조회할 어댑터
+            fallback: 주 어댑터가 None을 반환할 때 조회할 어댑터
+        """
+        self.primary = primary
+        self.fallback = fallback
+
+    def get_ticker(self, stock_name: str) -> Optional[str]:
+        return self.primary.get_ticker(stock_name) or self.fallback.get_ticker(stock_name)
@@ -0,0 +1,71 @@
+import threading
+from typing import Optional, Dict
+from datetime import date
+import pandas as pd
+import FinanceDataReader as fdr
+
+from core.ports.enrichment_ports import TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort
+from infra.adapters.parsing.text import StockNameIndex
+
+class FDRAdapter(TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort):
+    """
+    FinanceDataReader를 사용한 데이터 제공 어댑터
+    (PyKrx 장애/지연 시 대체 시세 제공자로 사용)
+    """
+
+    def __init__(self):
+        self._listing: Optional[StockNameIndex] = None
+        self._listing_lock = threading.Lock()
+
+    def get_ticker(self, stock_name: str) -> Optional[str]:
+        """
+        종목명으로 티커 조회 (KRX 전체 상장 목록, 최초 1회 로드)
+        표기 차이(공백, 괄호, (주), 영문/한글 약칭)는 종목명 인덱스가 흡수
+        """
+        listing = self._get_listing()
+        return listing.lookup(stock_name) if listing else None
+
+    def get_ohlc(self, ticker: str, target_date: date) -> Optional[Dict[str, int]]:
+        """
+        특정 날짜의 OHLC 데이터 조회
+        """
+        df = self.get_ohlcv_range(ticker, target_date, target_date)
+        if df is None:
+            return None
+
+        row = df.iloc[0]
+        return {
+            "Open": int(row['Open']),
+            "High": int(row['High']),
+            "Low": int(row['Low']),
+            "Close": int(row['Close'])
+        }
+
+    def get_ohlcv_range(self, ticker: str, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+        """
+        기간 OHLCV 데이터 조회 (단일 요청)
+        """
+        try:
+            df = fdr.DataReader(ticker, start_date.isoformat(), end_date.isoformat())
+            if df is None or df.empty:
+                return None
+
+            df = df[['Open', 'High', 'Low', 'Close', 'Volume']]
+
+            # 0원 행은 거래 없음으로 간주 (거래 정지 등)
+            df = df[~((df['Open'] == 0) & (df['Close'] == 0))]
+            return df if not df.empty else None
+        except Exception:
+            return None
+
+    def _get_listing(self) -> Optional[StockNameIndex]:
+        """KRX 상장 종목명 인덱스 (지연 로드, 캐시)"""
+        if self._listing is None:
+            with self._listing_lock:
+                if self._listing is None:
+                    try:
+                        listing = fdr.StockListing('KRX')
+                        self._listing = StockNameIndex(zip(listing['Name'], listing['Code']))
+                    except Exception:
+                        return None
+        return self._listing
@@ -0,0 +1,194 @@
+"""
+헤지(Hedged) 요청 기반 복합 시세 어댑터 구현
+"""
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+import pandas as pd
+
+from core.ports.enrichment_ports import MarketDataProviderPort, PriceHistoryProviderPort
+from infra.adapters.data.concurrency_limited_adapter import ConcurrencyLimitedAdapter
+
+
+class LatencyStats:
+    """
+    제공자별 최근 응답 지연 통계 (스레드 안전)
+    """
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.wins = 0
+        self.failures = 0
+
+    def record(self, latency: float, success: bool) -> None:
+        with self._lock:
+            self._samples.append(latency)
+            self.calls += 1
+            if not success:
+                self.failures += 1
+
+    def record_win(self) -> None:
+        with self._lock:
+            self.wins += 1
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """최근 지연 시간의 pct 백분위수 (초, nearest-rank). 표본이 없으면 None"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = math.ceil(pct / 100 * len(samples))
+        return samples[min(len(samples), max(1, rank)) - 1]
+
+    def sample_count(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """통계 요약"""
+        return {
+            "calls": self.calls,
+            "wins": self.wins,
+            "failures": self.failures,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class HedgedMarketDataAdapter(MarketDataProviderPort, PriceHistoryProviderPort):
+    """
+    여러 시세 제공자(PyKrx, FinanceDataReader 등)를 묶는 복합 어댑터
+
+    동작:
+    1. 우선순위가 가장 높은 제공자에 요청
+    2. 해당 제공자의 최근 지연 백분위수(hedge_percentile)를 넘기도록 응답이 없으면
+       다음 제공자에 헤지 요청을 추가로 전송
+    3. 가장 먼저 도착한 유효한 응답을 사용 (실패/빈 응답이면 즉시 다음 제공자로 대체)
+    """
+
+    def __init__(
+        self,
+        providers: List[Tuple[str, Any]],
+        hedge_percentile: float = 90.0,
+        default_hedge_delay: float = 1.0,
+        min_samples: int = 10,
+        max_workers: int = 8
+    ):
+        """
+        Args:
+            providers: [(이름, 제공자)] 우선순위 순서. 제공자는 MarketDataProviderPort
+                       (기간 조회 시 PriceHistoryProviderPort)를 구현해야 함
+            hedge_percentile: 헤지 요청 기준 지연 백분위수
+            default_hedge_delay: 통계 표본이 부족할 때 사용할 헤지 대기 시간 (초)
+            min_samples: 백분위수 사용을 위한 최소 표본 수
+            max_workers: 요청 실행 스레드 수
+        """
+        if not providers:
+            raise ValueError("최소 1개 이상의 시세 제공자가 필요합니다.")
+        self.providers = providers
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.min_samples = min_samples
+        self.stats: Dict[str, LatencyStats] = {name: LatencyStats() for name, _ in providers}
+        self.hedged_requests = 0
+        self._hedge_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedged-md")
+
+    def get_ohlc(self, ticker: str, target_date: date) -> Optional[Dict[str, int]]:
+        return self._hedged_call(lambda provider: provider.get_ohlc(ticker, target_date))
+
+    def get_ohlcv_range(self, ticker: str, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+        return self._hedged_call(lambda provider: provider.get_ohlcv_range(ticker, start_date, end_date))
+
+    def latency_report(self) -> Dict[str, Dict[str, Any]]:
+        """제공자별 지연/승리 통계"""
+        return {name: stats.snapshot() for name, stats in self.stats.items()}
+
+    def shutdown(self) -> None:
+        """실행 스레드 정리"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "HedgedMarketDataAdapter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def _hedge_delay(self, name: str) -> float:
+        """제공자의 헤지 대기 시간 (지연 백분위수 기반)"""
+        stats = self.stats[name]
+        if stats.sample_count() < self.min_samples:
+            return self.default_hedge_delay
+        return stats.percentile(self.hedge_percentile) or self.default_hedge_delay
+
+    def _submit(self, name: str, provider: Any, call: Callable[[Any], Any]) -> Future:
+        """
+        지연 시간을 기록하며 제공자 호출
+
+        제공자가 ConcurrencyLimitedAdapter이면 동시 호출 제한 대기 시간은 지연 통계에서 제외합니다.
+        (대기열 적체로 헤지 기준 지연이 늘어나 부하 시 헤지가 늦어지는 것을 방지)
+        """
+        def run():
+            started = time.perf_counter()
+            try:
+                result = call(provider)
+            except Exception:
+                result = None
+            latency = time.perf_counter() - started
+            if isinstance(provider, ConcurrencyLimitedAdapter):
+                latency -= provider.last_queue_wait()
+            self.stats[name].record(max(0.0, latency), self._is_valid(result))
+            return result
+        return self._executor.submit(run)
+
+    def _hedged_call(self, call: Callable[[Any], Any]) -> Any:
+        """헤지 요청 실행: 가장 먼저 도착한 유효 응답 반환"""
+        pending: Dict[Future, str] = {}
+        remaining = list(self.providers)
+
+        def launch_next() -> bool:
+            if not remaining:
+                return False
+            name, provider = remaining.pop(0)
+            pending[self._submit(name, provider, call)] = name
+            return True
+
+        launch_next()
+        while pending:
+            # 가장 최근에 시작한 제공자 기준으로 헤지 대기
+            latest_name = list(pending.values())[-1]
+            timeout = self._hedge_delay(latest_name) if remaining else None
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # 지연 백분위수 초과 -> 헤지 요청
+                if launch_next():
+                    with self._hedge_lock:
+                        self.hedged_requests += 1
+                continue
+
+            for future in done:
+                name = pending.pop(future)
+                result = future.result()
+                if self._is_valid(result):
+                    self.stats[name].record_win()
+                    return result
+                # 실패/빈 응답 -> 다음 제공자로 즉시 대체
+                if not pending:
+                    launch_next()
+        return None
+
+    @staticmethod
+    def _is_valid(result: Any) -> bool:
+        if result is None:
+            return False
+        if isinstance(result, pd.DataFrame):
+            return not result.empty
+        return bool(result)
@@ -0,0 +1,118 @@
+"""
+시세 보강 보류 큐 JSON 파일 어댑터 구현
+"""
+import json
+import os
+import shutil
+import threading
+from dataclasses import asdict, replace
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from core.domain.models import PendingEnrichment
+from core.domain.listing_date import parse_listing_date
+from core.ports.enrichment_ports import PendingEnrichmentQueuePort
+from infra.adapters.utils.file_lock import FileLock, atomic_write
+from config import config
+
+
+class JsonPendingEnrichmentQueue(PendingEnrichmentQueuePort):
+    """
+    보류 종목을 JSON 파일로 영속화하는 큐
+
+    - 키: (종목명, 상장일). 같은 키로 다시 추가하면 최신 정보로 갱신 (시도 횟수는 유지)
+    - 파일은 임시 파일에 쓴 뒤 교체하여 중간 상태가 남지 않도록 함
+    - 읽기 -> 변경 -> 쓰기는 권고 파일 잠금(<파일명>.lock) 안에서 수행 (동시 실행 간 갱신 유실 방지)
+    """
+
+    def __init__(self, path: Union[str, Path] = None, lock_timeout: float = None):
+        self.path = Path(path) if path else config.OUTPUT_DIR / config.PENDING_ENRICHMENT_FILENAME
+        self.lock_timeout = config.DATASET_LOCK_TIMEOUT if lock_timeout is None else lock_timeout
+        self._lock = threading.Lock()
+
+    def enqueue(self, items: List[PendingEnrichment]) -> None:
+        if not items:
+            return
+        with self._lock, self._file_lock():
+            entries = self._load()
+            for item in items:
+                key = self._key(item)
+                if key in entries and item.attempts == 0:
+                    item = replace(item, attempts=entries[key].attempts)
+                entries[key] = item
+            self._save(entries)
+
+    def due(self, as_of: date) -> List[PendingEnrichment]:
+        with self._lock:
+            entries = self._load()
+        due_items = []
+        for item in entries.values():
+            listing_date = parse_listing_date(item.listing_date)
+            if listing_date is not None and listing_date <= as_of:
+                due_items.append(item)
+        return due_items
+
+    def remove(self, items: List[PendingEnrichment]) -> None:
+        if not items:
+            return
+        with self._lock, self._file_lock():
+            entries = self._load()
+            for item in items:
+                entries.pop(self._key(item), None)
+            self._save(entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def _file_lock(self) -> FileLock:
+        """큐 파일 잠금 (<파일명>.lock)"""
+        return FileLock(self.path.with_suffix(".lock"), timeout=self.lock_timeout)
+
+    def _load(self) -> Dict[Tuple[str, str], PendingEnrichment]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                raw = json.load(f)
+            if not isinstance(raw, list):
+                raise ValueError("최상위 값이 목록이 아닙니다")
+        except (OSError, ValueError) as e:
+            # 다음 저장이 덮어쓰지 않도록 손상된 파일을 옆으로 옮겨 보존
+            backup = self._preserve_corrupt(move=True)
+            print(f"      [경고] 보류 큐 파일 로드 실패 (빈 큐로 시작, 원본 보존: {backup}): {e}")
+            return {}
+
+        entries = {}
+        invalid = 0
+        for record in raw:
+            try:
+                item = PendingEnrichment(**record)
+            except TypeError as e:
+                invalid += 1
+                print(f"      [경고] 보류 큐 항목 무시: {record!r} ({e})")
+                continue
+            entries[self._key(item)] = item
+        if invalid:
+            # 무시한 항목은 다음 저장에서 빠지므로 원본 파일 사본을 남김
+            self._preserve_corrupt(move=False)
+        return entries
+
+    def _preserve_corrupt(self, move: bool) -> Path:
+        """손상된 큐 파일을 <파일명>.corrupt로 이동(또는 복사)하고 경로 반환"""
+        backup = self.path.with_suffix(self.path.suffix + ".corrupt")
+        if move:
+            os.replace(self.path, backup)
+        else:
+            shutil.copy2(self.path, backup)
+        return backup
+
+    def _save(self, entries: Dict[Tuple[str, str], PendingEnrichment]) -> None:
+        with atomic_write(self.path) as tmp_path:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump([asdict(item) for item in entries.values()], f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def _key(item: PendingEnrichment) -> Tuple[str, str]:
+        return item.name, str(item.listing_date)
@@ -0,0 +1,48 @@
+"""
+변경 피드 JSONL 파일 어댑터 구현
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Union
+
+from core.ports.data_ports import ChangeFeedPort
+from config import config
+
+
+class JsonlChangeFeed(ChangeFeedPort):
+    """
+    실행(run)마다 하나의 JSONL 파일에 변경 레코드를 기록하는 피드
+
+    경로: {directory}/changes_{run_id}.jsonl (변경이 없으면 파일을 만들지 않음)
+    한 줄에 하나의 레코드: {"run_id", "year", "op", "key", "after" | "changes"}
+    """
+
+    def __init__(self, directory: Union[str, Path] = None, run_id: str = None):
+        """
+        Args:
+            directory: 피드 디렉토리 (기본: OUTPUT_DIR/CHANGE_FEED_DIRNAME)
+            run_id: 실행 식별자 (기본: 현재 시각 YYYYMMDD_HHMMSS)
+        """
+        self.directory = Path(directory) if directory else config.OUTPUT_DIR / config.CHANGE_FEED_DIRNAME
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.path = self.directory / f"changes_{self.run_id}.jsonl"
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def append(self, year: int, changes: List[Dict]) -> None:
+        if not changes:
+            return
+        lines = [
+            json.dumps({"run_id": self.run_id, "year": int(year), **change}, ensure_ascii=False, default=str)
+            for change in changes
+        ]
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.count += len(lines)
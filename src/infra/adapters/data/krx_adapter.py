@@ -0,0 +1,212 @@
+"""
+KRX 정보데이터시스템 직접 조회 어댑터 구현
+"""
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from core.ports.enrichment_ports import TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort
+from infra.adapters.parsing.text import StockNameIndex
+
+
+class KrxListing(NamedTuple):
+    """상장 종목 식별 정보"""
+    ticker: str     # 단축코드 (ISU_SRT_CD)
+    isin: str       # 표준코드 (ISU_CD)
+    name: str       # 종목약명 (ISU_ABBRV)
+
+
+class KrxAdapter(TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort):
+    """
+    KRX 정보데이터시스템(data.krx.co.kr) JSON 엔드포인트를 직접 호출하는 어댑터
+
+    - 단일 keep-alive 세션(커넥션 풀) 재사용
+    - 필요한 엔드포인트만 호출: 전종목 기본정보(MDCSTAT01901), 개별종목 기간 시세(MDCSTAT01701)
+    - 응답 JSON을 바로 compact 구조(NamedTuple / dict / DataFrame)로 변환
+    """
+
+    BASE_URL = "http://data.krx.co.kr"
+    JSON_PATH = "/comm/bldAttendant/getJsonData.cmd"
+    LISTING_BLD = "dbms/MDC/STAT/standard/MDCSTAT01901"
+    OHLCV_BLD = "dbms/MDC/STAT/standard/MDCSTAT01701"
+
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0",
+        "Referer": "http://data.krx.co.kr/contents/MDC/MDI/mdiLoader",
+        "X-Requested-With": "XMLHttpRequest",
+    }
+
+    def __init__(
+        self,
+        base_url: str = None,
+        timeout: float = 10.0,
+        pool_size: int = 4,
+        listing_ttl: float = 600.0,
+        listing_retry_after: float = 300.0,
+        adjusted: bool = True
+    ):
+        """
+        Args:
+            base_url: KRX 주소 (테스트 시 스텁 서버 주소)
+            timeout: 요청 타임아웃 (초)
+            pool_size: 커넥션 풀 크기
+            listing_ttl: 종목 목록 캐시 유효 시간 (초). 목록에 없는 종목명 조회 시 만료된 경우에만 재조회
+            listing_retry_after: 종목 목록 조회 실패 후 재시도까지 대기 시간 (초).
+                KRX 장애 시 종목마다 목록 요청이 반복되지 않도록 실패를 이 시간 동안 캐시
+            adjusted: 수정주가 사용 여부 (pykrx 기본값과 동일하게 True)
+        """
+        self.url = (base_url or self.BASE_URL).rstrip("/") + self.JSON_PATH
+        self.timeout = timeout
+        self.listing_ttl = listing_ttl
+        self.listing_retry_after = listing_retry_after
+        self.adjusted = adjusted
+
+        self._session = requests.Session()
+        self._session.headers.update(self.HEADERS)
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=frozenset({"POST"}))
+        http_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self._session.mount("http://", http_adapter)
+        self._session.mount("https://", http_adapter)
+
+        self._by_name: Optional[Dict[str, KrxListing]] = None
+        self._by_ticker: Dict[str, KrxListing] = {}
+        self._name_index = StockNameIndex(())
+        self._loaded_at = 0.0
+        self._failed_at: Optional[float] = None
+        self._listing_lock = threading.Lock()
+
+    def get_ticker(self, stock_name: str) -> Optional[str]:
+        """
+        종목명으로 티커 조회 (전종목 목록 1회 로드 후 캐시)
+        """
+        listing = self._find_listing(stock_name)
+        if listing is None and self._listing_expired():
+            # 신규 상장 종목이 캐시 이후 추가되었을 수 있으므로 1회 재조회
+            self._load_listing(force=True)
+            listing = self._find_listing(stock_name)
+        return listing.ticker if listing else None
+
+    def get_ohlc(self, ticker: str, target_date: date) -> Optional[Dict[str, int]]:
+        """
+        특정 날짜의 OHLC 데이터 조회
+        """
+        rows = self._fetch_ohlcv_rows(ticker, target_date, target_date)
+        if not rows:
+            return None
+        row = rows[0]
+        return {"Open": row[1], "High": row[2], "Low": row[3], "Close": row[4]}
+
+    def get_ohlcv_range(self, ticker: str, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+        """
+        기간 OHLCV 데이터 조회 (단일 요청)
+        """
+        rows = self._fetch_ohlcv_rows(ticker, start_date, end_date)
+        if not rows:
+            return None
+        df = pd.DataFrame(rows, columns=["Date", "Open", "High", "Low", "Close", "Volume"])
+        return df.set_index(pd.DatetimeIndex(df.pop("Date"))).sort_index()
+
+    def close(self) -> None:
+        """커넥션 풀 정리"""
+        self._session.close()
+
+    def _fetch_ohlcv_rows(self, ticker: str, start_date: date, end_date: date) -> List[tuple]:
+        """개별종목 기간 시세 -> [(거래일, 시가, 고가, 저가, 종가, 거래량)] (0원 행 제외)"""
+        listing = self._get_by_ticker(ticker)
+        if listing is None:
+            return []
+        try:
+            payload = self._post({
+                "bld": self.OHLCV_BLD,
+                "isuCd": listing.isin,
+                "strtDd": start_date.strftime("%Y%m%d"),
+                "endDd": end_date.strftime("%Y%m%d"),
+                "adjStkPrc_check": "Y" if self.adjusted else "",
+                "adjStkPrc": "2" if self.adjusted else "1",
+                "share": "1",
+                "money": "1",
+                "csvxls_isNo": "false",
+            })
+        except Exception:
+            return []
+
+        rows = []
+        for record in payload.get("output", []):
+            try:
+                row = (
+                    datetime.strptime(record["TRD_DD"], "%Y/%m/%d"),
+                    self._to_int(record["TDD_OPNPRC"]),
+                    self._to_int(record["TDD_HGPRC"]),
+                    self._to_int(record["TDD_LWPRC"]),
+                    self._to_int(record["TDD_CLSPRC"]),
+                    self._to_int(record.get("ACC_TRDVOL", "0")),
+                )
+            except (KeyError, ValueError):
+                continue
+            # 0원 행은 거래 없음으로 간주 (거래 정지 등)
+            if row[1] == 0 and row[4] == 0:
+                continue
+            rows.append(row)
+        rows.sort(key=lambda r: r[0])
+        return rows
+
+    def _find_listing(self, stock_name: str) -> Optional[KrxListing]:
+        """종목명 인덱스 조회 (표기 차이는 정규화/근사 검색으로 흡수)"""
+        self._load_listing()
+        ticker = self._name_index.lookup(stock_name)
+        return self._by_ticker.get(ticker) if ticker else None
+
+    def _get_by_ticker(self, ticker: str) -> Optional[KrxListing]:
+        self._load_listing()
+        return self._by_ticker.get(ticker)
+
+    def _listing_expired(self) -> bool:
+        return time.monotonic() - self._loaded_at > self.listing_ttl
+
+    def _load_listing(self, force: bool = False) -> Dict[str, KrxListing]:
+        """전종목 기본정보 {종목약명: KrxListing} (지연 로드, 캐시)"""
+        if self._by_name is not None and not force:
+            return self._by_name
+        with self._listing_lock:
+            if self._by_name is not None and not (force and self._listing_expired()):
+                return self._by_name
+            if self._failed_at is not None and time.monotonic() - self._failed_at < self.listing_retry_after:
+                # 최근 실패: 재시도 대기 시간 동안 요청하지 않음
+                return self._by_name or {}
+            try:
+                payload = self._post({
+                    "bld": self.LISTING_BLD, "mktId": "ALL", "share": "1", "csvxls_isNo": "false",
+                })
+            except Exception as e:
+                self._failed_at = time.monotonic()
+                print(f"      [경고] KRX 종목 목록 조회 실패 ({self.listing_retry_after:.0f}초간 재시도 안 함): {e}")
+                return self._by_name or {}
+
+            listings = [
+                KrxListing(r["ISU_SRT_CD"], r["ISU_CD"], r["ISU_ABBRV"])
+                for r in payload.get("OutBlock_1", [])
+                if r.get("ISU_SRT_CD") and r.get("ISU_CD")
+            ]
+            self._by_ticker = {listing.ticker: listing for listing in listings}
+            self._by_name = {listing.name: listing for listing in listings}
+            self._name_index = StockNameIndex((listing.name, listing.ticker) for listing in listings)
+            self._loaded_at = time.monotonic()
+            self._failed_at = None
+            return self._by_name
+
+    def _post(self, form: Dict[str, str]) -> Dict[str, Any]:
+        response = self._session.post(self.url, data=form, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _to_int(value: str) -> int:
+        """'1,234' / '-' 형식의 숫자 문자열 변환"""
+        text = str(value).replace(",", "").strip()
+        return int(float(text)) if text not in ("", "-") else 0
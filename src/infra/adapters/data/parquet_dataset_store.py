@@ -0,0 +1,171 @@
+"""
+Parquet 연도 파티션 데이터셋 저장소 구현
+"""
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from core.domain.schema import migrate_legacy_columns
+from core.ports.data_ports import ChangeFeedPort, DatasetStorePort
+from infra.adapters.data.dataset_dtypes import apply_dtypes, is_integral
+from infra.adapters.data.dataset_merge import diff_frames, merge_frames, sort_by_listing_date
+from infra.adapters.data.workbook_loader import WorkbookLoader
+from infra.adapters.utils.file_lock import FileLock, atomic_write
+from config import config
+
+
+class ParquetDatasetStore(DatasetStorePort):
+    """
+    연도별로 분할된 Parquet 데이터셋 (정본 저장소)
+
+    구조: {root}/year=2024/data.parquet
+    - export: 대상 연도 파티션만 읽어 병합 후 교체 (다른 연도는 건드리지 않음)
+    - 컬럼 타입은 저장 시 정규화 (숫자 컬럼 -> Int64/Float64, 그 외 -> string)
+    - 데이터셋이 비어 있으면 최초 접근 시 기존 엑셀 통합 문서에서 1회 가져옴 (seed_workbook)
+    - 병합/쓰기는 데이터셋 잠금({root}/.lock) 안에서 수행, 파티션은 원자적으로 교체
+    """
+
+    PARTITION_FILENAME = "data.parquet"
+
+    def __init__(
+        self, root: Union[str, Path] = None, seed_workbook: Union[str, Path] = None,
+        loader: WorkbookLoader = None, change_feed: ChangeFeedPort = None
+    ):
+        """
+        Args:
+            root: 데이터셋 디렉토리 (기본: OUTPUT_DIR/DATASET_DIRNAME)
+            seed_workbook: 데이터셋이 비어 있을 때 가져올 엑셀 통합 문서 경로
+            loader: 통합 문서 로더 (seed_workbook 읽기용)
+            change_feed: 변경 피드 (추가/변경 행 기록, 선택)
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "Parquet 데이터셋 저장소를 사용하려면 pyarrow가 필요합니다. (pip install pyarrow)"
+            )
+        self.root = Path(root) if root else config.OUTPUT_DIR / config.DATASET_DIRNAME
+        self.seed_workbook = Path(seed_workbook) if seed_workbook else None
+        self.loader = loader or WorkbookLoader()
+        self.change_feed = change_feed
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = FileLock(self.root / ".lock", timeout=config.DATASET_LOCK_TIMEOUT)
+
+        # 파티션 캐시: 파일 서명(mtime, size)이 같을 때만 유효
+        self._cache: Dict[int, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+        self._seeded = False
+
+    def export(self, data: Dict[int, pd.DataFrame]) -> None:
+        if not data:
+            return
+        with self._lock:
+            self._seed_if_empty()
+            self._export(data)
+
+    def _export(self, data: Dict[int, pd.DataFrame]) -> None:
+        for year, new_df in sorted(data.items()):
+            existing_df = self._read_partition(year)
+            if existing_df is not None:
+                combined_df = merge_frames(existing_df, new_df)
+                print(f"      [병합 완료] {year}년: 총 {len(combined_df)}건 (기존 {len(existing_df)} + 신규 {len(new_df)})")
+            else:
+                combined_df = new_df
+            combined_df = sort_by_listing_date(combined_df)
+            self._write_partition(year, combined_df)
+            if self.change_feed is not None:
+                self.change_feed.append(year, diff_frames(existing_df, combined_df))
+
+        print(f"      [저장 완료] {self.root} ({len(data)}개 연도 파티션)")
+
+    def load(self, years: Optional[Iterable[int]] = None) -> Dict[int, pd.DataFrame]:
+        self._seed_if_empty()
+        targets = sorted(years) if years is not None else self.years()
+        loaded = {}
+        for year in targets:
+            df = self._read_partition(year)
+            if df is not None:
+                loaded[year] = df
+        return loaded
+
+    def years(self) -> List[int]:
+        """저장된 연도 목록 (오름차순)"""
+        years = []
+        for path in self.root.glob(f"year=*/{self.PARTITION_FILENAME}"):
+            try:
+                years.append(int(path.parent.name.split("=", 1)[1]))
+            except ValueError:
+                continue
+        return sorted(years)
+
+    def _seed_if_empty(self) -> None:
+        """데이터셋이 비어 있으면 기존 엑셀 통합 문서에서 가져오기 (최초 1회)"""
+        if self._seeded:
+            return
+        self._seeded = True
+        if self.years() or not self.seed_workbook or not self.seed_workbook.exists():
+            return
+
+        with self._lock:
+            # 잠금 대기 중 다른 작업이 먼저 가져왔을 수 있으므로 재확인
+            if not self.years():
+                self._seed()
+
+    def _seed(self) -> None:
+        print(f"      [정보] 데이터셋이 비어 있어 기존 통합 문서에서 가져옵니다: {self.seed_workbook}")
+        for year, df in self.loader.load_years(self.seed_workbook).items():
+            self._write_partition(year, df)
+
+    def _partition_path(self, year: int) -> Path:
+        return self.root / f"year={year}" / self.PARTITION_FILENAME
+
+    def _read_partition(self, year: int) -> Optional[pd.DataFrame]:
+        path = self._partition_path(year)
+        if not path.exists():
+            return None
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(year)
+        if cached is None or cached[0] != signature:
+            cached = (signature, migrate_legacy_columns(pd.read_parquet(path)))
+            self._cache[year] = cached
+        return cached[1].copy()
+
+    def _write_partition(self, year: int, df: pd.DataFrame) -> None:
+        """파티션 교체 (임시 파일에 쓴 뒤 이름 변경)"""
+        path = self._partition_path(year)
+        os.makedirs(path.parent, exist_ok=True)
+        typed = apply_dtypes(self._normalize_types(df))
+        with atomic_write(path) as tmp_path:
+            typed.to_parquet(tmp_path, index=False)
+        stat = path.stat()
+        self._cache[year] = ((stat.st_mtime_ns, stat.st_size), typed)
+
+    @staticmethod
+    def _normalize_types(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        컬럼 타입 정규화 (엑셀/크롤링 결과의 object 컬럼을 Parquet 타입으로)
+
+        - 값이 모두 숫자로 해석되면 정수는 Int64, 그 외 Float64
+        - 나머지는 string
+        - category 컬럼은 그대로 유지 (Parquet 딕셔너리 인코딩)
+        """
+        typed = {}
+        for col in df.columns:
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                typed[str(col)] = values
+                continue
+            numeric = pd.to_numeric(values, errors='coerce')
+            if numeric.notna().sum() == values.notna().sum():
+                if numeric.notna().any() and is_integral(numeric):
+                    typed[str(col)] = numeric.astype('Int64')
+                else:
+                    typed[str(col)] = numeric.astype('Float64')
+            else:
+                typed[str(col)] = values.astype(object).where(values.notna(), None).astype('string')
+        return pd.DataFrame(typed, index=df.index).reset_index(drop=True)
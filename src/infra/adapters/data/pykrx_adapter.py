@@ -1,52 +1,32 @@
+import threading
 from pykrx import stock
 from typing import Optional, Dict
 from datetime import date
 import pandas as pd
 
-from core.ports.enrichment_ports import TickerMapperPort, MarketDataProviderPort
+from core.ports.enrichment_ports import TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort
+from infra.adapters.parsing.text import StockNameIndex
 
-class PyKrxAdapter(TickerMapperPort, MarketDataProviderPort):
+class PyKrxAdapter(TickerMapperPort, MarketDataProviderPort, PriceHistoryProviderPort):
     """
     PyKrx를 사용한 데이터 제공 어댑터
     (KRX 공식 데이터를 스크래핑하여 제공)
     """
     
+    MARKETS = ("KOSPI", "KOSDAQ", "KONEX")
+
+    def __init__(self):
+        self._name_index: Optional[StockNameIndex] = None
+        self._index_lock = threading.Lock()
+
     def get_ticker(self, stock_name: str) -> Optional[str]:
         """
         종목명으로 티커 조회
-        (KOSPI, KOSDAQ, KONEX 순차 검색)
+        (KOSPI, KOSDAQ, KONEX 전체 종목명 인덱스를 1회 구성 후 재사용,
+         표기 차이는 정규화/근사 검색으로 흡수)
         """
-        # 기준일은 오늘로 설정 (최신 종목 검색)
-        today = date.today().strftime("%Y%m%d")
-        
-        # 검색할 시장 목록
-        markets = ["KOSPI", "KOSDAQ", "KONEX"]
-        
-        # 1. 정확히 일치하는 경우 검색
-        for market in markets:
-            try:
-                tickers = stock.get_market_ticker_list(today, market=market)
-                for ticker in tickers:
-                    name = stock.get_market_ticker_name(ticker)
-                    if name == stock_name:
-                        return ticker
-            except Exception:
-                continue
-                
-        # 2. (주) 제거 등 간단한 정제 후 재검색
-        cleaned_name = stock_name.replace("(주)", "").strip()
-        if cleaned_name != stock_name:
-            for market in markets:
-                try:
-                    tickers = stock.get_market_ticker_list(today, market=market)
-                    for ticker in tickers:
-                        name = stock.get_market_ticker_name(ticker)
-                        if name == cleaned_name:
-                            return ticker
-                except Exception:
-                    continue
-                    
-        return None
+        name_index = self._get_name_index()
+        return name_index.lookup(stock_name) if name_index else None
 
     def get_ohlc(self, ticker: str, target_date: date) -> Optional[Dict[str, int]]:
         """
@@ -77,3 +57,43 @@ class PyKrxAdapter(TickerMapperPort, MarketDataProviderPort):
             }
         except Exception:
             return None
+
+    def get_ohlcv_range(self, ticker: str, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+        """
+        기간 OHLCV 데이터 조회 (단일 요청)
+        """
+        try:
+            df = stock.get_market_ohlcv(
+                start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d"), ticker
+            )
+            if df.empty:
+                return None
+
+            df = df.rename(columns={
+                '시가': 'Open', '고가': 'High', '저가': 'Low', '종가': 'Close', '거래량': 'Volume'
+            })[['Open', 'High', 'Low', 'Close', 'Volume']]
+
+            # 0원 행은 거래 없음으로 간주 (거래 정지 등)
+            df = df[~((df['Open'] == 0) & (df['Close'] == 0))]
+            return df if not df.empty else None
+        except Exception:
+            return None
+
+    def _get_name_index(self) -> Optional[StockNameIndex]:
+        """전체 시장 {종목명: 티커} 인덱스 (지연 로드, 캐시)"""
+        if self._name_index is None:
+            with self._index_lock:
+                if self._name_index is None:
+                    # 기준일은 오늘로 설정 (최신 종목 검색)
+                    today = date.today().strftime("%Y%m%d")
+                    entries = []
+                    for market in self.MARKETS:
+                        try:
+                            tickers = stock.get_market_ticker_list(today, market=market)
+                            entries.extend((stock.get_market_ticker_name(t), t) for t in tickers)
+                        except Exception:
+                            continue
+                    if not entries:
+                        return None
+                    self._name_index = StockNameIndex(entries)
+        return self._name_index
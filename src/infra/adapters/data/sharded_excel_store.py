@@ -0,0 +1,171 @@
+"""
+연도별 엑셀 파일(샤드) 데이터셋 저장소 구현
+"""
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+import pandas as pd
+
+from core.ports.data_ports import ChangeFeedPort, DatasetStorePort
+from infra.adapters.data.excel_exporter import ExcelExporter
+from infra.adapters.data.workbook_loader import WorkbookLoader
+from infra.adapters.utils.file_lock import FileLock, atomic_write
+from config import config
+
+
+class _CollectedChanges(ChangeFeedPort):
+    """작업 프로세스에서 변경 레코드를 모아 부모 프로세스로 돌려주기 위한 피드"""
+
+    def __init__(self):
+        self.records: List[Dict] = []
+
+    def append(self, year: int, changes: List[Dict]) -> None:
+        self.records.extend(changes)
+
+
+def _export_shard(root: str, filename: str, year: int, df: pd.DataFrame, write_engine: str) -> List[Dict]:
+    """샤드 1개 병합/저장 (프로세스 풀 작업 함수, 변경 레코드 반환)"""
+    collected = _CollectedChanges()
+    ExcelExporter(root, write_engine=write_engine, filename=filename, change_feed=collected).export({year: df})
+    return collected.records
+
+
+def _load_shard(path: str, year: int) -> Tuple[int, Optional[pd.DataFrame]]:
+    """샤드 1개 로드 (프로세스 풀 작업 함수)"""
+    return year, WorkbookLoader().load_years(path, [year]).get(year)
+
+
+class ShardedExcelStore(DatasetStorePort):
+    """
+    연도마다 별도 엑셀 파일에 저장하는 데이터셋 (정본 저장소)
+
+    구조: {root}/신규상장종목_2024.xlsx ... + {root}/manifest.json (연도 -> 파일, 갱신 시각)
+    - export: 전달된 연도의 샤드만 병합/기록 (당해 연도 일일 업데이트는 당해 연도 샤드만 갱신)
+    - 여러 샤드는 프로세스 풀에서 병렬로 읽고 씀 (샤드별 잠금/원자적 교체는 ExcelExporter가 처리)
+    - 통합 문서(신규상장종목.xlsx)는 render 명령 또는 업로드 시점에만 생성
+    - 샤드가 없으면 최초 접근 시 기존 통합 문서를 연도별로 나누어 가져옴 (seed_workbook)
+    """
+
+    MANIFEST_FILENAME = "manifest.json"
+
+    def __init__(
+        self, root: Union[str, Path] = None, max_workers: int = None, write_engine: str = None,
+        seed_workbook: Union[str, Path] = None, loader: WorkbookLoader = None,
+        change_feed: ChangeFeedPort = None
+    ):
+        """
+        Args:
+            root: 샤드 디렉토리 (기본: OUTPUT_DIR/SHARD_DIRNAME)
+            max_workers: 병렬 처리 프로세스 수 (기본: config.SHARD_MAX_WORKERS, 1이면 순차 처리)
+            write_engine: 엑셀 기록 방식 (기본: config.EXCEL_WRITE_ENGINE)
+            seed_workbook: 샤드가 없을 때 가져올 통합 문서 경로
+            loader: 통합 문서 로더 (seed_workbook 읽기용)
+            change_feed: 변경 피드 (추가/변경 행 기록, 선택)
+        """
+        self.root = Path(root) if root else config.OUTPUT_DIR / config.SHARD_DIRNAME
+        self.max_workers = max_workers or config.SHARD_MAX_WORKERS
+        self.write_engine = write_engine or config.EXCEL_WRITE_ENGINE
+        self.seed_workbook = Path(seed_workbook) if seed_workbook else None
+        self.loader = loader or WorkbookLoader()
+        self.change_feed = change_feed
+        self._seeded = False
+        os.makedirs(self.root, exist_ok=True)
+        self._manifest_lock = FileLock(self.root / f"{self.MANIFEST_FILENAME}.lock",
+                                       timeout=config.DATASET_LOCK_TIMEOUT)
+
+    def export(self, data: Dict[int, pd.DataFrame]) -> None:
+        if not data:
+            return
+        self._seed_if_empty()
+        self._export(data, publish=True)
+        print(f"      [저장 완료] {self.root} ({len(data)}개 연도 샤드)")
+
+    def _export(self, data: Dict[int, pd.DataFrame], publish: bool = False) -> None:
+        years = sorted(data)
+        jobs = [
+            (str(self.root), self.shard_filename(year), year, data[year], self.write_engine)
+            for year in years
+        ]
+        changes = self._run(_export_shard, jobs)
+
+        with self._manifest_lock:
+            manifest = self._load_manifest()
+            now = datetime.now().isoformat(timespec="seconds")
+            for year in years:
+                manifest[str(year)] = {"file": self.shard_filename(year), "updated_at": now}
+            self._save_manifest(manifest)
+
+        if publish and self.change_feed is not None:
+            for year, year_changes in zip(years, changes):
+                self.change_feed.append(year, year_changes)
+
+    def load(self, years: Optional[Iterable[int]] = None) -> Dict[int, pd.DataFrame]:
+        self._seed_if_empty()
+        manifest = self._load_manifest()
+        available = {int(year): entry["file"] for year, entry in manifest.items()}
+        targets = sorted(available) if years is None else [year for year in years if year in available]
+        jobs = [
+            (str(self.root / available[year]), year)
+            for year in targets if (self.root / available[year]).exists()
+        ]
+        loaded = dict(self._run(_load_shard, jobs))
+        return {year: loaded[year] for year in sorted(loaded) if loaded[year] is not None}
+
+    def years(self) -> List[int]:
+        """저장된 연도 목록 (오름차순)"""
+        return sorted(int(year) for year in self._load_manifest())
+
+    @staticmethod
+    def shard_filename(year: int) -> str:
+        """연도 샤드 파일명 (신규상장종목_2024.xlsx)"""
+        default = Path(config.get_default_filename())
+        return f"{default.stem}_{year}{default.suffix}"
+
+    def _seed_if_empty(self) -> None:
+        """샤드가 없으면 기존 통합 문서를 연도별 샤드로 나누어 가져오기 (최초 1회)"""
+        if self._seeded:
+            return
+        self._seeded = True
+        if self.years() or not self.seed_workbook or not self.seed_workbook.exists():
+            return
+        print(f"      [정보] 연도별 샤드가 없어 기존 통합 문서에서 가져옵니다: {self.seed_workbook}")
+        self._export(self.loader.load_years(self.seed_workbook))
+
+    def _run(self, fn: Callable[..., Any], jobs: List[tuple]) -> List[Any]:
+        """작업이 2개 이상이고 병렬 처리가 허용되면 프로세스 풀, 아니면 순차 실행"""
+        workers = min(self.max_workers, len(jobs))
+        if workers <= 1:
+            return [fn(*job) for job in jobs]
+        # spawn: 스레드(시세 조회, 브라우저)가 떠 있는 부모 프로세스를 fork하지 않음
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            return list(executor.map(fn, *zip(*jobs)))
+
+    def _load_manifest(self) -> Dict[str, Dict[str, str]]:
+        path = self.root / self.MANIFEST_FILENAME
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"      [경고] 샤드 매니페스트 로드 실패 (디렉토리에서 재구성): {e}")
+            return self._scan_shards()
+
+    def _scan_shards(self) -> Dict[str, Dict[str, str]]:
+        """매니페스트가 손상된 경우 샤드 파일 이름으로 목록 재구성"""
+        stem = Path(config.get_default_filename()).stem
+        manifest = {}
+        for path in sorted(self.root.glob(f"{stem}_*.xlsx")):
+            year = path.stem[len(stem) + 1:]
+            if year.isdigit():
+                manifest[year] = {"file": path.name, "updated_at": ""}
+        return manifest
+
+    def _save_manifest(self, manifest: Dict[str, Dict[str, str]]) -> None:
+        ordered = {year: manifest[year] for year in sorted(manifest)}
+        with atomic_write(self.root / self.MANIFEST_FILENAME) as tmp_path:
+            tmp_path.write_text(json.dumps(ordered, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -0,0 +1,232 @@
+"""
+SQLite 데이터셋 저장소 구현
+"""
+import os
+import sqlite3
+from contextlib import closing
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+import pandas as pd
+
+from core.domain.listing_date import parse_listing_date
+from core.domain.schema import LISTING_DATE_COLUMN, NAME_COLUMN, migrate_legacy_columns
+from core.ports.data_ports import ChangeFeedPort, DatasetStorePort
+from infra.adapters.data.dataset_dtypes import apply_dtypes
+from infra.adapters.data.dataset_merge import diff_record, sort_by_listing_date
+from infra.adapters.data.workbook_loader import WorkbookLoader
+from config import config
+
+
+class SqliteDatasetStore(DatasetStorePort):
+    """
+    SQLite 파일 기반 데이터셋 (정본 저장소)
+
+    - 고유 인덱스 (종목명, 정규화 상장일)로 행 단위 upsert (INSERT ... ON CONFLICT DO UPDATE)
+      -> 일일 작업은 변경된 몇 행만 기록하고 나머지 행은 읽지도 쓰지도 않음
+    - 신규 행의 빈 값은 기존 값을 유지 (COALESCE), 새 컬럼은 ALTER TABLE로 추가
+    - 상장일 미정 행은 같은 종목의 확정 상장일 행과 합쳐짐 (엑셀 병합 규칙과 동일)
+    """
+
+    TABLE = "listings"
+    KEY_COLUMN = NAME_COLUMN
+    DATE_COLUMN = LISTING_DATE_COLUMN
+    INTERNAL_COLUMNS = ("year", "listing_key")
+
+    def __init__(
+        self, path: Union[str, Path] = None, seed_workbook: Union[str, Path] = None,
+        loader: WorkbookLoader = None, change_feed: ChangeFeedPort = None
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본: OUTPUT_DIR/SQLITE_FILENAME)
+            seed_workbook: 데이터베이스가 비어 있을 때 가져올 엑셀 통합 문서 경로
+            loader: 통합 문서 로더 (seed_workbook 읽기용)
+            change_feed: 변경 피드 (추가/변경 행 기록, 선택)
+        """
+        self.path = Path(path) if path else config.OUTPUT_DIR / config.SQLITE_FILENAME
+        self.seed_workbook = Path(seed_workbook) if seed_workbook else None
+        self.loader = loader or WorkbookLoader()
+        self.change_feed = change_feed
+        os.makedirs(self.path.parent, exist_ok=True)
+        self._seeded = False
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.TABLE} ('
+                f'year INTEGER NOT NULL, listing_key TEXT NOT NULL, "{self.KEY_COLUMN}" TEXT NOT NULL)'
+            )
+            conn.execute(
+                f'CREATE UNIQUE INDEX IF NOT EXISTS ux_{self.TABLE}_key '
+                f'ON {self.TABLE} ("{self.KEY_COLUMN}", listing_key)'
+            )
+            conn.execute(f'CREATE INDEX IF NOT EXISTS ix_{self.TABLE}_year ON {self.TABLE} (year)')
+
+    def export(self, data: Dict[int, pd.DataFrame]) -> None:
+        if not data:
+            return
+        self._seed_if_empty()
+
+        changes: Dict[int, List[Dict]] = {}
+        with closing(self._connect()) as conn, conn:
+            total = 0
+            for year, df in sorted(data.items()):
+                changes[year] = [] if self.change_feed is not None else None
+                total += self._upsert(conn, year, df, changes[year])
+        # 커밋된 변경만 피드에 기록
+        if self.change_feed is not None:
+            for year, year_changes in changes.items():
+                self.change_feed.append(year, year_changes)
+        print(f"      [저장 완료] {self.path} ({total}건 upsert)")
+
+    def load(self, years: Optional[Iterable[int]] = None) -> Dict[int, pd.DataFrame]:
+        self._seed_if_empty()
+        query = f"SELECT * FROM {self.TABLE}"
+        params: List[int] = []
+        if years is not None:
+            params = [int(year) for year in years]
+            if not params:
+                return {}
+            query += f" WHERE year IN ({', '.join('?' * len(params))})"
+
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(query + " ORDER BY rowid", conn, params=params)
+
+        loaded = {}
+        for year, year_df in df.groupby("year", sort=True):
+            frame = year_df.drop(columns=list(self.INTERNAL_COLUMNS)).reset_index(drop=True)
+            loaded[int(year)] = apply_dtypes(sort_by_listing_date(migrate_legacy_columns(frame)))
+        return loaded
+
+    def _upsert(
+        self, conn: sqlite3.Connection, year: int, df: pd.DataFrame, changes: Optional[List[Dict]] = None
+    ) -> int:
+        """
+        연도 데이터 upsert (기록한 행 수 반환)
+
+        Args:
+            changes: 지정하면 행별 변경 레코드(추가/변경 전후 값)를 추가
+        """
+        if df.empty:
+            return 0
+        if self.KEY_COLUMN not in df.columns:
+            raise ValueError(f"'{self.KEY_COLUMN}' 컬럼이 없는 데이터는 저장할 수 없습니다.")
+
+        columns = [str(col) for col in df.columns]
+        self._ensure_columns(conn, columns)
+
+        quoted = [self._quote(col) for col in columns]
+        updates = ", ".join(
+            ["year = excluded.year"]
+            + [f"{q} = COALESCE(excluded.{q}, {self.TABLE}.{q})" for q in quoted if q != self._quote(self.KEY_COLUMN)]
+        )
+        statement = (
+            f"INSERT INTO {self.TABLE} (year, listing_key, {', '.join(quoted)}) "
+            f"VALUES (?, ?, {', '.join('?' * len(quoted))}) "
+            f"ON CONFLICT ({self._quote(self.KEY_COLUMN)}, listing_key) DO UPDATE SET {updates}"
+        )
+
+        # 행마다 키를 결정한 직후 기록 (같은 배치 안의 상장일 미정/확정 행도 합쳐지도록)
+        written = 0
+        for record in df.astype(object).itertuples(index=False, name=None):
+            values = [self._to_sql_value(value) for value in record]
+            name = values[columns.index(self.KEY_COLUMN)]
+            if name is None:
+                continue
+            listed = values[columns.index(self.DATE_COLUMN)] if self.DATE_COLUMN in columns else None
+            key = self._resolve_key(conn, name, listed)
+            before = self._fetch_row(conn, name, key) if changes is not None else None
+            conn.execute(statement, [int(year), key] + values)
+            written += 1
+
+            if changes is not None:
+                # COALESCE 규칙과 동일하게 빈 값은 기존 값 유지
+                after = dict(before or {})
+                after.update({col: value for col, value in zip(columns, values) if value is not None})
+                change = diff_record(before, after, (name, key or None))
+                if change:
+                    changes.append(change)
+        return written
+
+    def _fetch_row(self, conn: sqlite3.Connection, name: str, key: str) -> Optional[Dict[str, Any]]:
+        """키에 해당하는 기존 행 (내부 컬럼 제외, 없으면 None)"""
+        cursor = conn.execute(
+            f"SELECT * FROM {self.TABLE} WHERE {self._quote(self.KEY_COLUMN)} = ? AND listing_key = ?",
+            (name, key)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        columns = [description[0] for description in cursor.description]
+        return {col: value for col, value in zip(columns, row) if col not in self.INTERNAL_COLUMNS}
+
+    def _resolve_key(self, conn: sqlite3.Connection, name: str, listed: Any) -> str:
+        """
+        정규화 상장일 키 결정
+
+        - 상장일이 확정된 행: 같은 종목의 상장일 미정 행이 있으면 해당 행의 키를 확정 상장일로 변경
+        - 상장일 미정 행: 같은 종목의 마지막 확정 상장일 키 사용 (없으면 빈 문자열)
+        """
+        parsed = parse_listing_date(listed)
+        if parsed is not None:
+            key = parsed.isoformat()
+            conn.execute(
+                f"UPDATE {self.TABLE} SET listing_key = ? WHERE {self._quote(self.KEY_COLUMN)} = ? "
+                f"AND listing_key = '' AND NOT EXISTS ("
+                f"SELECT 1 FROM {self.TABLE} WHERE {self._quote(self.KEY_COLUMN)} = ? AND listing_key = ?)",
+                (key, name, name, key)
+            )
+            return key
+        row = conn.execute(
+            f"SELECT listing_key FROM {self.TABLE} WHERE {self._quote(self.KEY_COLUMN)} = ? "
+            f"ORDER BY listing_key DESC LIMIT 1",
+            (name,)
+        ).fetchone()
+        return row[0] if row else ""
+
+    def _ensure_columns(self, conn: sqlite3.Connection, columns: List[str]) -> None:
+        """테이블에 없는 컬럼 추가 (컬럼 순서는 처음 등장한 순서 유지)"""
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({self.TABLE})")}
+        for col in columns:
+            if col not in existing:
+                conn.execute(f"ALTER TABLE {self.TABLE} ADD COLUMN {self._quote(col)}")
+                existing.add(col)
+
+    def _seed_if_empty(self) -> None:
+        """데이터베이스가 비어 있으면 기존 엑셀 통합 문서에서 가져오기 (최초 1회)"""
+        if self._seeded:
+            return
+        self._seeded = True
+        if not self.seed_workbook or not self.seed_workbook.exists():
+            return
+        with closing(self._connect()) as conn:
+            if conn.execute(f"SELECT 1 FROM {self.TABLE} LIMIT 1").fetchone():
+                return
+
+        print(f"      [정보] 데이터베이스가 비어 있어 기존 통합 문서에서 가져옵니다: {self.seed_workbook}")
+        sheets = self.loader.load_years(self.seed_workbook)
+        with closing(self._connect()) as conn, conn:
+            for year, df in sheets.items():
+                self._upsert(conn, year, df)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 다른 작업이 쓰는 중이면 잠금 해제를 기다림 (SQLite 자체 잠금 + WAL)
+        conn = sqlite3.connect(self.path, timeout=config.DATASET_LOCK_TIMEOUT)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def _quote(identifier: str) -> str:
+        return '"' + identifier.replace('"', '""') + '"'
+
+    @staticmethod
+    def _to_sql_value(value: Any) -> Any:
+        """pandas/numpy 값을 SQLite 저장 값으로 변환"""
+        if value is None or (not isinstance(value, (list, tuple, dict)) and pd.isna(value)):
+            return None
+        if isinstance(value, (pd.Timestamp, datetime, date)):
+            return value.isoformat()
+        if hasattr(value, "item"):
+            # numpy 스칼라 -> 파이썬 기본 타입
+            return value.item()
+        return value
@@ -0,0 +1,136 @@
+"""
+엑셀 통합 문서 로더 (명령 실행 동안 공유)
+"""
+import importlib.util
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import pandas as pd
+
+from core.domain.schema import migrate_legacy_columns
+from infra.adapters.data.dataset_dtypes import READ_DTYPES, apply_dtypes, resolve_backend
+from config import config
+
+
+# Rust 기반 calamine 리더 설치 여부 (pandas engine="calamine", python-calamine 패키지)
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
+
+class WorkbookLoader:
+    """
+    엑셀 통합 문서 시트 로더
+
+    - 하나의 파일 핸들에서 필요한 시트를 한 번에 파싱 (시트마다 파일을 다시 열지 않음)
+    - calamine 엔진이 설치되어 있으면 사용 (없으면 openpyxl)
+    - 과거 컬럼명은 스키마의 현재 컬럼명으로 통합 ("수익률" -> "수익률(%)")
+    - 알려진 컬럼은 dataset_dtypes 정책 적용 (category / Arrow 문자열·정수)
+    - 읽은 시트는 파일 서명(mtime, size)이 같은 동안 캐시 -> 한 명령에서 enrich 로드와
+      ExcelExporter 병합이 같은 로더를 공유하면 파일을 한 번만 파싱
+    """
+
+    def __init__(self, engine: str = None, dtype_backend: str = None):
+        """
+        Args:
+            engine: pandas 엑셀 엔진 (기본: config.EXCEL_READ_ENGINE, auto면 calamine 우선)
+            dtype_backend: dtype 백엔드 (기본: config.DATAFRAME_DTYPE_BACKEND)
+        """
+        engine = (engine or config.EXCEL_READ_ENGINE).lower()
+        if engine == "auto":
+            engine = "calamine" if CALAMINE_AVAILABLE else "openpyxl"
+        self.engine = engine
+        self.dtype_backend = resolve_backend(dtype_backend)
+        # {경로: (파일 서명, 시트 이름 목록, {시트명: DataFrame})}
+        self._cache: Dict[str, Tuple[Tuple[int, int], List[str], Dict[str, pd.DataFrame]]] = {}
+
+    def sheet_names(self, path: Union[str, Path]) -> List[str]:
+        """통합 문서의 시트 이름 목록"""
+        return list(self._entry(path)[1])
+
+    def read_sheets(
+        self, path: Union[str, Path], sheet_names: Optional[Iterable[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        시트 읽기 (sheet_names 미지정 시 전체, 없는 시트는 제외)
+
+        Returns:
+            {시트명: DataFrame} (캐시 사본)
+        """
+        key = self._key(path)
+        _, names, sheets = self._entry(path)
+        wanted = names if sheet_names is None else [name for name in sheet_names if name in names]
+
+        missing = [name for name in wanted if name not in sheets]
+        if missing:
+            with pd.ExcelFile(key, engine=self.engine) as xls:
+                parsed = pd.read_excel(xls, sheet_name=missing, dtype=READ_DTYPES)
+            for name, df in parsed.items():
+                sheets[name] = apply_dtypes(migrate_legacy_columns(df), self.dtype_backend)
+        return {name: sheets[name].copy() for name in wanted}
+
+    def load_years(
+        self, path: Union[str, Path], years: Optional[Iterable[int]] = None
+    ) -> Dict[int, pd.DataFrame]:
+        """
+        연도 시트("2024년" 형식) 로드 (years 미지정 시 전체 연도 시트)
+
+        Returns:
+            {연도: DataFrame}
+        """
+        names = {sheet_year(name): name for name in self.sheet_names(path)}
+        names.pop(None, None)
+        targets = sorted(names) if years is None else [year for year in years if year in names]
+        sheets = self.read_sheets(path, [names[year] for year in targets])
+        return {year: sheets[names[year]] for year in targets}
+
+    def remember(
+        self, path: Union[str, Path], sheet_names: List[str], sheets: Dict[str, pd.DataFrame],
+        replace: bool = False
+    ) -> None:
+        """
+        기록한 시트를 캐시에 반영 (다음 읽기에서 파일 재파싱 생략)
+
+        Args:
+            sheet_names: 기록 후 통합 문서의 시트 이름 목록 (순서대로)
+            sheets: 방금 기록한 {시트명: DataFrame}
+            replace: True면 통합 문서 전체를 새로 쓴 경우 (기존 캐시 폐기)
+        """
+        key = self._key(path)
+        cached = self._cache.get(key)
+        # 기록하지 않은 시트는 내용이 그대로이므로 캐시를 유지하고 서명만 갱신
+        frames = {} if replace or cached is None else cached[2]
+        frames.update({name: df.copy() for name, df in sheets.items()})
+        self._cache[key] = (self._signature(key), list(sheet_names), frames)
+
+    def invalidate(self, path: Union[str, Path] = None) -> None:
+        """캐시 폐기 (path 미지정 시 전체)"""
+        if path is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(self._key(path), None)
+
+    def _entry(self, path: Union[str, Path]):
+        key = self._key(path)
+        signature = self._signature(key)
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != signature:
+            with pd.ExcelFile(key, engine=self.engine) as xls:
+                cached = (signature, list(xls.sheet_names), {})
+            self._cache[key] = cached
+        return cached
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    @staticmethod
+    def _signature(path: str) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+
+def sheet_year(sheet_name: str) -> Optional[int]:
+    """"2024년" 등에서 연도 추출 (연도 시트가 아니면 None)"""
+    try:
+        return int(str(sheet_name).replace("년", ""))
+    except ValueError:
+        return None
@@ -7,18 +7,38 @@
 
 from infra.adapters.parsing.text.parsers import (
     parse_to_int,
+    parse_share_count,
     clean_stock_name,
     is_spac_stock,
-    format_competition_rate,
-    extract_share_count,
+    parse_competition_rate,
+    parse_percent,
     clean_tradable_values,
 )
+from infra.adapters.parsing.text.series import (
+    parse_to_int_series,
+    parse_share_count_series,
+    parse_competition_rate_series,
+    parse_percent_series,
+    clean_tradable_values_series,
+)
+from infra.adapters.parsing.text.name_index import (
+    StockNameIndex,
+    normalize_stock_name,
+)
 
 __all__ = [
     "parse_to_int",
+    "parse_share_count",
     "clean_stock_name",
     "is_spac_stock",
-    "format_competition_rate",
-    "extract_share_count",
+    "parse_competition_rate",
+    "parse_percent",
     "clean_tradable_values",
+    "parse_to_int_series",
+    "parse_share_count_series",
+    "parse_competition_rate_series",
+    "parse_percent_series",
+    "clean_tradable_values_series",
+    "StockNameIndex",
+    "normalize_stock_name",
 ]
@@ -0,0 +1,162 @@
+"""
+종목명 정규화 및 근사 검색 인덱스
+
+38.co.kr 종목명과 KRX 종목명의 표기 차이(공백, 괄호, 법인 접미사,
+영문/한글 표기)를 흡수하여 티커를 찾기 위한 도구입니다.
+"""
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Container, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# 그룹/약칭 한글 표기 -> 영문 표기 (긴 표기부터 치환)
+NAME_ALIASES = {
+    "에이치디": "HD", "에스케이": "SK", "엘지": "LG", "케이티": "KT", "씨제이": "CJ",
+    "지에스": "GS", "엘에스": "LS", "디비": "DB", "케이비": "KB", "엔에이치": "NH",
+    "비엔케이": "BNK", "제이비": "JB", "디지비": "DGB", "에이치엘": "HL", "케이씨씨": "KCC",
+    "오씨아이": "OCI", "에스지씨": "SGC", "아이비케이": "IBK", "에이치케이": "HK",
+}
+
+# 법인 형태 표기 (제거 대상)
+CORPORATE_SUFFIXES = ("주식회사", "(주)", "(株)")
+
+_ALIAS_PATTERN = re.compile("|".join(sorted(map(re.escape, NAME_ALIASES), key=len, reverse=True)))
+_STRIP_PATTERN = re.compile(r"[\s\(\)\[\]\{\}<>·.,\-_'\"]")
+
+# 우선주 종목명 접미사 (삼성전자우, 현대차2우B, 대신증권2우(전환) 등, 정규화 후 대문자/괄호 제거)
+_PREFERRED_SUFFIX = re.compile(r"\d?우(?:B|전환)?$")
+
+
+def normalize_stock_name(name: str) -> str:
+    """
+    종목명 정규화
+
+    - 유니코드 NFKC 정규화 (전각 문자, ㈜ 등 호환 문자 통일), 영문 대문자화
+    - 법인 형태 표기((주), 주식회사 등) 제거
+    - 한글로 표기된 그룹 약칭을 영문으로 통일 (에스케이 -> SK)
+    - 공백, 괄호, 구두점 제거
+    """
+    if not name:
+        return ""
+    # NFKC: ㈜ -> (주), 전각 영숫자 -> 반각
+    text = unicodedata.normalize("NFKC", str(name))
+    for suffix in CORPORATE_SUFFIXES:
+        text = text.replace(suffix, "")
+    text = _STRIP_PATTERN.sub("", text.upper())
+    return _ALIAS_PATTERN.sub(lambda m: NAME_ALIASES[m.group(0)], text)
+
+
+def is_preferred_share(name: str, ticker: str = "", listed_names: Container[str] = ()) -> bool:
+    """
+    우선주 여부
+
+    - 티커가 있으면 티커로 판별 (보통주 단축코드는 0으로 끝남)
+    - 티커가 없으면 종목명이 우/우B/N우(전환)으로 끝나고, 접미사를 뗀 이름이 listed_names에 있을 때만
+      (동우, 태우처럼 이름이 "우"로 끝나는 보통주를 우선주로 보지 않음)
+    """
+    if ticker:
+        return not ticker.endswith("0")
+    stem = _preferred_stem(name)
+    return stem is not None and stem in listed_names
+
+
+def _preferred_stem(normalized: str) -> Optional[str]:
+    """우선주 접미사를 뗀 이름 (접미사가 없거나 남는 이름이 없으면 None)"""
+    stem = _PREFERRED_SUFFIX.sub("", normalized)
+    return stem if stem and stem != normalized else None
+
+
+def _bigrams(text: str) -> Set[str]:
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class StockNameIndex:
+    """
+    종목명 -> 티커 사전 계산 인덱스
+
+    조회 순서:
+    1. 원문 일치
+    2. 정규화 이름 일치
+    3. 문자 bigram 후보 검색 후 Dice 유사도가 min_score 이상인 유일한 최고점 후보
+       (동점 후보가 여럿이면 오매칭을 피하기 위해 None)
+       우선주(티커 기준)는 근사 후보에서 제외하고, 한쪽에 우선주 접미사만 붙은 이름끼리는 매칭하지 않음
+       (상장 전/폐지된 보통주가 같은 회사 우선주의 시세를 받는 것을 방지)
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]], min_score: float = 0.85):
+        """
+        Args:
+            entries: (종목명, 티커) 목록
+            min_score: 근사 일치로 인정할 최소 Dice 유사도 (0~1)
+        """
+        self.min_score = min_score
+        self._exact: Dict[str, str] = {}
+        self._normalized: Dict[str, Optional[str]] = {}
+        self._names: List[Tuple[str, Set[str], str]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+        for name, ticker in entries:
+            if not name or not ticker:
+                continue
+            self._exact.setdefault(name, ticker)
+            normalized = normalize_stock_name(name)
+            if not normalized:
+                continue
+            existing = self._normalized.get(normalized, ticker)
+            # 정규화 후 서로 다른 종목이 겹치면 모호하므로 정규화 일치에서 제외
+            self._normalized[normalized] = ticker if existing == ticker else None
+            if is_preferred_share(normalized, ticker):
+                continue
+            grams = _bigrams(normalized)
+            position = len(self._names)
+            self._names.append((normalized, grams, ticker))
+            for gram in grams:
+                self._postings[gram].append(position)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def lookup(self, stock_name: str) -> Optional[str]:
+        """종목명으로 티커 조회 (찾지 못하면 None)"""
+        if not stock_name:
+            return None
+        ticker = self._exact.get(stock_name)
+        if ticker:
+            return ticker
+
+        normalized = normalize_stock_name(stock_name)
+        if normalized in self._normalized:
+            return self._normalized[normalized]
+        return self._fuzzy_lookup(normalized)
+
+    def _fuzzy_lookup(self, normalized: str) -> Optional[str]:
+        grams = _bigrams(normalized)
+        if not grams:
+            return None
+
+        overlaps: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                overlaps[position] += 1
+
+        best_score, best_tickers = 0.0, set()
+        for position, overlap in overlaps.items():
+            _, candidate_grams, ticker = self._names[position]
+            score = 2 * overlap / (len(grams) + len(candidate_grams))
+            if score > best_score:
+                best_score, best_tickers = score, {ticker}
+            elif score == best_score:
+                best_tickers.add(ticker)
+
+        if best_score < self.min_score or len(best_tickers) != 1:
+            return None
+        ticker = next(iter(best_tickers))
+        candidates = {name for name, _, t in (self._names[p] for p in overlaps) if t == ticker}
+        # 한쪽이 다른 쪽에 우선주 접미사만 붙인 이름이면 (에코프로비엠우 <-> 에코프로비엠) 다른 종목이므로 제외
+        stem = _preferred_stem(normalized)
+        if any(name == stem or _preferred_stem(name) == normalized for name in candidates):
+            return None
+        return ticker
@@ -25,6 +25,12 @@ def parse_to_int(text: str, context: str = "") -> Optional[int]:
         print(msg)
         return None
 
+def parse_share_count(text: str, context: str = "") -> Optional[int]:
+    """Parse a share count cell ("285,000주 (20.00%)", "285,000주 / 20%"), ignoring text after '주'."""
+    if not text:
+        return None
+    return parse_to_int(text.split("주", 1)[0], context)
+
 def clean_stock_name(name_raw: str) -> str:
     """Clean stock name by removing unwanted patterns."""
     name_cleaned = re.sub(r"\(구\..*?\)", "", name_raw).strip()
@@ -34,18 +40,23 @@ def is_spac_stock(name: str) -> bool:
     """Check if stock is a SPAC or REIT."""
     return "스팩" in name or "리츠" in name
 
-def format_competition_rate(rate_str: str) -> str:
-    """Format institutional competition rate."""
+def parse_competition_rate(rate_str: str) -> Optional[float]:
+    """Parse institutional competition rate ("1,234.56:1") to a number (None if unavailable)."""
+    if not rate_str:
+        return None
     try:
-        rate_part = rate_str.split(":")[0].strip().replace(",", "")
-        return f"{round(float(rate_part))}:1"
-    except Exception:
-        return rate_str
+        return float(rate_str.split(":")[0].replace(",", "").strip())
+    except ValueError:
+        return None
 
-def extract_share_count(raw_value: str, default: str = "0") -> str:
-    """Extract share count from raw string."""
-    result = raw_value.split("주")[0].replace(",", "").strip()
-    return result if result else default
+def parse_percent(text: str) -> Optional[float]:
+    """Parse percentage text ("30.5%") to a number (None if unavailable)."""
+    if not text:
+        return None
+    try:
+        return float(text.replace("%", "").replace(",", "").strip())
+    except ValueError:
+        return None
 
 def clean_tradable_values(count: str, percent: str) -> Tuple[str, str]:
     """Clean and validate tradable values."""
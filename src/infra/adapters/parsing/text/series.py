@@ -0,0 +1,127 @@
+"""
+텍스트 파서의 Series(벡터) 버전
+
+parsers.py의 스칼라 함수와 같은 결과를 pandas 문자열 연산으로 한 번에 계산합니다.
+실패를 출력하는 대신 실패 여부(bool Series)를 함께 반환하므로,
+적재된 데이터셋이나 HTML 보관본을 다시 파싱할 때 호출자가 한 번에 집계/기록할 수 있습니다.
+
+- 입력 Series의 인덱스를 유지합니다.
+- 결측값(None/NaN)과 명시적 결측 표기("N/A", "-", 빈 문자열)는 실패로 보지 않습니다.
+"""
+import re
+from typing import Tuple
+import numpy as np
+import pandas as pd
+
+
+_MISSING_TOKENS = ("N/A", "-")
+
+# parse_to_int: 괄호 이후 제거, 쉼표/단위 제거, 범위(~, :)는 앞 값만 사용
+_AFTER_PAREN = re.compile(r"\(.*", re.DOTALL)
+_INT_NOISE = re.compile(r"[,주원]")
+_AFTER_RANGE = re.compile(r"[~:].*", re.DOTALL)
+
+# parse_competition_rate: "1,234.56:1" -> "1234.56"
+_RATE_SUFFIX = re.compile(r":.*", re.DOTALL)
+
+_TRADABLE_COUNT_MISSING = ("-", "", "　")
+_TRADABLE_PERCENT_MISSING = ("-", "", "S")
+
+
+def parse_to_int_series(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    parse_to_int의 Series 버전
+
+    Returns:
+        (Int64 값, 실패 여부) - 실패한 값은 결측
+    """
+    text = _as_string(values)
+    cleaned = (
+        text.mask(text.isin(_MISSING_TOKENS))
+        .str.replace(_AFTER_PAREN, "", regex=True)
+        .str.replace(_INT_NOISE, "", regex=True)
+        .str.strip()
+        .str.replace(_AFTER_RANGE, "", regex=True)
+        .str.strip()
+    )
+    cleaned = cleaned.mask(cleaned.isin(("", "-")))
+
+    numeric = pd.to_numeric(cleaned, errors='coerce').astype("Float64")
+    finite = numeric.notna() & np.isfinite(numeric.fillna(0).to_numpy(dtype="float64"))
+    failures = cleaned.notna() & ~finite
+    integers = numeric.where(finite).to_numpy(dtype="float64", na_value=np.nan)
+    return pd.Series(np.trunc(integers), index=values.index).astype("Int64"), _as_mask(failures)
+
+
+def parse_share_count_series(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    parse_share_count의 Series 버전 ("285,000주 20.00%" -> 285000)
+
+    Returns:
+        (Int64 값, 실패 여부)
+    """
+    return parse_to_int_series(_as_string(values).str.split("주", n=1).str[0])
+
+
+def parse_competition_rate_series(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    parse_competition_rate의 Series 버전 ("1,234.56:1" -> 1234.56)
+
+    Returns:
+        (Float64 값, 실패 여부)
+    """
+    text = _as_string(values)
+    rate = _rate_numbers(text)
+    return rate, _as_mask(_present(text) & rate.isna())
+
+
+def parse_percent_series(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    parse_percent의 Series 버전 ("30.5%" -> 30.5)
+
+    Returns:
+        (Float64 값, 실패 여부)
+    """
+    text = _as_string(values)
+    cleaned = text.str.replace("%", "", regex=False).str.replace(",", "", regex=False).str.strip()
+    numeric = pd.to_numeric(cleaned, errors='coerce').astype("Float64")
+    return numeric, _as_mask(_present(text) & numeric.isna())
+
+
+def clean_tradable_values_series(
+    count: pd.Series, percent: pd.Series
+) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    clean_tradable_values의 Series 버전
+
+    Returns:
+        (주식수, 지분율, 순서 교정 여부) - 교정 여부는 스칼라 버전이 경고를 출력하는 행
+    """
+    count = _as_string(count)
+    percent = _as_string(percent).set_axis(count.index)
+    count = count.mask(count.isin(_TRADABLE_COUNT_MISSING), "N/A")
+    percent = percent.mask(percent.isin(_TRADABLE_PERCENT_MISSING), "N/A")
+
+    swapped = _as_mask(count.str.endswith("%") & ~percent.str.endswith("%").fillna(False))
+    return count.where(~swapped, percent), percent.where(~swapped, count), swapped
+
+
+def _as_string(values: pd.Series) -> pd.Series:
+    """결측값은 유지하고 나머지를 문자열 Series로 (이미 string dtype이면 그대로)"""
+    if isinstance(values.dtype, pd.StringDtype):
+        return values
+    return values.astype(object).where(values.notna(), None).astype("string")
+
+
+def _present(text: pd.Series) -> pd.Series:
+    """결측/명시적 결측 표기가 아닌 값"""
+    return text.notna() & ~text.str.strip().isin(("",) + _MISSING_TOKENS)
+
+
+def _rate_numbers(text: pd.Series) -> pd.Series:
+    cleaned = text.str.replace(_RATE_SUFFIX, "", regex=True).str.strip().str.replace(",", "", regex=False)
+    return pd.to_numeric(cleaned, errors='coerce').astype("Float64")
+
+
+def _as_mask(mask: pd.Series) -> pd.Series:
+    return mask.fillna(False).astype(bool)
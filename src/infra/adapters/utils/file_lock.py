@@ -0,0 +1,166 @@
+"""
+파일 잠금 및 원자적 파일 교체 유틸리티
+"""
+import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLockTimeout(TimeoutError):
+    """대기 시간 안에 파일 잠금을 얻지 못함"""
+
+
+class FileLock:
+    """
+    프로세스 간 권고(advisory) 파일 잠금
+
+    - POSIX: fcntl.flock, Windows: msvcrt.locking
+    - 잠금은 파일 디스크립터에 묶여 있어 프로세스가 비정상 종료되어도 OS가 해제
+    - 같은 인스턴스에서의 중첩 획득은 허용 (재진입)
+
+    사용 예:
+        with FileLock("output/신규상장종목.xlsx.lock", timeout=300):
+            ... 읽기 -> 병합 -> 쓰기 ...
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 300.0, poll_interval: float = 0.1):
+        """
+        Args:
+            path: 잠금 파일 경로
+            timeout: 잠금 대기 시간 (초), 음수면 무한 대기
+            poll_interval: 잠금 재시도 간격 (초)
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+        self._depth = 0
+
+    def acquire(self) -> None:
+        if self._depth:
+            self._depth += 1
+            return
+        os.makedirs(self.path.parent, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._try_lock(fd)
+                break
+            except OSError:
+                if 0 <= self.timeout and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise FileLockTimeout(f"파일 잠금 대기 시간 초과 ({self.timeout}초): {self.path}")
+                time.sleep(self.poll_interval)
+        self._fd = fd
+        self._depth = 1
+
+    def release(self) -> None:
+        if not self._depth:
+            return
+        self._depth -= 1
+        if self._depth:
+            return
+        try:
+            self._unlock(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    @property
+    def locked(self) -> bool:
+        return self._depth > 0
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+    @staticmethod
+    def _try_lock(fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    @staticmethod
+    def _unlock(fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def atomic_write(path: Union[str, Path]) -> Iterator[Path]:
+    """
+    원자적 파일 교체
+
+    같은 디렉토리의 임시 파일 경로를 넘겨주고, 블록이 정상 종료되면
+    fsync 후 os.replace로 대상 파일을 교체합니다. 교체 전 임시 파일 권한을 기존 파일 권한
+    (새 파일이면 0o666 & ~umask)으로 맞춥니다 (mkstemp의 0600이 대상 파일에 남지 않도록). 예외가 나면 임시 파일만 삭제되고
+    기존 파일은 그대로 남습니다 (쓰기 도중 중단되어도 손상된 파일이 남지 않음).
+
+    사용 예:
+        with atomic_write(filepath) as tmp_path:
+            workbook.save(tmp_path)
+    """
+    path = Path(path)
+    os.makedirs(path.parent, exist_ok=True)
+    # 확장자 유지 (엑셀 엔진 등이 확장자로 형식을 판단)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=f".tmp{path.suffix}")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        yield tmp_path
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _fsync_directory(path.parent)
+
+
+def _target_mode(path: Path) -> int:
+    """교체 후 적용할 권한 (기존 파일 권한 유지, 새 파일은 일반 파일 생성과 동일)"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _current_umask() -> int:
+    """프로세스 umask (조회 API가 없어 설정 후 즉시 복원, 모듈 로드 시 1회)"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _current_umask()
+
+
+def _fsync_directory(directory: Path) -> None:
+    """이름 변경을 디스크에 반영 (디렉토리 fsync 미지원 플랫폼은 생략)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,142 @@
+"""
+KRX 거래일 캘린더 어댑터
+"""
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional
+from zoneinfo import ZoneInfo
+
+try:
+    import holidays as holidays_lib
+except ImportError:
+    holidays_lib = None
+
+from core.ports.utility_ports import TradingCalendarPort
+
+
+KST = ZoneInfo("Asia/Seoul")
+
+# 매년 고정 휴장일 (월, 일): 신정, 삼일절, 근로자의날, 어린이날, 현충일, 광복절,
+# 개천절, 한글날, 성탄절 (연말 휴장일은 12월 마지막 평일로 별도 계산)
+FIXED_HOLIDAYS = (
+    (1, 1), (3, 1), (5, 1), (5, 5), (6, 6), (8, 15),
+    (10, 3), (10, 9), (12, 25),
+)
+
+# 음력 공휴일(설날/추석/부처님오신날), 대체공휴일, 선거일, 임시공휴일
+# (표에 없는 연도는 holidays 패키지로 계산, 패키지가 없으면 경고 후 고정 휴장일만 적용)
+VARIABLE_HOLIDAYS = {
+    2020: ["2020-01-24", "2020-01-27", "2020-04-15", "2020-04-30", "2020-08-17",
+           "2020-09-30", "2020-10-01", "2020-10-02"],
+    2021: ["2021-02-11", "2021-02-12", "2021-05-19", "2021-08-16", "2021-09-20",
+           "2021-09-21", "2021-09-22", "2021-10-04", "2021-10-11"],
+    2022: ["2022-01-31", "2022-02-01", "2022-02-02", "2022-03-09", "2022-06-01",
+           "2022-09-09", "2022-09-12", "2022-10-10"],
+    2023: ["2023-01-23", "2023-01-24", "2023-05-29", "2023-09-28", "2023-09-29",
+           "2023-10-02"],
+    2024: ["2024-02-09", "2024-02-12", "2024-04-10", "2024-05-06", "2024-05-15",
+           "2024-09-16", "2024-09-17", "2024-09-18", "2024-10-01"],
+    2025: ["2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30", "2025-03-03",
+           "2025-05-06", "2025-06-03", "2025-10-06", "2025-10-07", "2025-10-08"],
+    2026: ["2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02", "2026-05-25",
+           "2026-06-03", "2026-08-17", "2026-09-24", "2026-09-25", "2026-10-05"],
+}
+
+# 장 마감 시각 예외 (대학수학능력시험일: 1시간 지연)
+CLOSE_TIME_OVERRIDES = {
+    date(2020, 12, 3): time(16, 30),
+    date(2021, 11, 18): time(16, 30),
+    date(2022, 11, 17): time(16, 30),
+    date(2023, 11, 16): time(16, 30),
+    date(2024, 11, 14): time(16, 30),
+    date(2025, 11, 13): time(16, 30),
+    date(2026, 11, 19): time(16, 30),
+}
+
+
+class KrxTradingCalendar(TradingCalendarPort):
+    """
+    KRX(유가증권/코스닥) 거래일 캘린더
+
+    비즈니스 룰:
+    - 주말, 고정/변동 공휴일, 연말 휴장일(12월 마지막 평일)은 휴장
+    - 정규장 마감은 15:30 (수능일 등 예외는 CLOSE_TIME_OVERRIDES)
+    - 모든 판단은 로컬 테이블 기반 (네트워크 호출 없음), 연도별 휴장일은 캐시
+    - VARIABLE_HOLIDAYS에 없는 연도는 holidays 패키지(선택)의 한국 공휴일로 대체
+      (선거일/임시공휴일은 누락될 수 있음, extra_holidays로 보완)
+    """
+
+    REGULAR_CLOSE = time(15, 30)
+
+    def __init__(self, extra_holidays: Optional[Iterable[date]] = None):
+        self._extra_holidays = frozenset(extra_holidays or ())
+
+    def is_trading_day(self, target_date: date) -> bool:
+        if target_date.weekday() >= 5:
+            return False
+        return target_date not in self._holidays(target_date.year) \
+            and target_date not in self._extra_holidays
+
+    def next_session(self, target_date: date) -> date:
+        session = target_date
+        while not self.is_trading_day(session):
+            session += timedelta(days=1)
+        return session
+
+    def previous_session(self, target_date: date) -> date:
+        """target_date 당일 또는 이전 마지막 거래일"""
+        session = target_date
+        while not self.is_trading_day(session):
+            session -= timedelta(days=1)
+        return session
+
+    def session_close(self, target_date: date) -> datetime:
+        close_time = CLOSE_TIME_OVERRIDES.get(target_date, self.REGULAR_CLOSE)
+        return datetime.combine(target_date, close_time, tzinfo=KST)
+
+    def is_session_closed(self, target_date: date, now: datetime) -> bool:
+        if not self.is_trading_day(target_date):
+            return False
+        return self._to_kst(now) >= self.session_close(target_date)
+
+    def last_closed_session(self, now: datetime) -> date:
+        now = self._to_kst(now)
+        session = self.previous_session(now.date())
+        if now < self.session_close(session):
+            session = self.previous_session(session - timedelta(days=1))
+        return session
+
+    @staticmethod
+    def _to_kst(now: datetime) -> datetime:
+        """naive datetime은 한국 시간으로 간주"""
+        if now.tzinfo is None:
+            return now.replace(tzinfo=KST)
+        return now.astimezone(KST)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _holidays(year: int) -> FrozenSet[date]:
+        """연도별 휴장일 집합 (캐시)"""
+        holidays = {date(year, month, day) for month, day in FIXED_HOLIDAYS}
+        if year in VARIABLE_HOLIDAYS:
+            holidays.update(date.fromisoformat(d) for d in VARIABLE_HOLIDAYS[year])
+        else:
+            holidays.update(_fallback_holidays(year))
+
+        # 연말 휴장일: 12월 마지막 평일
+        year_end = date(year, 12, 31)
+        while year_end.weekday() >= 5:
+            year_end -= timedelta(days=1)
+        holidays.add(year_end)
+        return frozenset(holidays)
+
+
+def _fallback_holidays(year: int) -> FrozenSet[date]:
+    """휴장일 표에 없는 연도의 변동 공휴일 (holidays 패키지, 없으면 경고 후 빈 집합)"""
+    if holidays_lib is None:
+        print(
+            f"      [경고] {year}년 휴장일 정보가 없어 설날/추석 등 변동 공휴일을 거래일로 판단합니다. "
+            f"(pip install holidays 또는 VARIABLE_HOLIDAYS 갱신 필요)"
+        )
+        return frozenset()
+    return frozenset(holidays_lib.country_holidays("KR", years=year))
@@ -9,7 +9,7 @@ from typing import List, Tuple, Optional
 from playwright.sync_api import Page, Locator
 
 from core.ports.web_scraping_ports import DetailScraperPort
-from core.domain.models import StockInfo
+from core.domain.models import StockBatch, StockInfo
 from infra.adapters.parsing.text import parsers as text_parsers
 from infra.adapters.parsing.html.table_grid_builder import TableGridBuilder
 from infra.adapters.parsing.html.strategies import (
@@ -44,9 +44,9 @@ class DetailScraperAdapter(DetailScraperPort):
         self,
         page: Page,
         stocks: List[Tuple[str, str]]
-    ) -> List[StockInfo]:
-        """여러 종목 스크래핑"""
-        results = []
+    ) -> StockBatch:
+        """여러 종목 스크래핑 (수집 즉시 컬럼 배치에 누적)"""
+        results = StockBatch()
         
         for name, href in stocks:
             if stock := self._scrape_single(page, name, href):
@@ -130,27 +130,19 @@ class DetailScraperAdapter(DetailScraperPort):
         if listing_date == "N/A":
             listing_date = self._get_value(table, "(상장일")
         
-        competition_rate_raw = self._get_value(table, "기관경쟁률")
-        
         return {
             "listing_date": listing_date,
-            "competition_rate": text_parsers.format_competition_rate(competition_rate_raw),
-            "emp_shares": text_parsers.extract_share_count(
-                self._get_value(table, "우리사주조합")
-            ),
-            "inst_shares": text_parsers.extract_share_count(
-                self._get_value(table, "기관투자자등")
-            ),
-            "retail_shares": text_parsers.extract_share_count(
-                self._get_value(table, "일반청약자")
-            ),
+            "competition_rate": self._get_value(table, "기관경쟁률"),
+            "emp_shares": self._get_value(table, "우리사주조합"),
+            "inst_shares": self._get_value(table, "기관투자자등"),
+            "retail_shares": self._get_value(table, "일반청약자"),
         }
 
     def _create_stock_info(
         self, name: str, href: str, company_info: dict, offering_info: dict, 
         schedule_info: dict, tradable_info: Tuple[str, str]
     ) -> StockInfo:
-        """StockInfo 객체 생성"""
+        """StockInfo 객체 생성 (원문 값을 여기서 한 번만 숫자로 변환)"""
         return StockInfo(
             name=name,
             url=href,
@@ -167,12 +159,12 @@ class DetailScraperAdapter(DetailScraperPort):
             offering_amount=text_parsers.parse_to_int(offering_info["offering_amount"], f"{name} - offering_amount"),
             underwriter=offering_info["underwriter"],
             listing_date=schedule_info["listing_date"],
-            competition_rate=schedule_info["competition_rate"],
-            emp_shares=text_parsers.parse_to_int(schedule_info["emp_shares"], f"{name} - emp_shares"),
-            inst_shares=text_parsers.parse_to_int(schedule_info["inst_shares"], f"{name} - inst_shares"),
-            retail_shares=text_parsers.parse_to_int(schedule_info["retail_shares"], f"{name} - retail_shares"),
-            tradable_shares_count=tradable_info[0],
-            tradable_shares_percent=tradable_info[1],
+            competition_rate=text_parsers.parse_competition_rate(schedule_info["competition_rate"]),
+            emp_shares=text_parsers.parse_share_count(schedule_info["emp_shares"], f"{name} - emp_shares"),
+            inst_shares=text_parsers.parse_share_count(schedule_info["inst_shares"], f"{name} - inst_shares"),
+            retail_shares=text_parsers.parse_share_count(schedule_info["retail_shares"], f"{name} - retail_shares"),
+            tradable_shares_count=text_parsers.parse_share_count(tradable_info[0], f"{name} - tradable_shares_count"),
+            tradable_shares_percent=text_parsers.parse_percent(tradable_info[1]),
         )
 
 
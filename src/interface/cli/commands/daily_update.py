@@ -3,7 +3,7 @@ import os
 from datetime import date, datetime
 from typing import Optional
 from config import config
-from interface.cli.dependencies import build_dependencies
+from interface.cli.dependencies import build_dependencies, render_workbook
 
 def daily_update(
     target_date: Optional[str] = typer.Option(
@@ -14,12 +14,16 @@ def daily_update(
     ),
     headless: bool = typer.Option(config.HEADLESS, "--headless/--no-headless", help="헤드리스 모드"),
     drive: bool = typer.Option(False, "--drive", help="구글 드라이브 모드 (업로드 및 로컬 파일 삭제)"),
+    pending_only: bool = typer.Option(
+        False, "--pending-only", help="크롤링 없이 시세 보강 보류 큐만 처리 (브라우저 미사용)"
+    ),
 ):
     """
     일일 업데이트 (GitHub Actions용)
     
     특정 날짜의 IPO 데이터만 크롤링하여 기존 엑셀에 추가합니다.
     날짜를 지정하지 않으면 오늘 날짜로 실행됩니다.
+    --pending-only: 보류 큐에서 장 마감된 종목의 시세만 일괄 보강하여 저장합니다.
     """
     
     # 날짜 파싱
@@ -38,13 +42,13 @@ def daily_update(
         deps['logger'].info("=" * 60)
         deps['logger'].info("📅 Stock Crawler - 일일 스케줄 업데이트")
         deps['logger'].info(f"시작 날짜: {parsed_date}")
-        deps['logger'].info(f"수집 범위: 당일 + 3일 (총 4일)")
+        if pending_only:
+            deps['logger'].info("수집 범위: 보강 보류 큐만 처리")
+        else:
+            deps['logger'].info(f"수집 범위: 당일 + 3일 (총 4일)")
         deps['logger'].info(f"💾 모드: {'Google Drive' if drive else 'Local'}")
         deps['logger'].info("=" * 60)
         
-        # Playwright 초기화
-        deps['page_provider'].setup()
-        
         # Google Drive 모드일 경우, 기존 파일 다운로드 (Append를 위해)
         if drive:
             try:
@@ -64,8 +68,23 @@ def daily_update(
             except Exception as e:
                 deps['logger'].warning(f"⚠️  Google Drive 파일 다운로드 실패 (신규 생성 진행): {e}")
 
-        # 일일 스케줄 크롤링 실행 (당일 + 3일)
-        new_data = deps['crawler'].run_scheduled(start_date=parsed_date, days_ahead=3)
+            # 시세 보강 보류 큐 동기화 (이전 실행에서 보류된 종목)
+            try:
+                queue_path = deps['pending_queue'].path
+                files = deps['storage'].list_files(f"name = '{queue_path.name}'")
+                if files:
+                    deps['storage'].download_file(files[0]['id'], queue_path)
+                    deps['logger'].info(f"⬇️  보강 보류 큐 다운로드 완료: {queue_path}")
+            except Exception as e:
+                deps['logger'].warning(f"⚠️  보강 보류 큐 다운로드 실패 (빈 큐로 진행): {e}")
+
+        if pending_only:
+            # 보류 큐만 처리 (브라우저/크롤링 없음)
+            new_data = deps['crawler'].drain_pending_enrichment()
+        else:
+            # Playwright 초기화 후 일일 스케줄 크롤링 실행 (당일 + 3일)
+            deps['page_provider'].setup()
+            new_data = deps['crawler'].run_scheduled(start_date=parsed_date, days_ahead=3)
         
         if new_data:
             total_count = sum(len(df) for df in new_data.values())
@@ -78,12 +97,24 @@ def daily_update(
         
         # Google Drive 모드 처리
         if drive and new_data:
-            output_path = config.get_output_path(config.get_default_filename())
+            output_path = None
             try:
-                if output_path.exists():
+                # 정본 저장소가 엑셀이 아니면 업로드 직전에 통합 문서 생성
+                output_path = render_workbook(deps['exporter'])
+                if output_path:
                     deps['logger'].info("☁️  Google Drive 업로드 시작...")
                     file_id = deps['storage'].upload_file(output_path)
                     deps['logger'].info(f"✅ 업로드 성공 (ID: {file_id})")
+
+                queue_path = deps['pending_queue'].path
+                if queue_path.exists():
+                    deps['storage'].upload_file(queue_path)
+                    deps['logger'].info("✅ 보강 보류 큐 업로드 완료")
+
+                change_feed = deps['change_feed']
+                if change_feed is not None and change_feed.path.exists():
+                    deps['storage'].upload_file(change_feed.path)
+                    deps['logger'].info(f"✅ 변경 피드 업로드 완료 ({change_feed.count}건)")
             except Exception as e:
                 deps['logger'].warning(f"⚠️  Google Drive 처리 실패: {e}")
             finally:
@@ -102,5 +133,6 @@ def daily_update(
         raise
     finally:
         # 리소스 정리
+        deps['hedged_market_data'].shutdown()
         deps['page_provider'].cleanup()
         deps['logger'].info("\n✅ 리소스 정리 완료")
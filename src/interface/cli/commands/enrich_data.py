@@ -1,16 +1,20 @@
 import typer
 import os
-import pandas as pd
 from pathlib import Path
 from typing import Optional
 from config import config
-from interface.cli.dependencies import build_dependencies
+from interface.cli.dependencies import (
+    build_market_data_providers, build_change_feed, build_dataset_store, render_workbook
+)
 from core.services.enrichment_service import EnrichmentService
-from infra.adapters.data.pykrx_adapter import PyKrxAdapter
 from infra.adapters.data.excel_exporter import ExcelExporter
+from infra.adapters.data.workbook_loader import WorkbookLoader
 from infra.adapters.utils.console_logger import ConsoleLogger
+from infra.adapters.utils.krx_trading_calendar import KrxTradingCalendar
 from infra.adapters.storage.google_drive_adapter import GoogleDriveAdapter
 from core.services.stock_price_enricher import StockPriceEnricher
+from core.services.post_ipo_return_engine import PostIpoReturnEngine
+from infra.adapters.data.dataframe_mapper import DataFrameMapper
 
 def enrich_data(
     filepath: Optional[str] = typer.Option(
@@ -20,6 +24,9 @@ def enrich_data(
         help="대상 엑셀 파일 경로 (미지정 시 최신 파일 자동 검색)"
     ),
     drive: bool = typer.Option(False, "--drive", help="구글 드라이브 모드 (다운로드 -> 보강 -> 업로드 -> 삭제)"),
+    workers: int = typer.Option(config.ENRICH_MAX_WORKERS, "--workers", "-w", help="동시 보강 작업 수"),
+    incremental: bool = typer.Option(False, "--incremental", "-i", help="시세가 비어 있는 행만 보강"),
+    horizons: bool = typer.Option(True, "--horizons/--no-horizons", help="상장 후 D+N 종가/수익률 계산"),
 ):
     """
     기존 데이터에 OHLC 보강
@@ -35,6 +42,11 @@ def enrich_data(
     logger.info("=" * 60)
     
     target_path = None
+    # 통합 문서 로더를 명령 전체에서 공유 (로드한 시트를 저장 시 병합에 재사용)
+    workbook_loader = WorkbookLoader()
+    data_store = build_dataset_store(loader=workbook_loader, change_feed=build_change_feed())
+    # 정본 저장소가 엑셀이 아니면 통합 문서 대신 정본 데이터셋을 직접 로드 (--file 지정 시 제외)
+    from_store = not isinstance(data_store, ExcelExporter) and not filepath
     
     # 1. 대상 파일 결정 (Drive vs Local)
     if drive:
@@ -59,7 +71,7 @@ def enrich_data(
         except Exception as e:
             logger.error(f"❌ Google Drive 작업 실패: {e}")
             raise typer.Exit(code=1)
-    else:
+    elif not from_store:
         # Local 모드
         if filepath:
             target_path = Path(filepath)
@@ -71,58 +83,76 @@ def enrich_data(
             logger.info("💡 팁: 먼저 크롤러를 실행하여 데이터를 수집해주세요 (uv run crawler full)")
             raise typer.Exit(code=1)
 
-    logger.info(f"대상 파일: {target_path}")
+    logger.info(f"대상 파일: {target_path}" if target_path else f"대상 저장소: {config.DATASET_BACKEND}")
     
     # 2. 데이터 로드 및 보강
+    market_data_providers = None
     try:
-        excel_file = pd.ExcelFile(target_path)
-        yearly_data = {}
-        
-        for sheet_name in excel_file.sheet_names:
-            try:
-                # "2024년" 등에서 숫자만 추출
-                year_str = "".join(filter(str.isdigit, sheet_name))
-                if not year_str:
-                    continue
-                year = int(year_str)
-                
-                df = pd.read_excel(target_path, sheet_name=sheet_name)
-                yearly_data[year] = df
-                logger.info(f"    - [{year}년] {len(df)}건 로드 완료")
-            except ValueError:
-                continue
+        # 모든 연도 시트를 하나의 파일 핸들에서 파싱
+        yearly_data = data_store.load() if from_store else workbook_loader.load_years(target_path)
+        for year, df in yearly_data.items():
+            logger.info(f"    - [{year}년] {len(df)}건 로드 완료")
         
         if not yearly_data:
             logger.warning("❌ 처리할 데이터가 없습니다.")
             raise typer.Exit(code=1)
         
         # 서비스 초기화
-        pykrx_adapter = PyKrxAdapter()
-        data_exporter = ExcelExporter()
+        # 시세 제공자 (KRX 직접 조회 + PyKrx + FDR 헤지, KRX 동시 요청 수 제한)
+        market_data_providers = build_market_data_providers()
+        market_data = market_data_providers['market_data']
+        data_exporter = data_store
+        trading_calendar = KrxTradingCalendar()
         
         stock_enricher = StockPriceEnricher(
-            ticker_mapper=pykrx_adapter,
-            market_data_provider=pykrx_adapter,
-            logger=logger
+            ticker_mapper=market_data_providers['ticker_mapper'],
+            market_data_provider=market_data,
+            logger=logger,
+            trading_calendar=trading_calendar
         )
         
+        # 상장 후 기간별 수익률 엔진 (종목당 기간 시세 1회 조회)
+        return_engine = PostIpoReturnEngine(
+            history_provider=market_data,
+            logger=logger,
+            horizons=config.RETURN_HORIZONS
+        ) if horizons else None
+        
         enrichment_service = EnrichmentService(
             stock_enricher=stock_enricher,
             data_exporter=data_exporter,
-            logger=logger
+            logger=logger,
+            max_workers=workers,
+            return_engine=return_engine,
+            data_mapper=DataFrameMapper(),
+            trading_calendar=trading_calendar
         )
         
         # 보강 실행 (저장까지 수행됨)
-        enrichment_service.enrich_data(yearly_data)
+        enrichment_service.enrich_data(yearly_data, incremental=incremental)
         
+        hedged_market_data = market_data_providers['hedged_market_data']
+        for name, stats in hedged_market_data.latency_report().items():
+            if stats['calls']:
+                logger.info(
+                    f"    - [시세 제공자] {name}: 호출 {stats['calls']}건, 채택 {stats['wins']}건, "
+                    f"p50 {stats['p50']:.2f}초 / p90 {stats['p90']:.2f}초"
+                )
+        cache_stats = market_data.stats()
+        logger.info(
+            f"    - [시세 캐시] 적중 {cache_stats['hits']}건, 미적중 {cache_stats['misses']}건, "
+            f"병합 {cache_stats['coalesced']}건"
+        )
         logger.info("=" * 60)
         logger.info("🏁 보강 작업 완료")
         
         # 3. Drive 모드 후처리 (업로드 및 삭제)
         if drive:
-            output_path = config.get_output_path(config.get_default_filename())
+            output_path = None
             try:
-                if output_path.exists():
+                # 정본 저장소가 엑셀이 아니면 업로드 직전에 통합 문서 생성
+                output_path = render_workbook(data_store)
+                if output_path:
                     logger.info("☁️  Google Drive 업로드 시작...")
                     file_id = storage_adapter.upload_file(output_path)
                     logger.info(f"✅ 업로드 성공 (ID: {file_id})")
@@ -145,3 +175,7 @@ def enrich_data(
     except Exception as e:
         logger.error(f"❌ 작업 중 오류 발생: {e}")
         raise
+    finally:
+        # 헤지 실행 스레드 정리 (실패 시에도)
+        if market_data_providers is not None:
+            market_data_providers['hedged_market_data'].shutdown()
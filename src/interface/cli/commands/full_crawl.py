@@ -2,7 +2,7 @@ import typer
 import os
 from datetime import date
 from config import config
-from interface.cli.dependencies import build_dependencies
+from interface.cli.dependencies import build_dependencies, render_workbook
 
 def full_crawl(
     start_year: int = typer.Option(2020, "--start-year", "-s", help="크롤링 시작 연도"),
@@ -54,9 +54,11 @@ def full_crawl(
         
         # Google Drive 모드 처리
         if drive:
-            output_path = config.get_output_path(config.get_default_filename())
+            output_path = None
             try:
-                if output_path.exists():
+                # 정본 저장소가 엑셀이 아니면 업로드 직전에 통합 문서 생성
+                output_path = render_workbook(deps['exporter'])
+                if output_path:
                     deps['logger'].info("☁️  Google Drive 업로드 시작...")
                     file_id = deps['storage'].upload_file(output_path)
                     deps['logger'].info(f"✅ 업로드 성공 (ID: {file_id})")
@@ -78,5 +80,6 @@ def full_crawl(
         raise
     finally:
         # 리소스 정리
+        deps['hedged_market_data'].shutdown()
         deps['page_provider'].cleanup()
         deps['logger'].info("\n✅ 리소스 정리 완료")
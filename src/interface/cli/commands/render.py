@@ -0,0 +1,37 @@
+import typer
+from config import config
+from interface.cli.dependencies import build_dataset_store, render_workbook
+from infra.adapters.utils.console_logger import ConsoleLogger
+from infra.adapters.storage.google_drive_adapter import GoogleDriveAdapter
+
+def render(
+    drive: bool = typer.Option(False, "--drive", help="구글 드라이브 모드 (생성한 통합 문서 업로드)"),
+):
+    """
+    엑셀 통합 문서 생성
+
+    정본 데이터셋(DATASET_BACKEND)에서 연도별 시트로 구성된 통합 문서를 생성합니다.
+    내용이 기존 통합 문서와 같으면 다시 쓰지 않습니다.
+    """
+    logger = ConsoleLogger()
+
+    logger.info("=" * 60)
+    logger.info("📄 통합 문서 생성")
+    logger.info(f"🗄️  정본 저장소: {config.DATASET_BACKEND}")
+    logger.info("=" * 60)
+
+    output_path = render_workbook(build_dataset_store())
+    if not output_path:
+        logger.warning("❌ 생성할 데이터가 없습니다.")
+        raise typer.Exit(code=1)
+    logger.info(f"✅ 통합 문서: {output_path}")
+
+    if drive:
+        try:
+            logger.info("☁️  Google Drive 업로드 시작...")
+            file_id = GoogleDriveAdapter().upload_file(output_path)
+            logger.info(f"✅ 업로드 성공 (ID: {file_id})")
+        except Exception as e:
+            logger.warning(f"⚠️  Google Drive 업로드 실패: {e}")
+
+    logger.info("=" * 60)
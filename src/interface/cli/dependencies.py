@@ -1,22 +1,123 @@
 """
 CLI 의존성 주입 모듈
 """
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Optional
 
 from config import config
+from core.ports.data_ports import ChangeFeedPort, DatasetStorePort
 from core.services.crawler_service import CrawlerService
 from core.services.stock_price_enricher import StockPriceEnricher
 from infra.adapters.utils.console_logger import ConsoleLogger
 from infra.adapters.utils.date_calculator import DateCalculator
+from infra.adapters.utils.krx_trading_calendar import KrxTradingCalendar
 from infra.adapters.web.playwright_page_provider import PlaywrightPageProvider
 from infra.adapters.web.calendar_scraper_adapter import CalendarScraperAdapter
 from infra.adapters.web.detail_scraper_adapter import DetailScraperAdapter
 from infra.adapters.data.dataframe_mapper import DataFrameMapper
 from infra.adapters.data.excel_exporter import ExcelExporter
-# from infra.adapters.data.fdr_adapter import FDRAdapter
+from infra.adapters.data.parquet_dataset_store import ParquetDatasetStore
+from infra.adapters.data.sqlite_dataset_store import SqliteDatasetStore
+from infra.adapters.data.sharded_excel_store import ShardedExcelStore
+from infra.adapters.data.workbook_loader import WorkbookLoader
+from infra.adapters.data.fdr_adapter import FDRAdapter
+from infra.adapters.data.krx_adapter import KrxAdapter
 from infra.adapters.data.pykrx_adapter import PyKrxAdapter
+from infra.adapters.data.concurrency_limited_adapter import ConcurrencyLimitedAdapter
+from infra.adapters.data.coalescing_adapter import CoalescingAdapter
+from infra.adapters.data.fallback_ticker_mapper import FallbackTickerMapper
+from infra.adapters.data.hedged_market_data_adapter import HedgedMarketDataAdapter
+from infra.adapters.data.json_pending_queue import JsonPendingEnrichmentQueue
+from infra.adapters.data.jsonl_change_feed import JsonlChangeFeed
 from infra.adapters.storage.google_drive_adapter import GoogleDriveAdapter
 
+def build_market_data_providers() -> Dict[str, Any]:
+    """
+    시세 조회 어댑터 구성
+
+    - 티커 조회: KRX 직접 조회 (커넥션 풀 재사용, 동시 요청 수 제한), 찾지 못하면 PyKrx로 재조회
+    - 시세 조회: KRX 직접 조회 + PyKrx + FinanceDataReader 헤지 복합 어댑터
+    - 두 경로 모두 요청 병합/결과 캐시(CoalescingAdapter)를 앞단에 배치
+
+    Returns:
+        Dict: ticker_mapper, market_data, hedged_market_data(지연 통계/종료용)
+    """
+    krx_adapter = ConcurrencyLimitedAdapter(
+        KrxAdapter(pool_size=config.KRX_MAX_CONCURRENCY), max_concurrency=config.KRX_MAX_CONCURRENCY
+    )
+    pykrx_adapter = ConcurrencyLimitedAdapter(
+        PyKrxAdapter(), max_concurrency=config.KRX_MAX_CONCURRENCY
+    )
+    fdr_adapter = ConcurrencyLimitedAdapter(
+        FDRAdapter(), max_concurrency=config.KRX_MAX_CONCURRENCY
+    )
+    hedged_market_data = HedgedMarketDataAdapter(
+        providers=[("krx", krx_adapter), ("pykrx", pykrx_adapter), ("fdr", fdr_adapter)],
+        hedge_percentile=config.MARKET_DATA_HEDGE_PERCENTILE,
+        default_hedge_delay=config.MARKET_DATA_HEDGE_DEFAULT_DELAY
+    )
+    return {
+        'ticker_mapper': CoalescingAdapter(
+            FallbackTickerMapper(krx_adapter, pykrx_adapter), cache_size=config.MARKET_DATA_CACHE_SIZE,
+            negative_ttl=config.MARKET_DATA_NEGATIVE_TTL
+        ),
+        'market_data': CoalescingAdapter(
+            hedged_market_data, cache_size=config.MARKET_DATA_CACHE_SIZE,
+            negative_ttl=config.MARKET_DATA_NEGATIVE_TTL
+        ),
+        'hedged_market_data': hedged_market_data,
+    }
+
+def build_change_feed() -> Optional[ChangeFeedPort]:
+    """실행별 변경 피드 구성 (config.CHANGE_FEED_ENABLED가 False면 None)"""
+    return JsonlChangeFeed() if config.CHANGE_FEED_ENABLED else None
+
+def build_dataset_store(
+    loader: Optional[WorkbookLoader] = None, change_feed: Optional[ChangeFeedPort] = None
+) -> DatasetStorePort:
+    """
+    정본 데이터셋 저장소 구성 (config.DATASET_BACKEND)
+
+    loader를 넘기면 명령 안에서 이미 읽은 통합 문서 시트를 저장소가 재사용합니다.
+    change_feed를 넘기면 저장 시 추가/변경된 행을 피드에 기록합니다.
+
+    - excel: 엑셀 통합 문서가 정본 (기본값)
+    - parquet: 연도별 Parquet 데이터셋이 정본, 엑셀은 render_workbook()으로 생성하는 파생 결과물
+    - sqlite: SQLite 파일이 정본, (종목명, 상장일) 고유 인덱스로 행 단위 upsert
+    - sharded: 연도별 엑셀 파일(샤드) + manifest.json, 통합 문서는 render_workbook()으로 생성
+    (parquet/sqlite/sharded 저장소가 비어 있으면 기존 통합 문서에서 가져옴)
+    """
+    loader = loader or WorkbookLoader()
+    backend = config.DATASET_BACKEND.lower()
+    seed_workbook = config.OUTPUT_DIR / config.get_default_filename()
+    if backend == "excel":
+        return ExcelExporter(loader=loader, change_feed=change_feed)
+    if backend == "parquet":
+        return ParquetDatasetStore(seed_workbook=seed_workbook, loader=loader, change_feed=change_feed)
+    if backend == "sqlite":
+        return SqliteDatasetStore(seed_workbook=seed_workbook, loader=loader, change_feed=change_feed)
+    if backend == "sharded":
+        return ShardedExcelStore(seed_workbook=seed_workbook, loader=loader, change_feed=change_feed)
+    raise ValueError(f"지원하지 않는 DATASET_BACKEND입니다: {config.DATASET_BACKEND}")
+
+def render_workbook(data_store: DatasetStorePort) -> Optional[Path]:
+    """
+    업로드/배포용 엑셀 통합 문서 경로 반환
+
+    엑셀이 정본이면 기존 파일을 그대로 사용하고,
+    그 외 저장소는 정본 데이터로 통합 문서를 다시 생성합니다 (내용이 같으면 생략).
+
+    Returns:
+        통합 문서 경로 (데이터가 없으면 None)
+    """
+    if isinstance(data_store, ExcelExporter):
+        output_path = config.get_output_path(config.get_default_filename())
+        return output_path if output_path.exists() else None
+    data = data_store.load()
+    if not data:
+        return None
+    return ExcelExporter().render(data)
+
 def build_dependencies(headless: bool = True) -> Dict[str, Any]:
     """
     의존성 주입 컨테이너 역할
@@ -30,21 +131,24 @@ def build_dependencies(headless: bool = True) -> Dict[str, Any]:
     # 1. 어댑터 생성
     logger = ConsoleLogger()
     date_calculator = DateCalculator()
+    trading_calendar = KrxTradingCalendar()
     
     # 2. Data
-    # fdr_adapter = FDRAdapter()
-    pykrx_adapter = PyKrxAdapter()
+    market_data_providers = build_market_data_providers()
     data_mapper = DataFrameMapper()
-    data_exporter = ExcelExporter()
+    change_feed = build_change_feed()
+    data_exporter = build_dataset_store(change_feed=change_feed)
+    pending_queue = JsonPendingEnrichmentQueue()
     
     # 3. Storage
     storage = GoogleDriveAdapter()
 
     # 3.5 Enrichment
     stock_enricher = StockPriceEnricher(
-        ticker_mapper=pykrx_adapter,
-        market_data_provider=pykrx_adapter,
-        logger=logger
+        ticker_mapper=market_data_providers['ticker_mapper'],
+        market_data_provider=market_data_providers['market_data'],
+        logger=logger,
+        trading_calendar=trading_calendar
     )
     
     # 4. Web Scraping
@@ -63,7 +167,10 @@ def build_dependencies(headless: bool = True) -> Dict[str, Any]:
         data_exporter=data_exporter,
         date_calculator=date_calculator,
         stock_enricher=stock_enricher,
-        logger=logger
+        logger=logger,
+        trading_calendar=trading_calendar,
+        pending_queue=pending_queue,
+        max_pending_attempts=config.PENDING_ENRICHMENT_MAX_ATTEMPTS
     )
     
     return {
@@ -71,5 +178,10 @@ def build_dependencies(headless: bool = True) -> Dict[str, Any]:
         'page_provider': page_provider,
         'logger': logger,
         'exporter': data_exporter,
+        'change_feed': change_feed,
         'storage': storage,
+        'market_data': market_data_providers['market_data'],
+        'hedged_market_data': market_data_providers['hedged_market_data'],
+        'trading_calendar': trading_calendar,
+        'pending_queue': pending_queue,
     }
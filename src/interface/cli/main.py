@@ -5,6 +5,7 @@ import typer
 from interface.cli.commands.full_crawl import full_crawl
 from interface.cli.commands.daily_update import daily_update
 from interface.cli.commands.enrich_data import enrich_data
+from interface.cli.commands.render import render
 from interface.cli.commands.auth import auth_drive
 from interface.cli.commands.health import health_check
 
@@ -13,6 +14,7 @@ app = typer.Typer(help="IPO 데이터 크롤러 CLI")
 app.command("full")(full_crawl)
 app.command("daily")(daily_update)
 app.command("enrich")(enrich_data)
+app.command("render")(render)
 app.command("auth")(auth_drive)
 app.command("healthcheck")(health_check)
 
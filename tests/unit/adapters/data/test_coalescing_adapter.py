@@ -0,0 +1,110 @@
+"""
+CoalescingAdapter / SingleFlight 단위 테스트
+"""
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from infra.adapters.data.coalescing_adapter import CoalescingAdapter
+from infra.adapters.utils.singleflight import LRUCache
+
+
+class SlowProvider:
+    """호출 횟수를 기록하는 느린 가짜 제공자"""
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _record(self, *key):
+        with self._lock:
+            self.calls.append(key)
+        time.sleep(self.latency)
+
+    def get_ticker(self, stock_name):
+        self._record("ticker", stock_name)
+        return {"A": "000001"}.get(stock_name)
+
+    def get_ohlc(self, ticker, target_date):
+        self._record("ohlc", ticker, target_date)
+        if ticker == "ERROR":
+            raise RuntimeError("boom")
+        return {"Open": 1, "High": 1, "Low": 1, "Close": 1}
+
+
+class TestCoalescingAdapter:
+    """CoalescingAdapter 클래스 테스트"""
+
+    def test_concurrent_calls_are_coalesced(self):
+        """동시에 들어온 같은 키의 요청은 한 번만 실행"""
+        provider = SlowProvider()
+        adapter = CoalescingAdapter(provider)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: adapter.get_ohlc("000001", date(2024, 1, 2)), range(8)))
+
+        assert all(r["Close"] == 1 for r in results)
+        assert len(provider.calls) == 1
+
+    def test_negative_results_are_cached_briefly(self):
+        """조회 실패(None) 결과는 negative_ttl 동안만 캐시"""
+        provider = SlowProvider(latency=0)
+        adapter = CoalescingAdapter(provider)
+
+        assert adapter.get_ticker("UNKNOWN") is None
+        assert adapter.get_ticker("UNKNOWN") is None
+        assert adapter.get_ticker("A") == "000001"
+
+        assert provider.calls == [("ticker", "UNKNOWN"), ("ticker", "A")]
+        assert adapter.stats()["hits"] == 1
+
+    def test_negative_results_expire(self):
+        """일시 장애로 인한 None 결과는 만료 후 재조회"""
+        provider = SlowProvider(latency=0)
+        adapter = CoalescingAdapter(provider, negative_ttl=0.05)
+
+        adapter.get_ticker("UNKNOWN")
+        time.sleep(0.06)
+        adapter.get_ticker("UNKNOWN")
+        adapter.get_ticker("A")
+        adapter.get_ticker("A")
+
+        assert provider.calls == [("ticker", "UNKNOWN"), ("ticker", "UNKNOWN"), ("ticker", "A")]
+
+    def test_negative_results_not_cached_without_ttl(self):
+        provider = SlowProvider(latency=0)
+        adapter = CoalescingAdapter(provider, negative_ttl=0)
+
+        adapter.get_ticker("UNKNOWN")
+        adapter.get_ticker("UNKNOWN")
+
+        assert len(provider.calls) == 2
+
+    def test_errors_are_not_cached(self):
+        """예외는 모든 대기자에게 전달되고 캐시되지 않음"""
+        provider = SlowProvider(latency=0)
+        adapter = CoalescingAdapter(provider)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                adapter.get_ohlc("ERROR", date(2024, 1, 2))
+
+        assert len(provider.calls) == 2
+
+
+class TestLRUCache:
+    """LRUCache 클래스 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", None)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == (True, 1)
+        assert cache.get("b") == (False, None)
+        assert cache.get("c") == (True, 3)
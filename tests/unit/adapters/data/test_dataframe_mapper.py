@@ -3,8 +3,9 @@ DataFrameMapper 단위 테스트
 """
 import pytest
 import pandas as pd
+from dataclasses import replace
 from datetime import date
-from core.domain.models import StockInfo
+from core.domain.models import StockBatch, StockInfo
 from infra.adapters.data.dataframe_mapper import DataFrameMapper
 
 
@@ -36,12 +37,12 @@ class TestDataFrameMapper:
                 offering_amount=110000,
                 underwriter="테스트증권",
                 listing_date="2024-01-01",
-                competition_rate="1000:1",
+                competition_rate=1000.0,
                 emp_shares=100,
                 inst_shares=5000,
                 retail_shares=2000,
-                tradable_shares_count="3000",
-                tradable_shares_percent="30%",
+                tradable_shares_count=3000,
+                tradable_shares_percent=30.0,
             ),
             StockInfo(
                 name="샘플기업",
@@ -59,12 +60,12 @@ class TestDataFrameMapper:
                 offering_amount=440000,
                 underwriter="샘플증권",
                 listing_date="2024-02-01",
-                competition_rate="500:1",
+                competition_rate=500.5,
                 emp_shares=200,
                 inst_shares=10000,
                 retail_shares=4000,
-                tradable_shares_count="6000",
-                tradable_shares_percent="30%",
+                tradable_shares_count=6000,
+                tradable_shares_percent=30.0,
             )
         ]
 
@@ -121,3 +122,41 @@ class TestDataFrameMapper:
             "우리사주조합", "기관투자자", "일반청약자", "유통가능물량(주)", "유통가능물량(%)"
         ]
         assert list(df.columns) == expected_columns
+
+    def test_to_dataframe_applies_dtype_policy(self, mapper, sample_stocks):
+        """반복 문자열은 category, 종목명은 string, 숫자는 정수 타입"""
+        df = mapper.to_dataframe(sample_stocks)
+
+        for col in ["시장구분", "업종", "주간사"]:
+            assert isinstance(df[col].dtype, pd.CategoricalDtype)
+        assert pd.api.types.is_float_dtype(df["기관경쟁률"].dtype)
+        assert df["기관경쟁률"].tolist() == [1000.0, 500.5]
+        assert isinstance(df["종목명"].dtype, pd.StringDtype)
+        assert pd.api.types.is_integer_dtype(df["확정공모가"].dtype)
+        assert df["시장구분"].tolist() == ["코스닥", "코스피"]
+
+    def test_to_dataframe_normalizes_mixed_numeric_values(self, mapper, sample_stocks):
+        """파서 결과(int)와 실수, 결측, 숫자가 아닌 값이 섞여도 Int64 정수로 정규화"""
+        stocks = [
+            replace(sample_stocks[0], tradable_shares_count=1234, revenue=None, capital=10.6),
+            replace(sample_stocks[1], tradable_shares_count=5678, revenue=7, capital="N/A"),
+        ]
+
+        df = mapper.to_dataframe(stocks)
+
+        assert df["유통가능물량(주)"].tolist() == [1234, 5678]
+        assert df["매출액(백만원)"].isna().tolist() == [True, False]
+        assert df["매출액(백만원)"].iloc[1] == 7
+        assert df["자본금(백만원)"].iloc[0] == 11
+        assert pd.isna(df["자본금(백만원)"].iloc[1])
+        assert df["희망공모가액"].tolist() == ["10000~12000", "20000~24000"]
+
+    def test_to_dataframe_from_batch_matches_list(self, mapper, sample_stocks):
+        """StockBatch 입력은 StockInfo 리스트와 같은 DataFrame을 생성"""
+        stocks = sample_stocks + [replace(sample_stocks[0], name="보강기업", close_price=13000, growth_rate=18.2)]
+
+        expected = mapper.to_dataframe(stocks)
+        result = mapper.to_dataframe(StockBatch(stocks))
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert mapper.to_dataframe(StockBatch()).empty
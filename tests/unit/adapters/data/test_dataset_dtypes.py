@@ -0,0 +1,108 @@
+"""
+dataset_dtypes 단위 테스트 (category / Arrow dtype 정책)
+"""
+import pytest
+import pandas as pd
+
+from infra.adapters.data import dataset_dtypes
+from infra.adapters.data.dataset_dtypes import apply_dtypes, resolve_backend
+
+
+def sample_frame(rows=4):
+    return pd.DataFrame({
+        "종목명": [f"기업{i}" for i in range(rows)],
+        "시장구분": ["코스닥", "코스피"] * (rows // 2),
+        "주간사": ["A증권", None] * (rows // 2),
+        "상장일": ["2024.01.02"] * rows,
+        "종가": [1000.0, None] * (rows // 2),
+        "유통가능물량(주)": ["1,000", "N/A"] * (rows // 2),
+        "수익률(%)": [1.5] * rows,
+    })
+
+
+class TestApplyDtypes:
+    """apply_dtypes 함수 테스트"""
+
+    def test_numpy_nullable_backend(self):
+        df = apply_dtypes(sample_frame(), "numpy_nullable")
+
+        assert isinstance(df["시장구분"].dtype, pd.CategoricalDtype)
+        assert set(df["시장구분"].cat.categories) == {"코스닥", "코스피"}
+        assert df["주간사"].isna().tolist() == [False, True, False, True]
+        assert df["종목명"].dtype == pd.StringDtype("python")
+        assert str(df["종가"].dtype) == "Int64"
+        assert str(df["수익률(%)"].dtype) == "Float64"
+        # 과거 파일의 쉼표 숫자 문자열은 정수, "N/A"는 결측
+        assert str(df["유통가능물량(주)"].dtype) == "Int64"
+        assert df["유통가능물량(주)"].isna().tolist() == [False, True, False, True]
+        assert df["유통가능물량(주)"].iloc[0] == 1000
+
+    def test_legacy_numeric_text_is_coerced(self):
+        df = apply_dtypes(pd.DataFrame({
+            "기관경쟁률": ["1235:1", "1,000.5:1", "-"],
+            "유통가능물량(%)": ["30%", "12.5 %", None],
+            "매출액(백만원)": ["100", "약 200", None],
+        }), "numpy_nullable")
+
+        assert df["기관경쟁률"].tolist()[:2] == [1235.0, 1000.5]
+        assert pd.isna(df["기관경쟁률"].iloc[2])
+        assert df["유통가능물량(%)"].tolist()[:2] == [30.0, 12.5]
+        # 숫자로 해석되지 않는 값이 있으면 원문 유지
+        assert df["매출액(백만원)"].tolist()[:2] == ["100", "약 200"]
+
+    def test_horizon_columns_use_schema_kinds(self):
+        # 엑셀에서 읽으면 정수 컬럼도 float로 들어옴 (결측 포함)
+        df = apply_dtypes(pd.DataFrame({
+            "D+1 종가": [12000.0, None],
+            "D+1 수익률(%)": ["20.0", None],
+        }), "numpy_nullable")
+
+        assert str(df["D+1 종가"].dtype) == "Int64"
+        assert str(df["D+1 수익률(%)"].dtype) == "Float64"
+        assert df["D+1 수익률(%)"].iloc[0] == 20.0
+
+    def test_pyarrow_backend(self):
+        pytest.importorskip("pyarrow")
+
+        df = apply_dtypes(sample_frame(), "pyarrow")
+
+        assert df["종목명"].dtype == pd.StringDtype("pyarrow")
+        assert str(df["종가"].dtype) == "int64[pyarrow]"
+        assert df["종가"].tolist()[0] == 1000
+        assert isinstance(df["시장구분"].dtype, pd.CategoricalDtype)
+
+    def test_non_string_values_in_text_columns_become_strings(self):
+        df = apply_dtypes(pd.DataFrame({"종목명": pd.Series([123, None], dtype=object), "업종": [1, "IT"]}), "numpy_nullable")
+
+        assert df["종목명"].tolist()[0] == "123"
+        assert df["종목명"].isna().tolist() == [False, True]
+        assert sorted(df["업종"].cat.categories) == ["1", "IT"]
+
+    def test_category_reduces_memory(self):
+        raw = sample_frame(2000)
+        before = raw["시장구분"].astype(object).memory_usage(deep=True)
+
+        after = apply_dtypes(raw.copy(), "numpy_nullable")["시장구분"].memory_usage(deep=True)
+
+        assert after < before / 4
+
+
+class TestResolveBackend:
+    """resolve_backend 함수 테스트"""
+
+    def test_auto_prefers_pyarrow(self, monkeypatch):
+        monkeypatch.setattr(dataset_dtypes, "ARROW_AVAILABLE", False)
+        assert resolve_backend("auto") == "numpy_nullable"
+
+        monkeypatch.setattr(dataset_dtypes, "ARROW_AVAILABLE", True)
+        assert resolve_backend("auto") == "pyarrow"
+
+    def test_pyarrow_requires_package(self, monkeypatch):
+        monkeypatch.setattr(dataset_dtypes, "ARROW_AVAILABLE", False)
+
+        with pytest.raises(ImportError):
+            resolve_backend("pyarrow")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            resolve_backend("numpy")
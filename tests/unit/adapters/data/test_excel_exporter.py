@@ -0,0 +1,175 @@
+"""
+ExcelExporter 단위 테스트 (병합 / 변경 시트만 기록)
+"""
+import os
+import threading
+import pytest
+import pandas as pd
+from openpyxl import load_workbook
+
+from infra.adapters.data.excel_exporter import ExcelExporter
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["종목명", "상장일", "종가", "수익률(%)"])
+
+
+class TestExcelExporter:
+    """ExcelExporter 클래스 테스트"""
+
+    @pytest.fixture
+    def exporter(self, tmp_path):
+        return ExcelExporter(tmp_path)
+
+    @pytest.fixture
+    def filepath(self, tmp_path):
+        return tmp_path / "신규상장종목.xlsx"
+
+    def test_merge_keeps_existing_values_for_empty_cells(self, exporter, filepath):
+        """부분 행(시세만 있는 행)은 기존 값을 지우지 않음"""
+        exporter.export({2024: frame([["A", "2024.01.02", None, None], ["B", "2024.01.03", 500, 1.0]])})
+
+        exporter.export({2024: pd.DataFrame({"종목명": ["A"], "상장일": ["2024-01-02"], "종가": [1100]})})
+
+        result = pd.read_excel(filepath, sheet_name="2024년")
+        assert list(result["종목명"]) == ["A", "B"]
+        assert result["종가"].tolist() == [1100, 500]
+        assert result["수익률(%)"].iloc[1] == 1.0
+
+    def test_legacy_growth_column_is_merged(self, exporter, filepath):
+        """과거 보강 결과의 "수익률" 컬럼은 "수익률(%)"로 통합되어 중복되지 않음"""
+        pd.DataFrame({"종목명": ["A"], "상장일": ["2024.01.02"], "수익률": [5.0]}).to_excel(
+            filepath, sheet_name="2024년", index=False)
+
+        exporter.export({2024: frame([["B", "2024.01.03", 500, 1.0]])})
+
+        result = pd.read_excel(filepath, sheet_name="2024년")
+        assert "수익률" not in result.columns
+        assert result["수익률(%)"].tolist() == [5.0, 1.0]
+
+    def test_sorts_by_parsed_listing_date(self, exporter, filepath):
+        exporter.export({2024: frame([["B", "2024.12.01", 1, 1], ["A", "2024-01-15", 1, 1]])})
+
+        result = pd.read_excel(filepath, sheet_name="2024년")
+        assert list(result["종목명"]) == ["A", "B"]
+
+    def test_unchanged_data_skips_write(self, exporter, filepath):
+        """내용이 같으면 파일을 다시 쓰지 않음 (새 인스턴스에서도 사이드카로 판단)"""
+        exporter.export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+        mtime = os.stat(filepath).st_mtime_ns
+
+        ExcelExporter(filepath.parent).export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+
+        assert os.stat(filepath).st_mtime_ns == mtime
+
+    def test_rewrites_only_changed_sheets(self, exporter, filepath):
+        """변경된 연도 시트만 교체하고 나머지 시트와 순서는 유지"""
+        exporter.export({
+            2023: frame([["A", "2023.01.02", 1000, 10.0]]),
+            2025: frame([["C", "2025.01.02", 3000, 30.0]]),
+        })
+
+        exporter.export({
+            2024: frame([["B", "2024.01.02", 2000, 20.0]]),
+            2025: frame([["D", "2025.02.02", 4000, 40.0]]),
+        })
+
+        workbook = load_workbook(filepath, read_only=True)
+        assert workbook.sheetnames == ["2023년", "2024년", "2025년"]
+        workbook.close()
+        sheets = pd.read_excel(filepath, sheet_name=None)
+        assert list(sheets["2023년"]["종목명"]) == ["A"]
+        assert list(sheets["2024년"]["종목명"]) == ["B"]
+        assert list(sheets["2025년"]["종목명"]) == ["C", "D"]
+
+    def test_external_change_invalidates_hashes(self, exporter, filepath):
+        """엑셀 파일이 외부에서 바뀌면 저장된 해시를 신뢰하지 않음"""
+        exporter.export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+        pd.DataFrame({"종목명": ["X"]}).to_excel(filepath, sheet_name="2024년", index=False)
+
+        ExcelExporter(filepath.parent).export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+
+        result = pd.read_excel(filepath, sheet_name="2024년")
+        assert set(result["종목명"]) == {"X", "A"}
+
+    def test_downloaded_copy_without_manifest_skips_unchanged_write(self, exporter, filepath):
+        """사이드카가 없는 통합 문서(Drive에서 내려받은 파일 등)는 시트 내용으로 해시를 다시 계산"""
+        exporter.export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+        manifest_path = filepath.with_name(f".{filepath.name}.sheets.json")
+        manifest_path.unlink()
+        os.utime(filepath, ns=(0, 0))   # 다운로드로 mtime이 바뀐 경우
+
+        ExcelExporter(filepath.parent).export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+
+        assert os.stat(filepath).st_mtime_ns == 0
+        assert not manifest_path.exists()
+
+    def test_render_recomputes_hashes_without_manifest(self, exporter, filepath):
+        """render도 사이드카가 없으면 통합 문서 내용으로 비교하여 같으면 다시 쓰지 않음"""
+        data = {2024: frame([["A", "2024.01.02", 1000, 10.0]])}
+        exporter.render(data)
+        filepath.with_name(f".{filepath.name}.sheets.json").unlink()
+        os.utime(filepath, ns=(0, 0))
+
+        ExcelExporter(filepath.parent).render(data)
+
+        assert os.stat(filepath).st_mtime_ns == 0
+
+    @pytest.mark.parametrize("engine", ["streaming", "openpyxl"])
+    def test_write_engines_produce_same_sheets(self, tmp_path, engine):
+        exporter = ExcelExporter(tmp_path, write_engine=engine)
+        exporter.export({2023: frame([["A", "2023.01.02", 1000, 10.0]])})
+        exporter.export({2024: frame([["B", "2024.01.02", 2000, None]])})
+
+        sheets = pd.read_excel(tmp_path / "신규상장종목.xlsx", sheet_name=None)
+        assert list(sheets) == ["2023년", "2024년"]
+        assert sheets["2023년"]["종가"].tolist() == [1000]
+        assert sheets["2024년"]["수익률(%)"].isna().all()
+        header = load_workbook(tmp_path / "신규상장종목.xlsx")["2024년"]["A1"]
+        assert header.font.bold
+
+    def test_column_widths_past_column_z(self, exporter, filepath):
+        """26개를 넘는 컬럼도 각자의 열 문자(AA, AB ...)에 너비 지정"""
+        wide = pd.DataFrame([["A", "2024.01.02"] + ["x" * 40] * 28],
+                            columns=["종목명", "상장일"] + [f"컬럼{i}" for i in range(28)])
+        exporter.export({2024: wide})
+
+        worksheet = load_workbook(filepath)["2024년"]
+        assert worksheet.max_column == 30
+        assert worksheet.column_dimensions["AD"].width == 34
+        assert worksheet.column_dimensions["A"].width == 10
+
+    def test_default_write_engine_replaces_changed_sheets_only(self, tmp_path):
+        """기본 기록 방식은 변경 시트만 교체하는 openpyxl (streaming은 선택)"""
+        assert ExcelExporter(tmp_path).write_engine == "openpyxl"
+
+    def test_unknown_write_engine_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            ExcelExporter(tmp_path, write_engine="xlsxwriter")
+
+    def test_unreadable_existing_file_aborts_without_overwrite(self, exporter, filepath):
+        """기존 파일을 읽지 못하면 덮어쓰지 않고 중단"""
+        filepath.write_bytes(b"not a workbook")
+
+        with pytest.raises(Exception):
+            exporter.export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+
+        assert filepath.read_bytes() == b"not a workbook"
+
+    def test_concurrent_exports_keep_all_rows(self, tmp_path, filepath):
+        """동시에 실행된 export도 잠금으로 직렬화되어 갱신이 유실되지 않음"""
+        ExcelExporter(tmp_path).export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+        names = ["B", "C", "D", "E"]
+        threads = [
+            threading.Thread(
+                target=lambda n=n: ExcelExporter(tmp_path).export({2024: frame([[n, "2024.02.02", 1, 1.0]])})
+            )
+            for n in names
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        result = pd.read_excel(filepath, sheet_name="2024년")
+        assert sorted(result["종목명"]) == ["A"] + names
@@ -0,0 +1,26 @@
+"""
+FallbackTickerMapper 단위 테스트
+"""
+from unittest.mock import Mock
+
+from infra.adapters.data.fallback_ticker_mapper import FallbackTickerMapper
+
+
+class TestFallbackTickerMapper:
+    """FallbackTickerMapper 클래스 테스트"""
+
+    def test_uses_primary_result(self):
+        primary, fallback = Mock(), Mock()
+        primary.get_ticker.return_value = "005930"
+
+        assert FallbackTickerMapper(primary, fallback).get_ticker("삼성전자") == "005930"
+        fallback.get_ticker.assert_not_called()
+
+    def test_falls_back_when_primary_finds_nothing(self):
+        """KRX 목록 조회 실패(None) 시 보조 어댑터로 재조회"""
+        primary, fallback = Mock(), Mock()
+        primary.get_ticker.return_value = None
+        fallback.get_ticker.return_value = "000001"
+
+        assert FallbackTickerMapper(primary, fallback).get_ticker("신규상장") == "000001"
+        fallback.get_ticker.assert_called_once_with("신규상장")
@@ -0,0 +1,130 @@
+"""
+HedgedMarketDataAdapter 단위 테스트 (로컬 가짜 시세 제공자 사용)
+"""
+import time
+import threading
+import pytest
+from datetime import date
+
+from core.ports.enrichment_ports import MarketDataProviderPort
+from infra.adapters.data.concurrency_limited_adapter import ConcurrencyLimitedAdapter
+from infra.adapters.data.hedged_market_data_adapter import HedgedMarketDataAdapter, LatencyStats
+
+
+class FakeMarketDataProvider(MarketDataProviderPort):
+    """지연 시간과 응답을 지정할 수 있는 가짜 시세 제공자"""
+
+    def __init__(self, close: int = None, latency: float = 0.0):
+        self.close = close
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_ohlc(self, ticker, target_date):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        if self.close is None:
+            return None
+        return {"Open": self.close, "High": self.close, "Low": self.close, "Close": self.close}
+
+
+class TestHedgedMarketDataAdapter:
+    """HedgedMarketDataAdapter 클래스 테스트"""
+
+    TARGET = ("000001", date(2024, 1, 2))
+
+    def test_fast_primary_does_not_hedge(self):
+        """주 제공자가 빠르면 헤지 요청 없이 주 제공자 응답 사용"""
+        primary = FakeMarketDataProvider(close=1000)
+        secondary = FakeMarketDataProvider(close=2000)
+        adapter = HedgedMarketDataAdapter(
+            [("primary", primary), ("secondary", secondary)], default_hedge_delay=0.5
+        )
+
+        result = adapter.get_ohlc(*self.TARGET)
+
+        assert result["Close"] == 1000
+        assert secondary.calls == 0
+        assert adapter.hedged_requests == 0
+        assert adapter.latency_report()["primary"]["wins"] == 1
+
+    def test_slow_primary_is_hedged(self):
+        """주 제공자가 헤지 기준 지연을 넘으면 보조 제공자 응답 채택"""
+        primary = FakeMarketDataProvider(close=1000, latency=0.5)
+        secondary = FakeMarketDataProvider(close=2000)
+        adapter = HedgedMarketDataAdapter(
+            [("primary", primary), ("secondary", secondary)], default_hedge_delay=0.05
+        )
+
+        started = time.perf_counter()
+        result = adapter.get_ohlc(*self.TARGET)
+
+        assert result["Close"] == 2000
+        assert time.perf_counter() - started < 0.4
+        assert adapter.hedged_requests == 1
+        assert adapter.latency_report()["secondary"]["wins"] == 1
+
+    def test_context_manager_shuts_down_on_error(self):
+        """with 블록에서 예외가 나도 실행 스레드 정리"""
+        adapter = HedgedMarketDataAdapter([("primary", FakeMarketDataProvider(close=1000))])
+
+        with pytest.raises(RuntimeError):
+            with adapter:
+                raise RuntimeError("보강 실패")
+
+        with pytest.raises(RuntimeError):
+            adapter.get_ohlc(*self.TARGET)
+
+    def test_invalid_primary_falls_back_immediately(self):
+        """주 제공자가 빈 응답이면 즉시 보조 제공자로 대체"""
+        primary = FakeMarketDataProvider(close=None)
+        secondary = FakeMarketDataProvider(close=2000)
+        adapter = HedgedMarketDataAdapter(
+            [("primary", primary), ("secondary", secondary)], default_hedge_delay=5.0
+        )
+
+        started = time.perf_counter()
+        result = adapter.get_ohlc(*self.TARGET)
+
+        assert result["Close"] == 2000
+        assert time.perf_counter() - started < 1.0
+        assert adapter.latency_report()["primary"]["failures"] == 1
+
+    def test_all_providers_fail(self):
+        """모든 제공자가 실패하면 None"""
+        adapter = HedgedMarketDataAdapter(
+            [("a", FakeMarketDataProvider()), ("b", FakeMarketDataProvider())], default_hedge_delay=0.01
+        )
+
+        assert adapter.get_ohlc(*self.TARGET) is None
+
+    def test_hedge_delay_uses_latency_percentile(self):
+        """표본이 충분하면 지연 백분위수를 헤지 대기 시간으로 사용"""
+        adapter = HedgedMarketDataAdapter(
+            [("primary", FakeMarketDataProvider(close=1))], hedge_percentile=90, min_samples=10
+        )
+        for latency in [0.1] * 8 + [1.0] * 2:
+            adapter.stats["primary"].record(latency, True)
+
+        assert adapter._hedge_delay("primary") == pytest.approx(1.0)
+
+    def test_latency_excludes_concurrency_limit_wait(self):
+        """동시 호출 제한 대기 시간은 제공자 지연 통계에 포함하지 않음"""
+        limited = ConcurrencyLimitedAdapter(FakeMarketDataProvider(close=1000, latency=0.01), max_concurrency=1)
+        adapter = HedgedMarketDataAdapter([("primary", limited)], default_hedge_delay=1.0)
+
+        limited._semaphore.acquire()
+        threading.Timer(0.3, limited._semaphore.release).start()
+        with adapter:
+            assert adapter.get_ohlc(*self.TARGET)["Close"] == 1000
+
+        assert adapter.stats["primary"].percentile(100) < 0.2
+
+    def test_latency_stats_percentile(self):
+        stats = LatencyStats()
+        for value in range(1, 101):
+            stats.record(value / 100, True)
+
+        assert stats.percentile(50) == pytest.approx(0.5)
+        assert stats.percentile(99) == pytest.approx(0.99)
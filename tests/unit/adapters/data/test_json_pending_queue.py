@@ -0,0 +1,88 @@
+"""
+JsonPendingEnrichmentQueue 단위 테스트
+"""
+import pytest
+from datetime import date
+
+from core.domain.models import PendingEnrichment
+from infra.adapters.data.json_pending_queue import JsonPendingEnrichmentQueue
+from infra.adapters.utils.file_lock import FileLock, FileLockTimeout
+
+
+class TestJsonPendingEnrichmentQueue:
+    """JsonPendingEnrichmentQueue 클래스 테스트"""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        return JsonPendingEnrichmentQueue(tmp_path / "pending.json")
+
+    def test_due_returns_only_listed_items(self, queue):
+        """상장일이 기준일 이전인 항목만 반환"""
+        queue.enqueue([
+            PendingEnrichment(name="A", listing_date="2024.11.26", confirmed_price=1000),
+            PendingEnrichment(name="B", listing_date="2024.11.28", confirmed_price=2000),
+        ])
+
+        due = queue.due(date(2024, 11, 27))
+
+        assert [item.name for item in due] == ["A"]
+
+    def test_persists_across_instances(self, queue):
+        """파일로 영속화되어 다음 실행에서도 조회 가능"""
+        queue.enqueue([PendingEnrichment(name="A", listing_date="2024.11.26")])
+
+        reloaded = JsonPendingEnrichmentQueue(queue.path)
+
+        assert len(reloaded) == 1
+        assert reloaded.due(date(2024, 11, 26))[0].name == "A"
+
+    def test_enqueue_deduplicates_and_keeps_attempts(self, queue):
+        """같은 종목을 다시 추가하면 갱신하되 시도 횟수는 유지"""
+        queue.enqueue([PendingEnrichment(name="A", listing_date="2024.11.26", attempts=2)])
+        queue.enqueue([PendingEnrichment(name="A", listing_date="2024.11.26", confirmed_price=1000)])
+
+        items = queue.due(date(2024, 11, 26))
+
+        assert len(items) == 1
+        assert items[0].confirmed_price == 1000
+        assert items[0].attempts == 2
+
+    def test_remove(self, queue):
+        item = PendingEnrichment(name="A", listing_date="2024.11.26")
+        queue.enqueue([item])
+
+        queue.remove([item])
+
+        assert len(queue) == 0
+
+    def test_enqueue_waits_for_file_lock(self, tmp_path):
+        """다른 실행이 큐 파일을 잠그고 있으면 기존 내용을 덮어쓰지 않음"""
+        queue = JsonPendingEnrichmentQueue(tmp_path / "pending.json", lock_timeout=0.2)
+
+        with FileLock(tmp_path / "pending.lock"):
+            with pytest.raises(FileLockTimeout):
+                queue.enqueue([PendingEnrichment(name="A", listing_date="2024.11.26")])
+
+        assert not queue.path.exists()
+
+    def test_corrupt_file_is_preserved(self, queue):
+        """파싱할 수 없는 파일은 .corrupt로 옮겨 다음 저장이 덮어쓰지 않음"""
+        queue.path.write_text("[{broken", encoding="utf-8")
+
+        queue.enqueue([PendingEnrichment(name="A", listing_date="2024.11.26")])
+
+        backup = queue.path.with_suffix(".json.corrupt")
+        assert backup.read_text(encoding="utf-8") == "[{broken"
+        assert len(queue) == 1
+
+    def test_invalid_record_is_skipped(self, queue):
+        """필드가 맞지 않는 항목은 건너뛰고 원본 사본을 남김"""
+        queue.path.write_text(
+            '[{"name": "A", "listing_date": "2024.11.26"}, {"name": "B", "unknown": 1}]',
+            encoding="utf-8"
+        )
+
+        due = queue.due(date(2024, 11, 26))
+
+        assert [item.name for item in due] == ["A"]
+        assert queue.path.with_suffix(".json.corrupt").exists()
@@ -0,0 +1,88 @@
+"""
+JsonlChangeFeed 및 저장소 변경 피드 단위 테스트
+"""
+import json
+import pandas as pd
+
+from infra.adapters.data.excel_exporter import ExcelExporter
+from infra.adapters.data.jsonl_change_feed import JsonlChangeFeed
+from infra.adapters.data.sqlite_dataset_store import SqliteDatasetStore
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["종목명", "상장일", "종가"])
+
+
+def read_feed(feed):
+    return [json.loads(line) for line in feed.path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJsonlChangeFeed:
+    """JsonlChangeFeed 클래스 테스트"""
+
+    def test_append_writes_one_line_per_change(self, tmp_path):
+        feed = JsonlChangeFeed(tmp_path, run_id="20240102_180000")
+
+        feed.append(2024, [{"op": "insert", "key": {"종목명": "A", "상장일": "2024-01-02"}, "after": {"종가": 1000}}])
+        feed.append(2024, [{"op": "insert", "key": {"종목명": "B", "상장일": None}, "after": {}}])
+
+        records = read_feed(feed)
+        assert feed.path.name == "changes_20240102_180000.jsonl"
+        assert [r["key"]["종목명"] for r in records] == ["A", "B"]
+        assert records[0]["run_id"] == "20240102_180000"
+        assert records[0]["year"] == 2024
+        assert feed.count == 2
+
+    def test_no_file_without_changes(self, tmp_path):
+        feed = JsonlChangeFeed(tmp_path / "changes")
+
+        feed.append(2024, [])
+
+        assert not feed.path.exists()
+        assert feed.count == 0
+
+
+class TestExcelExporterChangeFeed:
+    """ExcelExporter 변경 피드 연동 테스트"""
+
+    def test_records_inserts_and_updates_with_before_after(self, tmp_path):
+        ExcelExporter(tmp_path).export({2024: frame([["A", "2024.01.02", None]])})
+        feed = JsonlChangeFeed(tmp_path / "changes", run_id="run")
+
+        ExcelExporter(tmp_path, change_feed=feed).export({
+            2024: frame([["A", "2024.01.02", 1100], ["B", "2024.01.03", 500]])
+        })
+
+        records = {r["key"]["종목명"]: r for r in read_feed(feed)}
+        assert records["A"]["op"] == "update"
+        assert records["A"]["key"]["상장일"] == "2024-01-02"
+        assert records["A"]["changes"] == {"종가": {"before": None, "after": 1100}}
+        assert records["B"]["op"] == "insert"
+        assert records["B"]["after"]["종가"] == 500
+
+    def test_unchanged_rows_are_not_recorded(self, tmp_path):
+        data = frame([["A", "2024.01.02", 1000]])
+        ExcelExporter(tmp_path).export({2024: data.copy()})
+        feed = JsonlChangeFeed(tmp_path / "changes")
+
+        ExcelExporter(tmp_path, change_feed=feed).export({2024: data.copy()})
+
+        assert feed.count == 0
+
+
+class TestSqliteChangeFeed:
+    """SqliteDatasetStore 변경 피드 연동 테스트"""
+
+    def test_undated_row_confirmed_is_update(self, tmp_path):
+        feed = JsonlChangeFeed(tmp_path / "changes")
+        store = SqliteDatasetStore(tmp_path / "stock_data.db", change_feed=feed)
+
+        store.export({2024: frame([["A", None, None]])})
+        store.export({2024: frame([["A", "2024.01.02", 1100]])})
+
+        first, second = read_feed(feed)
+        assert first["op"] == "insert"
+        assert first["key"] == {"종목명": "A", "상장일": None}
+        assert second["op"] == "update"
+        assert second["key"] == {"종목명": "A", "상장일": "2024-01-02"}
+        assert second["changes"]["종가"] == {"before": None, "after": 1100}
@@ -0,0 +1,147 @@
+"""
+KrxAdapter 단위 테스트 (로컬 KRX 스텁 서버 사용)
+"""
+import json
+import threading
+import time
+import pytest
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from infra.adapters.data.krx_adapter import KrxAdapter
+
+
+LISTING = {"OutBlock_1": [
+    {"ISU_SRT_CD": "005930", "ISU_CD": "KR7005930003", "ISU_ABBRV": "삼성전자"},
+    {"ISU_SRT_CD": "000001", "ISU_CD": "KR7000001000", "ISU_ABBRV": "신규상장"},
+]}
+
+OHLCV = {"output": [
+    {"TRD_DD": "2024/01/03", "TDD_OPNPRC": "2,100", "TDD_HGPRC": "2,300",
+     "TDD_LWPRC": "2,000", "TDD_CLSPRC": "2,200", "ACC_TRDVOL": "1,000"},
+    {"TRD_DD": "2024/01/02", "TDD_OPNPRC": "1,500", "TDD_HGPRC": "2,600",
+     "TDD_LWPRC": "1,400", "TDD_CLSPRC": "2,000", "ACC_TRDVOL": "5,000"},
+    {"TRD_DD": "2024/01/01", "TDD_OPNPRC": "0", "TDD_HGPRC": "0",
+     "TDD_LWPRC": "0", "TDD_CLSPRC": "0", "ACC_TRDVOL": "0"},
+]}
+
+
+class KrxStubHandler(BaseHTTPRequestHandler):
+    """getJsonData.cmd 스텁 (요청 폼과 클라이언트 연결 기록)"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+        self.server.requests.append(form)
+        self.server.connections.add(self.client_address)
+
+        if form["bld"].endswith("MDCSTAT01901"):
+            body = LISTING
+        elif form["bld"].endswith("MDCSTAT01701") and form["isuCd"] == "KR7005930003":
+            body = OHLCV
+        else:
+            body = {"output": []}
+
+        data = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def krx_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KrxStubHandler)
+    server.requests = []
+    server.connections = set()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def adapter(krx_server):
+    host, port = krx_server.server_address
+    adapter = KrxAdapter(base_url=f"http://{host}:{port}")
+    yield adapter
+    adapter.close()
+
+
+class TestKrxAdapter:
+    """KrxAdapter 클래스 테스트"""
+
+    def test_get_ticker_loads_listing_once(self, adapter, krx_server):
+        assert adapter.get_ticker("삼성전자") == "005930"
+        assert adapter.get_ticker("(주)신규상장") == "000001"
+
+        listing_calls = [r for r in krx_server.requests if r["bld"].endswith("MDCSTAT01901")]
+        assert len(listing_calls) == 1
+
+    def test_get_ticker_unknown_reloads_only_when_expired(self, adapter, krx_server):
+        adapter.get_ticker("삼성전자")
+        assert adapter.get_ticker("없는종목") is None
+        assert len(krx_server.requests) == 1
+
+        adapter.listing_ttl = 0
+        assert adapter.get_ticker("없는종목") is None
+        assert len(krx_server.requests) == 2
+
+    def test_get_ohlc(self, adapter, krx_server):
+        result = adapter.get_ohlc("005930", date(2024, 1, 2))
+
+        # 스텁은 기간과 무관하게 전체를 돌려주므로 가장 이른 유효 거래일 기준
+        assert result == {"Open": 1500, "High": 2600, "Low": 1400, "Close": 2000}
+        form = krx_server.requests[-1]
+        assert form["isuCd"] == "KR7005930003"
+        assert form["strtDd"] == form["endDd"] == "20240102"
+
+    def test_get_ohlcv_range_sorted_and_skips_zero_rows(self, adapter):
+        df = adapter.get_ohlcv_range("005930", date(2024, 1, 1), date(2024, 1, 3))
+
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert list(df.index.strftime("%Y-%m-%d")) == ["2024-01-02", "2024-01-03"]
+        assert df["Close"].tolist() == [2000, 2200]
+
+    def test_unknown_ticker_returns_none(self, adapter):
+        assert adapter.get_ohlc("999999", date(2024, 1, 2)) is None
+        assert adapter.get_ohlcv_range("000001", date(2024, 1, 2), date(2024, 1, 3)) is None
+
+    def test_reuses_keep_alive_connection(self, adapter, krx_server):
+        """연속 조회 시 하나의 keep-alive 연결 재사용 (간이 벤치마크 포함)"""
+        started = time.perf_counter()
+        for _ in range(20):
+            adapter.get_ohlc("005930", date(2024, 1, 2))
+        elapsed = time.perf_counter() - started
+
+        assert len(krx_server.connections) == 1
+        assert elapsed < 5.0
+
+
+class TestKrxAdapterListingFailure:
+    """종목 목록 조회 실패 처리 테스트"""
+
+    def test_failure_is_cached_until_retry_after(self, adapter, monkeypatch):
+        calls = []
+
+        def failing_post(form):
+            calls.append(form["bld"])
+            raise ConnectionError("KRX 장애")
+
+        monkeypatch.setattr(adapter, "_post", failing_post)
+
+        for name in ["삼성전자", "신규상장", "없는종목"]:
+            assert adapter.get_ticker(name) is None
+        assert len(calls) == 1
+
+        adapter.listing_retry_after = 0
+        monkeypatch.undo()
+        assert adapter.get_ticker("삼성전자") == "005930"
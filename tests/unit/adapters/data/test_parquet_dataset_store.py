@@ -0,0 +1,77 @@
+"""
+ParquetDatasetStore 단위 테스트 (연도 파티션 / 병합 / 통합 문서 렌더링)
+"""
+import pytest
+import pandas as pd
+
+pytest.importorskip("pyarrow")
+
+from infra.adapters.data.excel_exporter import ExcelExporter
+from infra.adapters.data.parquet_dataset_store import ParquetDatasetStore
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["종목명", "상장일", "종가", "수익률(%)"])
+
+
+class TestParquetDatasetStore:
+    """ParquetDatasetStore 클래스 테스트"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return ParquetDatasetStore(tmp_path / "dataset")
+
+    def test_export_writes_year_partitions(self, store, tmp_path):
+        store.export({
+            2023: frame([["A", "2023.05.01", 1000, 10.0]]),
+            2024: frame([["B", "2024.01.02", 2000, -5.5]]),
+        })
+
+        assert (tmp_path / "dataset" / "year=2023" / "data.parquet").exists()
+        assert store.years() == [2023, 2024]
+        assert list(store.load([2024])) == [2024]
+
+    def test_columns_are_typed(self, store):
+        store.export({2024: frame([["A", "2024.01.02", 1000, 10.5], ["B", "2024.01.03", None, None]])})
+
+        loaded = ParquetDatasetStore(store.root).load()[2024]
+        assert str(loaded["종가"].dtype) in ("Int64", "int64[pyarrow]")
+        assert str(loaded["수익률(%)"].dtype) in ("Float64", "double[pyarrow]")
+        assert str(loaded["종목명"].dtype).startswith("string")
+
+    def test_merge_keeps_existing_values_for_empty_cells(self, store):
+        store.export({2024: frame([["A", "2024.01.02", None, None], ["B", "2024.01.03", 500, 1.0]])})
+
+        store.export({2024: pd.DataFrame({"종목명": ["A"], "상장일": ["2024-01-02"], "종가": [1100]})})
+
+        result = ParquetDatasetStore(store.root).load()[2024]
+        assert list(result["종목명"]) == ["A", "B"]
+        assert result["종가"].tolist() == [1100, 500]
+        assert result["수익률(%)"].iloc[1] == 1.0
+
+    def test_export_leaves_other_partitions_untouched(self, store):
+        store.export({2023: frame([["A", "2023.05.01", 1000, 10.0]])})
+        partition = store.root / "year=2023" / "data.parquet"
+        mtime = partition.stat().st_mtime_ns
+
+        store.export({2024: frame([["B", "2024.01.02", 2000, -5.5]])})
+
+        assert partition.stat().st_mtime_ns == mtime
+
+    def test_seeds_from_existing_workbook(self, tmp_path):
+        ExcelExporter(tmp_path).export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+
+        store = ParquetDatasetStore(tmp_path / "dataset", seed_workbook=tmp_path / "신규상장종목.xlsx")
+
+        assert store.load()[2024]["종목명"].tolist() == ["A"]
+
+    def test_render_workbook_from_dataset(self, store, tmp_path):
+        store.export({2024: frame([["B", "2024.12.01", 1, 1.0], ["A", "2024.01.15", 2, 2.0]])})
+
+        path = ExcelExporter(tmp_path).render(store.load())
+
+        result = pd.read_excel(path, sheet_name="2024년")
+        assert list(result["종목명"]) == ["A", "B"]
+        mtime = path.stat().st_mtime_ns
+        ExcelExporter(tmp_path).render(store.load())
+        assert path.stat().st_mtime_ns == mtime
@@ -0,0 +1,80 @@
+"""
+ShardedExcelStore 단위 테스트 (연도별 샤드 + 매니페스트)
+"""
+import json
+import pytest
+import pandas as pd
+
+from infra.adapters.data.excel_exporter import ExcelExporter
+from infra.adapters.data.sharded_excel_store import ShardedExcelStore
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["종목명", "상장일", "종가", "수익률(%)"])
+
+
+class TestShardedExcelStore:
+    """ShardedExcelStore 클래스 테스트"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return ShardedExcelStore(tmp_path / "shards", max_workers=1)
+
+    def test_export_writes_one_file_per_year_and_manifest(self, store):
+        store.export({
+            2023: frame([["A", "2023.05.01", 1000, 10.0]]),
+            2024: frame([["B", "2024.01.02", 2000, -5.5]]),
+        })
+
+        assert (store.root / "신규상장종목_2023.xlsx").exists()
+        assert (store.root / "신규상장종목_2024.xlsx").exists()
+        manifest = json.loads((store.root / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest["2024"]["file"] == "신규상장종목_2024.xlsx"
+        assert pd.read_excel(store.root / "신규상장종목_2024.xlsx", sheet_name=None).keys() == {"2024년"}
+
+    def test_update_touches_only_its_year_shard(self, store):
+        store.export({
+            2023: frame([["A", "2023.05.01", 1000, 10.0]]),
+            2024: frame([["B", "2024.01.02", 2000, -5.5]]),
+        })
+        old_shard = store.root / "신규상장종목_2023.xlsx"
+        mtime = old_shard.stat().st_mtime_ns
+
+        store.export({2024: pd.DataFrame({"종목명": ["B"], "상장일": ["2024-01-02"], "종가": [2100]})})
+
+        assert old_shard.stat().st_mtime_ns == mtime
+        loaded = store.load()
+        assert loaded[2024]["종가"].tolist() == [2100]
+        assert loaded[2024]["수익률(%)"].tolist() == [-5.5]
+        assert loaded[2023]["종목명"].tolist() == ["A"]
+
+    def test_parallel_read_write(self, tmp_path):
+        store = ShardedExcelStore(tmp_path / "shards", max_workers=2)
+        data = {year: frame([[f"S{year}", f"{year}.03.02", year, 1.0]]) for year in (2021, 2022, 2023)}
+
+        store.export(data)
+
+        loaded = ShardedExcelStore(tmp_path / "shards", max_workers=2).load()
+        assert list(loaded) == [2021, 2022, 2023]
+        assert loaded[2022]["종목명"].tolist() == ["S2022"]
+
+    def test_seeds_shards_from_combined_workbook(self, tmp_path):
+        ExcelExporter(tmp_path).export({
+            2023: frame([["A", "2023.05.01", 1000, 10.0]]),
+            2024: frame([["B", "2024.01.02", 2000, -5.5]]),
+        })
+
+        store = ShardedExcelStore(tmp_path / "shards", max_workers=1,
+                                  seed_workbook=tmp_path / "신규상장종목.xlsx")
+
+        assert store.years() == []
+        assert list(store.load()) == [2023, 2024]
+        assert store.years() == [2023, 2024]
+
+    def test_combined_workbook_rendered_on_demand(self, store, tmp_path):
+        store.export({2024: frame([["B", "2024.01.02", 2000, -5.5]])})
+        assert not (tmp_path / "신규상장종목.xlsx").exists()
+
+        path = ExcelExporter(tmp_path).render(store.load())
+
+        assert pd.read_excel(path, sheet_name="2024년")["종목명"].tolist() == ["B"]
@@ -0,0 +1,73 @@
+"""
+SqliteDatasetStore 단위 테스트 (고유 인덱스 upsert)
+"""
+import sqlite3
+import pytest
+import pandas as pd
+
+from infra.adapters.data.excel_exporter import ExcelExporter
+from infra.adapters.data.sqlite_dataset_store import SqliteDatasetStore
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["종목명", "상장일", "종가", "수익률(%)"])
+
+
+class TestSqliteDatasetStore:
+    """SqliteDatasetStore 클래스 테스트"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return SqliteDatasetStore(tmp_path / "stock_data.db")
+
+    def count_rows(self, store):
+        with sqlite3.connect(store.path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+    def test_upsert_keeps_existing_values_for_empty_cells(self, store):
+        store.export({2024: frame([["A", "2024.01.02", None, None], ["B", "2024.01.03", 500, 1.0]])})
+
+        store.export({2024: pd.DataFrame({"종목명": ["A"], "상장일": ["2024-01-02"], "종가": [1100]})})
+
+        result = store.load()[2024]
+        assert list(result["종목명"]) == ["A", "B"]
+        assert result["종가"].tolist() == [1100, 500]
+        assert result["수익률(%)"].iloc[1] == 1.0
+        assert self.count_rows(store) == 2
+
+    def test_same_name_different_listing_dates_are_separate_rows(self, store):
+        """같은 이름의 다른 연도 상장 종목은 덮어쓰지 않음"""
+        store.export({
+            2020: frame([["A스팩", "2020.03.02", 2000, 0.0]]),
+            2024: frame([["A스팩", "2024.03.04", 2100, 5.0]]),
+        })
+
+        loaded = store.load()
+        assert loaded[2020]["종가"].tolist() == [2000]
+        assert loaded[2024]["종가"].tolist() == [2100]
+
+    def test_undated_row_merges_into_confirmed_listing(self, store):
+        store.export({2024: frame([["A", "미정", None, None]])})
+
+        store.export({2024: frame([["A", "2024.05.02", 3000, 1.5]])})
+
+        result = store.load([2024])[2024]
+        assert result["종목명"].tolist() == ["A"]
+        assert result["상장일"].tolist() == ["2024.05.02"]
+        assert self.count_rows(store) == 1
+
+    def test_new_columns_are_added(self, store):
+        store.export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+
+        store.export({2024: pd.DataFrame({"종목명": ["A"], "상장일": ["2024.01.02"], "D+5 종가": [1200]})})
+
+        result = store.load()[2024]
+        assert result["D+5 종가"].tolist() == [1200]
+        assert result["종가"].tolist() == [1000]
+
+    def test_seeds_from_existing_workbook(self, tmp_path):
+        ExcelExporter(tmp_path).export({2024: frame([["A", "2024.01.02", 1000, 10.0]])})
+
+        store = SqliteDatasetStore(tmp_path / "stock_data.db", seed_workbook=tmp_path / "신규상장종목.xlsx")
+
+        assert store.load()[2024]["종목명"].tolist() == ["A"]
@@ -0,0 +1,73 @@
+"""
+WorkbookLoader 단위 테스트 (단일 핸들 파싱 / 명시적 dtype / 캐시)
+"""
+import pytest
+import pandas as pd
+
+from infra.adapters.data import workbook_loader as loader_module
+from infra.adapters.data.workbook_loader import WorkbookLoader
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "신규상장종목.xlsx"
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        pd.DataFrame({"종목명": ["123"], "상장일": ["2023.01.02"], "종가": [1000.0]}).to_excel(
+            writer, sheet_name="2023년", index=False)
+        pd.DataFrame({"종목명": ["A", "B"], "상장일": ["2024.01.02", None], "종가": [2000, None]}).to_excel(
+            writer, sheet_name="2024년", index=False)
+        pd.DataFrame({"메모": ["x"]}).to_excel(writer, sheet_name="요약", index=False)
+    return path
+
+
+class TestWorkbookLoader:
+    """WorkbookLoader 클래스 테스트"""
+
+    def test_load_years_skips_non_year_sheets(self, workbook):
+        loaded = WorkbookLoader(engine="openpyxl").load_years(workbook)
+
+        assert list(loaded) == [2023, 2024]
+        assert loaded[2024]["종목명"].tolist() == ["A", "B"]
+
+    def test_explicit_dtypes(self, workbook):
+        loaded = WorkbookLoader(engine="openpyxl", dtype_backend="numpy_nullable").load_years(workbook)
+
+        # 숫자처럼 보이는 종목명도 문자열 유지, 정수 컬럼은 Int64
+        assert loaded[2023]["종목명"].tolist() == ["123"]
+        assert str(loaded[2023]["종가"].dtype) == "Int64"
+        assert loaded[2024]["종가"].tolist()[0] == 2000
+        assert loaded[2024]["종가"].isna().tolist() == [False, True]
+
+    def test_parses_once_per_file_version(self, workbook, monkeypatch):
+        calls = []
+        original = loader_module.pd.read_excel
+
+        def counting_read_excel(*args, **kwargs):
+            calls.append(kwargs.get("sheet_name"))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(loader_module.pd, "read_excel", counting_read_excel)
+        loader = WorkbookLoader(engine="openpyxl")
+
+        loader.load_years(workbook)
+        loader.read_sheets(workbook, ["2024년"])
+        assert calls == [["2023년", "2024년"]]
+
+        pd.DataFrame({"종목명": ["C"]}).to_excel(workbook, sheet_name="2024년", index=False)
+        assert loader.read_sheets(workbook, ["2024년"])["2024년"]["종목명"].tolist() == ["C"]
+        assert len(calls) == 2
+
+    def test_returns_copies(self, workbook):
+        loader = WorkbookLoader(engine="openpyxl")
+        sheet = loader.read_sheets(workbook)["2024년"]
+        sheet.loc[0, "종목명"] = "Z"
+
+        assert loader.read_sheets(workbook)["2024년"]["종목명"].iloc[0] == "A"
+
+    def test_calamine_engine_matches_openpyxl(self, workbook):
+        pytest.importorskip("python_calamine")
+        fast = WorkbookLoader(engine="calamine").load_years(workbook)
+        slow = WorkbookLoader(engine="openpyxl").load_years(workbook)
+
+        for year in slow:
+            pd.testing.assert_frame_equal(fast[year], slow[year], check_dtype=False)
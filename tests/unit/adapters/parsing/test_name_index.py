@@ -0,0 +1,99 @@
+"""
+종목명 정규화 / 근사 검색 인덱스 단위 테스트
+"""
+import pytest
+
+from infra.adapters.parsing.text import StockNameIndex, normalize_stock_name
+from infra.adapters.parsing.text.name_index import is_preferred_share
+
+
+class TestNormalizeStockName:
+    """normalize_stock_name 테스트"""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("삼성전자", "삼성전자"),
+        ("㈜에이피알", "에이피알"),
+        ("에이피알 주식회사", "에이피알"),
+        ("(주) 에이피알", "에이피알"),
+        ("에스케이바이오팜", "SK바이오팜"),
+        ("ＬＧ에너지솔루션", "LG에너지솔루션"),
+        ("hd현대 마린솔루션", "HD현대마린솔루션"),
+        ("", ""),
+    ])
+    def test_normalize(self, raw, expected):
+        assert normalize_stock_name(raw) == expected
+
+
+class TestStockNameIndex:
+    """StockNameIndex 클래스 테스트"""
+
+    @pytest.fixture
+    def index(self):
+        return StockNameIndex([
+            ("SK바이오팜", "326030"),
+            ("LG에너지솔루션", "373220"),
+            ("에이피알", "278470"),
+            ("HD현대마린솔루션", "443060"),
+            ("삼성스팩8호", "000008"),
+        ])
+
+    @pytest.mark.parametrize("name, expected", [
+        ("SK바이오팜", "326030"),              # 원문 일치
+        ("에스케이바이오팜", "326030"),         # 한글 약칭
+        ("엘지 에너지솔루션", "373220"),        # 공백 + 한글 약칭
+        ("에이피알(주)", "278470"),            # 법인 접미사
+        ("HD현대마린솔루션㈜", "443060"),
+        ("현대마린솔루션", "443060"),           # 근사 일치 (bigram)
+    ])
+    def test_lookup(self, index, name, expected):
+        assert index.lookup(name) == expected
+
+    @pytest.mark.parametrize("name", ["삼성스팩9호", "에이피", "없는종목", "", None])
+    def test_lookup_rejects_distant_names(self, index, name):
+        """유사도가 낮은 이름(다른 회차 스팩, 짧은 접두어 등)은 매칭하지 않음"""
+        assert index.lookup(name) is None
+
+    def test_ambiguous_normalized_name_is_not_matched(self):
+        """정규화 후 서로 다른 종목과 겹치면 매칭하지 않음"""
+        index = StockNameIndex([("에이 비씨", "000001"), ("에이비 씨", "000002")])
+
+        assert index.lookup("에이비씨") is None
+        assert index.lookup("에이 비씨") == "000001"
+
+    def test_preferred_share_is_not_fuzzy_matched(self):
+        """보통주 이름으로 같은 회사 우선주를 근사 매칭하지 않음"""
+        index = StockNameIndex([("에코프로비엠우", "247545"), ("현대차2우B", "005387")])
+
+        assert index.lookup("에코프로비엠") is None
+        assert index.lookup("현대차") is None
+        assert index.lookup("에코프로비엠우") == "247545"
+
+    def test_suffix_only_difference_is_rejected(self):
+        """우선주 접미사만 다른 이름은 보통주 티커로도 매칭하지 않음"""
+        index = StockNameIndex([("에코프로비엠", "247540")])
+
+        assert index.lookup("에코프로비엠우") is None
+        assert index.lookup("에코프로비엠") == "247540"
+
+    def test_common_stock_ending_in_woo_is_fuzzy_matched(self):
+        """이름이 "우"로 끝나는 보통주는 우선주로 보지 않고 근사 매칭"""
+        index = StockNameIndex([("대한그린에너지동우", "123450")])
+
+        assert index.lookup("그린에너지동우") == "123450"
+
+
+class TestIsPreferredShare:
+    """is_preferred_share 함수 테스트"""
+
+    @pytest.mark.parametrize("name, ticker, expected", [
+        ("삼성전자우", "005935", True),      # 티커 규칙
+        ("동우", "012340", False),           # "우"로 끝나는 보통주
+        ("삼성전자우", "", True),            # 접미사를 뗀 이름이 상장 종목
+        ("현대차2우B", "", True),
+        ("대신증권2우전환", "", True),
+        ("동우", "", False),                 # "동"은 상장 종목이 아님
+        ("우", "", False),
+    ])
+    def test_is_preferred_share(self, name, ticker, expected):
+        listed = {"삼성전자", "현대차", "대신증권"}
+        assert is_preferred_share(name, ticker, listed) is expected
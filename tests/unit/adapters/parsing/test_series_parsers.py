@@ -0,0 +1,112 @@
+"""
+Series 텍스트 파서 단위 테스트 (스칼라 파서와 결과 동치성)
+"""
+import pandas as pd
+
+from infra.adapters.parsing.text import parsers
+from infra.adapters.parsing.text.series import (
+    clean_tradable_values_series,
+    parse_competition_rate_series,
+    parse_percent_series,
+    parse_share_count_series,
+    parse_to_int_series,
+)
+
+
+INT_INPUTS = [
+    "12345", "1,000,000", "10,000주", "5,000 주", "1,000,000원", "10,000(예정)", "5,000 (확정)",
+    "10,000~15,000", "5,000 ~ 8,000원", "100:200", "5:3~2", "100.5", "99.9", "-12.7", "+5", ".5", "1e3",
+    "N/A", "-", "", "   ", "주", "(예정)", "abc", "가나다", "inf", "nan", "1.2.3", " - ",
+]
+RATE_INPUTS = [
+    "1234.56:1", "100.2:1", "1,234:1", "500:1", "99.5:1", "100.5:1", "99.4:1", " 12 : 1",
+    "N/A", "미정", "-", "", "inf:1", "1,000.5",
+]
+PERCENT_INPUTS = ["30%", "12.5 %", "45.67", "1,234.5%", "N/A", "-", "", "S", "약 30%"]
+SHARE_INPUTS = [
+    "10,000주", "5,000 주", "285,000주 (20.00%)", "285,000주 20.00%", "285,000주 / 20%", "10,000",
+    "", "주", "N/A", "-", " 12 주식", "약 10주",
+]
+TRADABLE_INPUTS = [
+    ("10000", "50%"), ("-", ""), ("　", "S"), ("50%", "10000"), ("50%", "30%"), ("1,000", "-"), ("%", "N/A"),
+]
+
+
+def as_values(series):
+    return [None if pd.isna(value) else value for value in series]
+
+
+class TestParseToIntSeries:
+    """parse_to_int_series 함수 테스트"""
+
+    def test_matches_scalar(self):
+        values, _ = parse_to_int_series(pd.Series(INT_INPUTS))
+
+        assert as_values(values) == [parsers.parse_to_int(text) for text in INT_INPUTS]
+        assert str(values.dtype) == "Int64"
+
+    def test_failures_match_scalar_warnings(self, capsys):
+        _, failures = parse_to_int_series(pd.Series(INT_INPUTS))
+
+        expected = []
+        for text in INT_INPUTS:
+            parsers.parse_to_int(text)
+            expected.append("[경고]" in capsys.readouterr().out)
+        assert failures.tolist() == expected
+
+    def test_keeps_index_and_missing_values(self):
+        values, failures = parse_to_int_series(pd.Series(["1,000", None, float("nan")], index=[10, 20, 30]))
+
+        assert values.index.tolist() == [10, 20, 30]
+        assert as_values(values) == [1000, None, None]
+        assert not failures.any()
+
+
+class TestCompetitionRateSeries:
+    """경쟁률 Series 파서 테스트"""
+
+    def test_parse_matches_scalar(self):
+        rates, failures = parse_competition_rate_series(pd.Series(RATE_INPUTS))
+
+        assert as_values(rates) == [parsers.parse_competition_rate(text) for text in RATE_INPUTS]
+        assert failures.tolist() == [text == "미정" for text in RATE_INPUTS]
+
+
+class TestParsePercentSeries:
+    """parse_percent_series 함수 테스트"""
+
+    def test_matches_scalar(self):
+        percents, failures = parse_percent_series(pd.Series(PERCENT_INPUTS))
+
+        assert as_values(percents) == [parsers.parse_percent(text) for text in PERCENT_INPUTS]
+        assert failures.tolist() == [text in ("S", "약 30%") for text in PERCENT_INPUTS]
+
+
+class TestParseShareCountSeries:
+    """parse_share_count_series 함수 테스트"""
+
+    def test_matches_scalar(self, capsys):
+        counts, failures = parse_share_count_series(pd.Series(SHARE_INPUTS))
+
+        expected, warned = [], []
+        for text in SHARE_INPUTS:
+            expected.append(parsers.parse_share_count(text))
+            warned.append("[경고]" in capsys.readouterr().out)
+        assert as_values(counts) == expected
+        assert failures.tolist() == warned
+
+
+class TestCleanTradableValuesSeries:
+    """clean_tradable_values_series 함수 테스트"""
+
+    def test_matches_scalar(self, capsys):
+        count, percent, swapped = clean_tradable_values_series(
+            pd.Series([c for c, _ in TRADABLE_INPUTS]), pd.Series([p for _, p in TRADABLE_INPUTS])
+        )
+
+        expected, warned = [], []
+        for count_in, percent_in in TRADABLE_INPUTS:
+            expected.append(parsers.clean_tradable_values(count_in, percent_in))
+            warned.append("[경고]" in capsys.readouterr().out)
+        assert list(zip(count.tolist(), percent.tolist())) == expected
+        assert swapped.tolist() == warned
@@ -3,19 +3,21 @@ Text Parsers 단위 테스트
 
 테스트 대상:
 - parse_to_int: 문자열을 정수로 변환
+- parse_share_count: 주식 수 셀을 정수로 변환
 - clean_stock_name: 종목명 정제
 - is_spac_stock: 스팩 여부 확인
-- format_competition_rate: 경쟁률 포맷팅
-- extract_share_count: 주식 수 추출
+- parse_competition_rate: 경쟁률 숫자 변환
+- parse_percent: 지분율 숫자 변환
 - clean_tradable_values: 유통가능물량 정제
 """
 import pytest
 from infra.adapters.parsing.text.parsers import (
     parse_to_int,
+    parse_share_count,
     clean_stock_name,
     is_spac_stock,
-    format_competition_rate,
-    extract_share_count,
+    parse_competition_rate,
+    parse_percent,
     clean_tradable_values,
 )
 
@@ -113,60 +115,53 @@ class TestIsSpacStock:
         assert is_spac_stock(stock_name) is expected
 
 
-class TestFormatCompetitionRate:
-    """format_competition_rate 함수 테스트"""
+class TestParseShareCount:
+    """parse_share_count 함수 테스트"""
 
-    @pytest.mark.parametrize("rate_str, expected", [
-        ("1234.56:1", "1235:1"),   # 소수점 반올림
-        ("100.2:1", "100:1"),      # 소수점 버림
-        ("1,234:1", "1234:1"),     # 쉼표 제거
-        ("500:1", "500:1"),        # 정상 포맷
-        ("99.5:1", "100:1"),       # 반올림
-        ("99.4:1", "99:1"),        # 반올림
-        ("N/A", "N/A"),            # 변환 불가 (유지)
-        ("미정", "미정"),          # 변환 불가 (유지)
+    @pytest.mark.parametrize("text, expected", [
+        ("285,000주", 285_000),               # 단위 '주' 포함
+        ("285,000주 (20.00%)", 285_000),      # 괄호 안 지분율
+        ("285,000주 20.00%", 285_000),        # 괄호 없는 지분율
+        ("285,000주 / 20%", 285_000),         # 구분자 뒤 지분율
+        ("285,000", 285_000),                 # 단위 없음
+        ("", None),                           # 빈 셀
+        ("N/A", None),                        # 값 없음
+        ("-", None),                          # 하이픈
     ])
-    def test_format_competition_rate(self, rate_str, expected):
-        """
-        경쟁률 문자열을 표준 형식(xxx:1)으로 포맷팅하는지 테스트합니다.
+    def test_parse_share_count(self, text, expected):
+        """'주' 뒤의 지분율 표기와 무관하게 주식 수를 정수로 변환하는지 테스트합니다."""
+        assert parse_share_count(text) == expected
 
-        Arrange: 원본 경쟁률 문자열(rate_str)과 기대값(expected) 준비
-        Act: format_competition_rate 호출
-        Assert: 포맷팅된 결과가 기대값과 일치하는지 확인
-        """
-        assert format_competition_rate(rate_str) == expected
 
+class TestParseCompetitionRate:
+    """parse_competition_rate 함수 테스트"""
 
-class TestExtractShareCount:
-    """extract_share_count 함수 테스트"""
-
-    @pytest.mark.parametrize("raw_value, expected", [
-        ("10,000주", "10000"),     # 단위 '주' 포함
-        ("5,000 주", "5000"),      # 단위 ' 주' 포함
-        ("1,000,000주", "1000000"),# 쉼표 포함
-        ("10,000", "10000"),       # 단위 없음
-        ("", "0"),                 # 빈 문자열 (기본값)
-        ("주", "0"),               # 숫자 없음 (기본값)
+    @pytest.mark.parametrize("rate_str, expected", [
+        ("1234.56:1", 1234.56),    # 소수점 유지
+        ("1,234:1", 1234.0),       # 쉼표 제거
+        ("1235:1", 1235.0),        # 과거 포맷 결과
+        ("N/A", None),             # 변환 불가
+        ("미정", None),            # 변환 불가
+        ("", None),                # 빈 문자열
     ])
-    def test_extract_share_count(self, raw_value, expected):
-        """
-        문자열에서 주식 수(숫자)만 추출하는지 테스트합니다.
+    def test_parse_competition_rate(self, rate_str, expected):
+        """경쟁률 문자열을 숫자(xxx:1의 xxx)로 변환하는지 테스트합니다."""
+        assert parse_competition_rate(rate_str) == expected
 
-        Arrange: 원본 문자열(raw_value)과 기대값(expected) 준비
-        Act: extract_share_count 호출
-        Assert: 추출된 숫자가 기대값과 일치하는지 확인
-        """
-        assert extract_share_count(raw_value) == expected
 
-    def test_extract_share_count_custom_default(self):
-        """
-        빈 문자열 입력 시 커스텀 기본값을 반환하는지 테스트합니다.
+class TestParsePercent:
+    """parse_percent 함수 테스트"""
 
-        Arrange: 빈 문자열과 커스텀 기본값 준비
-        Act: extract_share_count 호출
-        Assert: 커스텀 기본값 반환 확인
-        """
-        assert extract_share_count("", default="N/A") == "N/A"
+    @pytest.mark.parametrize("text, expected", [
+        ("30%", 30.0),             # 정상 케이스
+        ("12.5 %", 12.5),          # 공백 포함
+        ("45.67", 45.67),          # % 없음
+        ("N/A", None),             # 변환 불가
+        ("", None),                # 빈 문자열
+    ])
+    def test_parse_percent(self, text, expected):
+        """지분율 문자열을 숫자로 변환하는지 테스트합니다."""
+        assert parse_percent(text) == expected
 
 
 class TestCleanTradableValues:
@@ -0,0 +1,97 @@
+"""
+FileLock / atomic_write 단위 테스트
+"""
+import os
+import stat
+import threading
+import time
+import pytest
+
+from infra.adapters.utils import file_lock
+from infra.adapters.utils.file_lock import FileLock, FileLockTimeout, atomic_write
+
+
+class TestFileLock:
+    """FileLock 클래스 테스트"""
+
+    def test_second_holder_times_out(self, tmp_path):
+        path = tmp_path / "data.xlsx.lock"
+        with FileLock(path, timeout=1):
+            with pytest.raises(FileLockTimeout):
+                FileLock(path, timeout=0.2, poll_interval=0.05).acquire()
+
+    def test_waiter_acquires_after_release(self, tmp_path):
+        path = tmp_path / "data.xlsx.lock"
+        holder = FileLock(path)
+        holder.acquire()
+        acquired = []
+
+        def wait_for_lock():
+            with FileLock(path, timeout=5, poll_interval=0.01):
+                acquired.append(time.monotonic())
+
+        thread = threading.Thread(target=wait_for_lock)
+        thread.start()
+        time.sleep(0.2)
+        assert not acquired
+        released_at = time.monotonic()
+        holder.release()
+        thread.join(timeout=5)
+
+        assert acquired and acquired[0] >= released_at
+
+    def test_reentrant(self, tmp_path):
+        lock = FileLock(tmp_path / "x.lock", timeout=0.2)
+        with lock:
+            with lock:
+                assert lock.locked
+            assert lock.locked
+        assert not lock.locked
+
+
+class TestAtomicWrite:
+    """atomic_write 테스트"""
+
+    def test_replaces_target(self, tmp_path):
+        target = tmp_path / "out.json"
+        target.write_text("old", encoding="utf-8")
+
+        with atomic_write(target) as tmp:
+            assert tmp.parent == tmp_path and tmp.suffix == ".json"
+            tmp.write_text("new", encoding="utf-8")
+
+        assert target.read_text(encoding="utf-8") == "new"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failure_keeps_original(self, tmp_path):
+        target = tmp_path / "out.json"
+        target.write_text("old", encoding="utf-8")
+
+        with pytest.raises(RuntimeError):
+            with atomic_write(target) as tmp:
+                tmp.write_text("partial", encoding="utf-8")
+                raise RuntimeError("중단")
+
+        assert target.read_text(encoding="utf-8") == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX 권한 비트")
+    def test_keeps_existing_file_mode(self, tmp_path):
+        target = tmp_path / "out.json"
+        target.write_text("old", encoding="utf-8")
+        os.chmod(target, 0o644)
+
+        with atomic_write(target) as tmp:
+            tmp.write_text("new", encoding="utf-8")
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX 권한 비트")
+    def test_new_file_follows_umask(self, tmp_path, monkeypatch):
+        """mkstemp의 0600이 아니라 일반 파일 생성과 같은 권한"""
+        monkeypatch.setattr(file_lock, "_UMASK", 0o022)
+
+        with atomic_write(tmp_path / "new.json") as tmp:
+            tmp.write_text("new", encoding="utf-8")
+
+        assert stat.S_IMODE((tmp_path / "new.json").stat().st_mode) == 0o644
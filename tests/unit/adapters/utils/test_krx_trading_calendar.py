@@ -0,0 +1,117 @@
+"""
+KrxTradingCalendar 단위 테스트
+거래일/장 마감 판단 로직 검증
+"""
+import pytest
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from infra.adapters.utils import krx_trading_calendar
+from infra.adapters.utils.krx_trading_calendar import KrxTradingCalendar, VARIABLE_HOLIDAYS
+
+
+class TestKrxTradingCalendar:
+    """KrxTradingCalendar 단위 테스트"""
+
+    @pytest.fixture
+    def calendar(self):
+        """KrxTradingCalendar 인스턴스"""
+        return KrxTradingCalendar()
+
+    @pytest.mark.parametrize("target, expected", [
+        (date(2024, 11, 26), True),    # 평일
+        (date(2024, 11, 30), False),   # 토요일
+        (date(2024, 12, 1), False),    # 일요일
+        (date(2024, 12, 25), False),   # 성탄절
+        (date(2024, 2, 12), False),    # 설날 대체공휴일
+        (date(2024, 12, 31), False),   # 연말 휴장일
+        (date(2023, 12, 29), False),   # 연말 휴장일 (12/31 일요일)
+        (date(2023, 12, 28), True),
+    ])
+    def test_is_trading_day(self, calendar, target, expected):
+        """주말/공휴일/연말 휴장일 판단"""
+        assert calendar.is_trading_day(target) is expected
+
+    def test_next_session_skips_holidays(self, calendar):
+        """휴장일은 다음 거래일로 보정"""
+        # Given: 2024-09-14(토) ~ 09-18 추석 연휴
+        # When / Then
+        assert calendar.next_session(date(2024, 9, 14)) == date(2024, 9, 19)
+        assert calendar.next_session(date(2024, 9, 19)) == date(2024, 9, 19)
+
+    def test_is_session_closed(self, calendar):
+        """장 마감 시각 전후 판단 (naive datetime은 KST로 간주)"""
+        target = date(2024, 11, 26)
+
+        assert calendar.is_session_closed(target, datetime(2024, 11, 26, 15, 29)) is False
+        assert calendar.is_session_closed(target, datetime(2024, 11, 26, 15, 30)) is True
+        assert calendar.is_session_closed(target, datetime(2024, 11, 27, 9, 0)) is True
+        assert calendar.is_session_closed(date(2024, 11, 30), datetime(2024, 12, 2)) is False
+
+    def test_is_session_closed_with_utc_now(self, calendar):
+        """UTC 시각도 KST로 변환하여 판단"""
+        utc = ZoneInfo("UTC")
+        # 06:30 UTC == 15:30 KST
+        assert calendar.is_session_closed(date(2024, 11, 26), datetime(2024, 11, 26, 6, 30, tzinfo=utc)) is True
+        assert calendar.is_session_closed(date(2024, 11, 26), datetime(2024, 11, 26, 6, 0, tzinfo=utc)) is False
+
+    def test_csat_day_closes_late(self, calendar):
+        """수능일은 장 마감 16:30"""
+        target = date(2024, 11, 14)
+
+        assert calendar.is_session_closed(target, datetime(2024, 11, 14, 16, 0)) is False
+        assert calendar.is_session_closed(target, datetime(2024, 11, 14, 16, 30)) is True
+
+    @pytest.mark.parametrize("now, expected", [
+        (datetime(2024, 11, 26, 10, 0), date(2024, 11, 25)),   # 장중 -> 전 거래일
+        (datetime(2024, 11, 26, 16, 0), date(2024, 11, 26)),   # 장 마감 후 -> 당일
+        (datetime(2024, 12, 1, 12, 0), date(2024, 11, 29)),    # 일요일 -> 금요일
+        (datetime(2024, 9, 19, 9, 0), date(2024, 9, 13)),      # 추석 연휴 직후 장중
+    ])
+    def test_last_closed_session(self, calendar, now, expected):
+        """마지막 마감 거래일 계산"""
+        assert calendar.last_closed_session(now) == expected
+
+
+class TestKrxTradingCalendarUncoveredYears:
+    """휴장일 표에 없는 연도 처리 테스트"""
+
+    LAST_COVERED = max(VARIABLE_HOLIDAYS)
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        KrxTradingCalendar._holidays.cache_clear()
+        yield
+        KrxTradingCalendar._holidays.cache_clear()
+
+    def test_covered_year_uses_table_without_warning(self, monkeypatch, capsys):
+        monkeypatch.setattr(krx_trading_calendar, "holidays_lib", None)
+
+        KrxTradingCalendar().is_trading_day(date(self.LAST_COVERED, 3, 3))
+
+        assert capsys.readouterr().out == ""
+
+    def test_uncovered_year_warns_without_holidays_package(self, monkeypatch, capsys):
+        monkeypatch.setattr(krx_trading_calendar, "holidays_lib", None)
+        calendar = KrxTradingCalendar()
+
+        assert calendar.is_trading_day(date(self.LAST_COVERED + 1, 1, 1)) is False   # 고정 휴장일은 유지
+        calendar.is_trading_day(date(self.LAST_COVERED + 1, 3, 3))
+
+        out = capsys.readouterr().out
+        assert out.count("[경고]") == 1   # 연도별 1회
+        assert str(self.LAST_COVERED + 1) in out
+
+    def test_uncovered_year_uses_holidays_package(self, monkeypatch, capsys):
+        lunar_new_year = date(self.LAST_COVERED + 1, 2, 8)
+
+        class FakeHolidays:
+            @staticmethod
+            def country_holidays(country, years):
+                assert (country, years) == ("KR", self.LAST_COVERED + 1)
+                return {lunar_new_year: "설날"}
+
+        monkeypatch.setattr(krx_trading_calendar, "holidays_lib", FakeHolidays)
+
+        assert KrxTradingCalendar().is_trading_day(lunar_new_year) is False
+        assert capsys.readouterr().out == ""   # 지원 경로에서는 출력 없음
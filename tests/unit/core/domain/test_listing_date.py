@@ -0,0 +1,60 @@
+"""
+상장일 파서 단위 테스트
+"""
+import pytest
+import pandas as pd
+from datetime import date, datetime
+
+from core.domain.listing_date import parse_listing_date, parse_listing_dates
+
+
+class TestParseListingDate:
+    """parse_listing_date 테스트"""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("2024.11.26", date(2024, 11, 26)),
+        ("2024-11-26", date(2024, 11, 26)),
+        ("2024/1/2", date(2024, 1, 2)),
+        (" 2024. 11. 26 ", date(2024, 11, 26)),
+        ("2024-11-26 00:00:00", date(2024, 11, 26)),
+        ("20241126", date(2024, 11, 26)),
+        (20241126, date(2024, 11, 26)),
+        (datetime(2024, 11, 26, 9, 0), date(2024, 11, 26)),
+        (pd.Timestamp("2024-11-26"), date(2024, 11, 26)),
+        (date(2024, 11, 26), date(2024, 11, 26)),
+    ])
+    def test_supported_formats(self, value, expected):
+        assert parse_listing_date(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "", "N/A", "미정", "2024.02.30", float("nan"), pd.NaT])
+    def test_invalid_values(self, value):
+        assert parse_listing_date(value) is None
+
+
+class TestParseListingDates:
+    """parse_listing_dates(Series) 테스트"""
+
+    def test_matches_scalar_parser(self):
+        """벡터 버전은 스칼라 파서와 같은 결과를 내고 인덱스를 유지"""
+        values = pd.Series(
+            ["2024.11.26", "N/A", None, "2024-11-26", "20240102", pd.Timestamp("2023-03-04")],
+            index=[10, 11, 12, 13, 14, 15],
+        )
+
+        result = parse_listing_dates(values)
+
+        assert list(result.index) == list(values.index)
+        for value, parsed in zip(values, result):
+            expected = parse_listing_date(value)
+            if expected is None:
+                assert pd.isna(parsed)
+            else:
+                assert parsed.date() == expected
+
+    def test_sort_key(self):
+        """형식이 섞인 상장일도 날짜순으로 정렬"""
+        df = pd.DataFrame({"상장일": ["2024.12.01", "2024-01-15", "2024.3.5"]})
+
+        result = df.sort_values("상장일", key=parse_listing_dates)
+
+        assert list(result["상장일"]) == ["2024-01-15", "2024.3.5", "2024.12.01"]
@@ -0,0 +1,66 @@
+"""
+데이터셋 컬럼 스키마 단위 테스트
+"""
+import pytest
+import pandas as pd
+
+from core.domain.models import StockInfo
+from core.domain.schema import (
+    COLUMNS, FIELD_TO_COLUMN, GROWTH_COLUMN, KEY_COLUMNS, columns_of, horizon_columns,
+    migrate_legacy_columns,
+)
+
+
+class TestSchema:
+    """스키마 정의 테스트"""
+
+    def test_fields_exist_on_stock_info(self):
+        fields = set(StockInfo.__dataclass_fields__)
+        assert set(FIELD_TO_COLUMN) <= fields
+
+    def test_names_are_unique_and_keys_defined(self):
+        names = [column.name for column in COLUMNS]
+        assert len(names) == len(set(names))
+        assert KEY_COLUMNS == ("종목명", "상장일")
+
+    def test_growth_column_matches_mapper_name(self):
+        assert FIELD_TO_COLUMN["growth_rate"] == GROWTH_COLUMN == "수익률(%)"
+
+    def test_columns_of_kind(self):
+        assert "시장구분" in columns_of("category")
+        assert "희망공모가액" in columns_of("text")
+        assert "종가" in columns_of("integer")
+        with pytest.raises(ValueError):
+            columns_of("date")
+
+    def test_horizon_columns(self):
+        columns = horizon_columns([5, 1, 5, 0])
+        assert [(c.name, c.kind) for c in columns] == [
+            ("D+1 종가", "integer"), ("D+1 수익률(%)", "float"),
+            ("D+5 종가", "integer"), ("D+5 수익률(%)", "float"),
+        ]
+        assert all(c.field is None for c in columns)
+
+    def test_columns_of_includes_requested_horizons(self):
+        assert "D+20 종가" not in columns_of("integer")
+        assert columns_of("integer", [20])[-1] == "D+20 종가"
+        assert columns_of("float", [20])[-1] == "D+20 수익률(%)"
+
+
+class TestMigrateLegacyColumns:
+    """migrate_legacy_columns 함수 테스트"""
+
+    def test_renames_legacy_column(self):
+        df = migrate_legacy_columns(pd.DataFrame({"종목명": ["A"], "수익률": [10.0]}))
+
+        assert list(df.columns) == ["종목명", "수익률(%)"]
+        assert df["수익률(%)"].tolist() == [10.0]
+
+    def test_merges_into_existing_column(self):
+        df = pd.DataFrame({"수익률(%)": [1.0, None, None], "수익률": [9.0, 2.0, None]})
+
+        migrate_legacy_columns(df)
+
+        assert list(df.columns) == ["수익률(%)"]
+        assert df["수익률(%)"].tolist()[:2] == [1.0, 2.0]
+        assert pd.isna(df["수익률(%)"].iloc[2])
@@ -0,0 +1,76 @@
+"""
+StockInfo / StockBatch 단위 테스트 (슬롯, 컬럼 배치)
+"""
+import pytest
+import numpy as np
+from dataclasses import replace
+
+from core.domain.models import StockBatch, StockInfo
+
+
+def make_stock(name="A", **overrides):
+    values = dict(
+        name=name, url="http://test.com", market_segment="코스닥", sector="IT",
+        revenue=1000, profit_pre_tax=None, net_profit=80, capital=500,
+        total_shares=10000, par_value=500, desired_price_range="10,000~12,000",
+        confirmed_price=11000, offering_amount=None, underwriter="테스트증권",
+        listing_date="2024.01.02", competition_rate=1000.5, emp_shares=100,
+        inst_shares=5000, retail_shares=2000, tradable_shares_count=3000,
+        tradable_shares_percent=30.0,
+    )
+    values.update(overrides)
+    return StockInfo(**values)
+
+
+class TestStockInfo:
+    """StockInfo 슬롯 테스트"""
+
+    def test_has_no_instance_dict(self):
+        stock = make_stock()
+
+        assert not hasattr(stock, "__dict__")
+        assert replace(stock, close_price=1).close_price == 1
+
+
+class TestStockBatch:
+    """StockBatch 클래스 테스트"""
+
+    def test_round_trips_stocks(self):
+        stocks = [make_stock("A"), make_stock("B", close_price=12000, growth_rate=9.1)]
+
+        batch = StockBatch(stocks)
+
+        assert len(batch) == 2
+        assert list(batch) == stocks
+        assert batch[-1] == stocks[1]
+        with pytest.raises(IndexError):
+            batch[2]
+
+    def test_numeric_fields_use_typed_arrays(self):
+        batch = StockBatch([make_stock("A"), make_stock("B", profit_pre_tax=7)])
+
+        values, missing = batch.column("profit_pre_tax")
+
+        assert values.dtype == np.int64
+        assert missing.tolist() == [True, False]
+        assert values[1] == 7
+        growth, growth_missing = batch.column("growth_rate")
+        assert growth.dtype == np.float64 and growth_missing.all()
+
+    def test_text_fields_are_object_columns(self):
+        batch = StockBatch([make_stock("A"), make_stock("B")])
+
+        values, missing = batch.column("name")
+
+        assert values.tolist() == ["A", "B"]
+        assert missing is None
+
+    def test_unexpected_value_type_switches_column_to_list(self):
+        """int 필드에 문자열/실수가 들어와도 값 보존"""
+        batch = StockBatch([make_stock("A", capital=None), make_stock("B", capital="N/A"), make_stock("C", capital=1.5)])
+
+        values, missing = batch.column("capital")
+
+        assert missing is None
+        assert values.tolist() == [None, "N/A", 1.5]
+        assert batch[1].capital == "N/A"
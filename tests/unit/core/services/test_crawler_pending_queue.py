@@ -0,0 +1,82 @@
+"""
+CrawlerService 보류 큐 처리 단위 테스트
+"""
+import pytest
+from datetime import date, datetime
+from unittest.mock import Mock
+
+from core.domain.models import PendingEnrichment
+from core.services.crawler_service import CrawlerService
+from core.services.stock_price_enricher import StockPriceEnricher
+from infra.adapters.data.json_pending_queue import JsonPendingEnrichmentQueue
+from infra.adapters.utils.krx_trading_calendar import KrxTradingCalendar
+
+
+class TestCrawlerServicePendingQueue:
+    """보류 큐 일괄 보강 테스트"""
+
+    NOW = datetime(2024, 11, 27, 16, 0)
+
+    @pytest.fixture
+    def market_data(self):
+        provider = Mock()
+        provider.get_ohlc.return_value = {"Open": 1500, "High": 1800, "Low": 1400, "Close": 1600}
+        return provider
+
+    @pytest.fixture
+    def ticker_mapper(self):
+        mapper = Mock()
+        mapper.get_ticker.side_effect = lambda name: {"A": "000001"}.get(name)
+        return mapper
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        return JsonPendingEnrichmentQueue(tmp_path / "pending.json")
+
+    @pytest.fixture
+    def service(self, ticker_mapper, market_data, queue):
+        calendar = KrxTradingCalendar()
+        enricher = StockPriceEnricher(ticker_mapper, market_data, Mock(), trading_calendar=calendar)
+        return CrawlerService(
+            page_provider=Mock(), calendar_scraper=Mock(), detail_scraper=Mock(),
+            data_mapper=Mock(), data_exporter=Mock(), date_calculator=Mock(),
+            stock_enricher=enricher, logger=Mock(), trading_calendar=calendar,
+            pending_queue=queue, max_pending_attempts=2
+        )
+
+    def test_drain_enriches_due_items_only(self, service, queue, market_data):
+        """장 마감된 항목만 일괄 조회하여 부분 행으로 저장"""
+        queue.enqueue([
+            PendingEnrichment(name="A", listing_date="2024.11.27", confirmed_price=1000),
+            PendingEnrichment(name="B", listing_date="2024.11.29", confirmed_price=1000),
+        ])
+
+        result = service.drain_pending_enrichment(now=self.NOW)
+
+        assert list(result[2024]["종목명"]) == ["A"]
+        assert result[2024]["종가"].iloc[0] == 1600
+        assert result[2024]["수익률(%)"].iloc[0] == 60.0
+        market_data.get_ohlc.assert_called_once_with("000001", date(2024, 11, 27))
+        service.page_provider.get_page.assert_not_called()
+        service.data_exporter.export.assert_called_once()
+        assert [item.name for item in queue.due(date(2024, 12, 31))] == ["B"]
+
+    def test_drain_retries_then_drops(self, service, queue):
+        """티커를 찾지 못한 항목은 재시도 후 한도 초과 시 제외"""
+        queue.enqueue([PendingEnrichment(name="UNKNOWN", listing_date="2024.11.27")])
+
+        assert service.drain_pending_enrichment(now=self.NOW) == {}
+        assert queue.due(date(2024, 11, 27))[0].attempts == 1
+
+        service.drain_pending_enrichment(now=self.NOW)
+        assert len(queue) == 0
+        service.data_exporter.export.assert_not_called()
+
+    def test_drain_uses_listing_year_for_year_end_holiday(self, service, queue, market_data):
+        """연말 휴장일 상장 종목은 다음 거래일 시세를 쓰되 상장일 연도 시트에 저장"""
+        queue.enqueue([PendingEnrichment(name="A", listing_date="2024.12.31", confirmed_price=1000)])
+
+        result = service.drain_pending_enrichment(now=datetime(2025, 1, 3, 16, 0))
+
+        assert list(result) == [2024]
+        market_data.get_ohlc.assert_called_once_with("000001", date(2025, 1, 2))
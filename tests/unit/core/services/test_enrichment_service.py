@@ -0,0 +1,164 @@
+import time
+import pytest
+import pandas as pd
+from datetime import date, datetime
+from unittest.mock import Mock
+from core.services.enrichment_service import EnrichmentService
+from core.services.stock_price_enricher import StockPriceEnricher
+
+
+class TestEnrichmentService:
+    @pytest.fixture
+    def mock_ticker_mapper(self):
+        mapper = Mock()
+        mapper.get_ticker.side_effect = lambda name: {"A": "000001", "B": "000002", "C": "000003"}.get(name)
+        return mapper
+
+    @pytest.fixture
+    def mock_market_data_provider(self):
+        return Mock()
+
+    @pytest.fixture
+    def mock_exporter(self):
+        return Mock()
+
+    @pytest.fixture
+    def enricher(self, mock_ticker_mapper, mock_market_data_provider):
+        return StockPriceEnricher(
+            ticker_mapper=mock_ticker_mapper,
+            market_data_provider=mock_market_data_provider,
+            logger=Mock()
+        )
+
+    @pytest.fixture
+    def sample_df(self):
+        return pd.DataFrame({
+            "종목명": ["A", "B", "C", "UNKNOWN"],
+            "상장일": ["2023.01.02", "2023.01.03", "2023.01.04", "2023.01.05"],
+            "확정공모가": [1000, "2,000", None, 4000],
+        })
+
+    def test_enrich_data_merges_ohlc_in_row_order(
+        self, enricher, mock_market_data_provider, mock_exporter, sample_df
+    ):
+        # Given: 앞쪽 종목일수록 응답이 늦게 도착
+        delays = {"000001": 0.03, "000002": 0.02, "000003": 0.0}
+        closes = {"000001": 1100, "000002": 3000, "000003": 3300}
+
+        def fake_ohlc(ticker, target_date):
+            time.sleep(delays[ticker])
+            close = closes[ticker]
+            return {"Open": close, "High": close, "Low": close, "Close": close}
+
+        mock_market_data_provider.get_ohlc.side_effect = fake_ohlc
+        service = EnrichmentService(enricher, mock_exporter, Mock(), max_workers=4)
+
+        # When
+        service.enrich_data({2023: sample_df})
+
+        # Then
+        exported = mock_exporter.export.call_args[0][0][2023]
+        assert list(exported["종가"][:3]) == [1100, 3000, 3300]
+        assert pd.isna(exported["종가"].iloc[3])
+        assert exported["수익률(%)"].iloc[0] == 10.0
+        assert exported["수익률(%)"].iloc[1] == 50.0
+        assert pd.isna(exported["수익률(%)"].iloc[2])  # 공모가 없음
+        mock_market_data_provider.get_ohlc.assert_any_call("000001", date(2023, 1, 2))
+
+    def test_enrich_data_queries_unique_pairs_once(
+        self, enricher, mock_ticker_mapper, mock_market_data_provider, mock_exporter
+    ):
+        # Given: 동일 종목이 여러 연도 시트에 중복
+        mock_market_data_provider.get_ohlc.return_value = {
+            "Open": 1000, "High": 1000, "Low": 1000, "Close": 1000
+        }
+        data = {
+            2022: pd.DataFrame({"종목명": ["A"], "상장일": ["2023.01.02"], "확정공모가": [500]}),
+            2023: pd.DataFrame({"종목명": ["A", "A"], "상장일": ["2023-01-02", "2023.01.02"], "확정공모가": [500, 500]}),
+        }
+        service = EnrichmentService(enricher, mock_exporter, Mock(), max_workers=2)
+
+        # When
+        service.enrich_data(data)
+
+        # Then
+        assert mock_ticker_mapper.get_ticker.call_count == 1
+        assert mock_market_data_provider.get_ohlc.call_count == 1
+        exported = mock_exporter.export.call_args[0][0]
+        assert list(exported[2023]["수익률(%)"]) == [100.0, 100.0]
+
+    def test_enrich_data_skips_missing_close(
+        self, enricher, mock_market_data_provider, mock_exporter, sample_df
+    ):
+        # Given
+        mock_market_data_provider.get_ohlc.return_value = None
+        service = EnrichmentService(enricher, mock_exporter, Mock(), max_workers=2)
+
+        # When
+        service.enrich_data({2023: sample_df})
+
+        # Then
+        exported = mock_exporter.export.call_args[0][0][2023]
+        assert exported["종가"].isna().all()
+
+    def test_enrich_data_incremental_only_touches_missing_rows(
+        self, enricher, mock_ticker_mapper, mock_market_data_provider, mock_exporter
+    ):
+        # Given: A는 이미 보강됨, B는 보강 필요, C는 아직 장 마감 전
+        mock_market_data_provider.get_ohlc.return_value = {
+            "Open": 2000, "High": 2000, "Low": 2000, "Close": 2000
+        }
+        df = pd.DataFrame({
+            "종목명": ["A", "B", "C"],
+            "상장일": ["2023.01.02", "2023.01.03", "2023.01.04"],
+            "확정공모가": [1000, 1000, 1000],
+            "종가": [1500, None, None],
+            "수익률": [50.0, None, None],
+        })
+        service = EnrichmentService(enricher, mock_exporter, Mock(), max_workers=2)
+
+        # When: 2023-01-04 (수) 장 마감 전
+        service.enrich_data({2023: df}, incremental=True, as_of=datetime(2023, 1, 4, 10, 0))
+
+        # Then
+        mock_ticker_mapper.get_ticker.assert_called_once_with("B")
+        exported = mock_exporter.export.call_args[0][0][2023]
+        assert list(exported["종가"][:2]) == [1500, 2000]
+        assert pd.isna(exported["종가"].iloc[2])
+        assert exported["수익률(%)"].iloc[0] == 50.0
+
+    def test_enrich_data_incremental_without_targets_skips_export(
+        self, enricher, mock_exporter
+    ):
+        # Given
+        df = pd.DataFrame({
+            "종목명": ["A"], "상장일": ["2023.01.02"], "확정공모가": [1000], "종가": [1500],
+        })
+        service = EnrichmentService(enricher, mock_exporter, Mock())
+
+        # When
+        service.enrich_data({2023: df}, incremental=True, as_of=datetime(2023, 1, 9, 16, 0))
+
+        # Then
+        mock_exporter.export.assert_not_called()
+
+    def test_enrich_data_does_not_duplicate_legacy_growth_column(
+        self, enricher, mock_market_data_provider, mock_exporter
+    ):
+        # Given: 과거 보강으로 "수익률" 컬럼이 있는 시트
+        mock_market_data_provider.get_ohlc.return_value = {
+            "Open": 2000, "High": 2000, "Low": 2000, "Close": 2000
+        }
+        df = pd.DataFrame({
+            "종목명": ["A"], "상장일": ["2023.01.02"], "확정공모가": [1000],
+            "수익률(%)": [None], "수익률": [50.0],
+        })
+        service = EnrichmentService(enricher, mock_exporter, Mock())
+
+        # When
+        service.enrich_data({2023: df})
+
+        # Then
+        exported = mock_exporter.export.call_args[0][0][2023]
+        assert "수익률" not in exported.columns
+        assert exported["수익률(%)"].iloc[0] == 100.0
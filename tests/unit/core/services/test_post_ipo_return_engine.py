@@ -0,0 +1,99 @@
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import date
+from unittest.mock import Mock
+from core.services.post_ipo_return_engine import PostIpoReturnEngine
+from core.services.enrichment_service import EnrichmentService
+from core.services.stock_price_enricher import StockPriceEnricher
+from infra.adapters.data.dataframe_mapper import DataFrameMapper
+
+
+def make_history(start: str, closes):
+    index = pd.bdate_range(start, periods=len(closes))
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame({
+        "Open": closes, "High": closes + 10, "Low": closes - 10, "Close": closes, "Volume": 1
+    }, index=index)
+
+
+class TestPostIpoReturnEngine:
+    @pytest.fixture
+    def mock_history_provider(self):
+        return Mock()
+
+    @pytest.fixture
+    def engine(self, mock_history_provider):
+        return PostIpoReturnEngine(mock_history_provider, Mock(), horizons=(1, 5, 20))
+
+    def test_fetch_history_frame_extracts_horizon_closes(self, engine, mock_history_provider):
+        # Given: D+0 = 1000, D+N = 1000 + N
+        mock_history_provider.get_ohlcv_range.return_value = make_history(
+            "2023-01-02", [1000 + i for i in range(10)]
+        )
+
+        # When
+        frame = engine.fetch_history_frame([("000001", date(2023, 1, 2))])
+
+        # Then
+        row = frame.iloc[0]
+        assert row["종가"] == 1000
+        assert row["close_d1"] == 1001
+        assert row["close_d5"] == 1005
+        assert np.isnan(row["close_d20"])  # 아직 도달하지 않은 기간
+        mock_history_provider.get_ohlcv_range.assert_called_once()
+
+    def test_fetch_history_frame_one_request_per_pair(self, engine, mock_history_provider):
+        # Given
+        mock_history_provider.get_ohlcv_range.return_value = make_history("2023-01-02", [1000] * 30)
+        pairs = [("000001", date(2023, 1, 2))] * 3 + [("000002", date(2023, 1, 2))]
+
+        # When
+        frame = engine.fetch_history_frame(pairs)
+
+        # Then
+        assert len(frame) == 2
+        assert mock_history_provider.get_ohlcv_range.call_count == 2
+
+    def test_compute_returns_vectorized(self, engine):
+        # Given
+        closes = pd.DataFrame({
+            "close_d1": [1100.0, 500.0], "close_d5": [1500.0, np.nan], "close_d20": [900.0, 600.0]
+        })
+        prices = pd.Series([1000, 0])
+
+        # When
+        returns = engine.compute_returns(closes, prices)
+
+        # Then
+        assert list(returns.iloc[0]) == [10.0, 50.0, -10.0]
+        assert returns.iloc[1].isna().all()  # 공모가 0 -> 계산 불가
+
+    def test_enrichment_service_adds_horizon_columns(self, engine, mock_history_provider):
+        # Given
+        mock_history_provider.get_ohlcv_range.return_value = make_history(
+            "2023-01-02", [1000 + i for i in range(30)]
+        )
+        ticker_mapper = Mock()
+        ticker_mapper.get_ticker.return_value = "000001"
+        market_data_provider = Mock()
+        enricher = StockPriceEnricher(ticker_mapper, market_data_provider, Mock())
+        exporter = Mock()
+        service = EnrichmentService(
+            enricher, exporter, Mock(), return_engine=engine, data_mapper=DataFrameMapper()
+        )
+        df = pd.DataFrame({"종목명": ["A"], "상장일": ["2023.01.02"], "확정공모가": [500]})
+
+        # When
+        service.enrich_data({2023: df})
+
+        # Then: 단일 기간 조회로 D+0 OHLC와 D+N 컬럼 모두 채움
+        exported = exporter.export.call_args[0][0][2023]
+        market_data_provider.get_ohlc.assert_not_called()
+        assert exported["종가"].iloc[0] == 1000
+        assert exported["수익률(%)"].iloc[0] == 100.0
+        assert exported["D+1 종가"].iloc[0] == 1001
+        assert exported["D+20 수익률(%)"].iloc[0] == 104.0
+        assert list(exported.columns[-6:]) == [
+            "D+1 종가", "D+1 수익률(%)", "D+5 종가", "D+5 수익률(%)", "D+20 종가", "D+20 수익률(%)"
+        ]